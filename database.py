@@ -588,6 +588,49 @@ class StaleDataError(Exception):
 class CalibrationRepository:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
+        # template_id -> tuple of field dicts; see list_template_fields
+        self._template_fields_cache: dict[int, tuple[dict, ...]] = {}
+        self._template_fields_cache_version = None
+        # query name -> rows of a small lookup table (instrument types, destinations, personnel); see _cached_rows
+        self._lookup_cache: dict[str, tuple[dict, ...] | frozenset] = {}
+        self._lookup_cache_version = None
+
+    def _data_version(self):
+        """
+        SQLite's PRAGMA data_version: changes whenever another connection commits
+        to the database file. Used to drop read caches when another user edits data.
+        """
+        try:
+            return self.conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return None
+
+    def _invalidate_template_fields_cache(self, template_id: int | None = None):
+        """Drop cached template fields (one template, or all when template_id is None)."""
+        if template_id is None:
+            self._template_fields_cache.clear()
+        else:
+            self._template_fields_cache.pop(template_id, None)
+
+    def _sync_lookup_cache(self):
+        """Drop _lookup_cache if another connection has changed the DB since it was filled."""
+        version = self._data_version()
+        if version is None or version != self._lookup_cache_version:
+            self._lookup_cache.clear()
+            self._lookup_cache_version = version
+
+    def _cached_rows(self, key: str, sql: str) -> list[dict]:
+        """
+        Rows of a lookup query, cached under key and invalidated on local writes
+        (_lookup_cache.pop) or when another connection changes the DB.
+        Returns fresh dict copies so callers may modify them freely.
+        """
+        self._sync_lookup_cache()
+        cached = self._lookup_cache.get(key)
+        if cached is None:
+            cached = tuple(dict(r) for r in self.conn.execute(sql).fetchall())
+            self._lookup_cache[key] = cached
+        return [dict(r) for r in cached]
     
     # ---------- Audit log ----------
 
@@ -837,10 +880,10 @@ class CalibrationRepository:
     # ---------------- Instrument types ----------------
 
     def list_instrument_types(self):
-        cur = self.conn.execute(
-            "SELECT id, name, description FROM instrument_types ORDER BY name ASC"
+        return self._cached_rows(
+            "instrument_types",
+            "SELECT id, name, description FROM instrument_types ORDER BY name ASC",
         )
-        return [dict(r) for r in cur.fetchall()]
 
     def add_instrument_type(self, name: str, description: str = "") -> int:
         cur = self.conn.execute(
@@ -848,6 +891,7 @@ class CalibrationRepository:
             (name, description),
         )
         self.conn.commit()
+        self._lookup_cache.pop("instrument_types", None)
         return cur.lastrowid
 
     def get_instrument_type(self, type_id: int):
@@ -866,14 +910,39 @@ class CalibrationRepository:
         )
         return cur.fetchone() is not None
 
+    # display_name is "Name (Role)", or just the name when there is no role
+    _PERSONNEL_COLUMNS = (
+        "id, name, role, qualifications, review_expiry, active, "
+        "name || CASE WHEN COALESCE(role, '') <> '' THEN ' (' || role || ')' ELSE '' END AS display_name"
+    )
+
     def list_personnel(self, active_only: bool = True):
         if not self._personnel_table_exists():
             return []
-        sql = "SELECT id, name, role, qualifications, review_expiry, active FROM personnel ORDER BY name ASC"
         if active_only:
-            sql = "SELECT id, name, role, qualifications, review_expiry, active FROM personnel WHERE active = 1 ORDER BY name ASC"
-        cur = self.conn.execute(sql)
-        return [dict(r) for r in cur.fetchall()]
+            return self._cached_rows(
+                "personnel_active",
+                f"SELECT {self._PERSONNEL_COLUMNS} FROM personnel WHERE active = 1 ORDER BY name ASC",
+            )
+        return self._cached_rows(
+            "personnel",
+            f"SELECT {self._PERSONNEL_COLUMNS} FROM personnel ORDER BY name ASC",
+        )
+
+    def get_active_personnel_ids(self) -> frozenset[int]:
+        """IDs of active personnel; cached alongside list_personnel (shared, immutable)."""
+        if not self._personnel_table_exists():
+            return frozenset()
+        self._sync_lookup_cache()
+        ids = self._lookup_cache.get("personnel_active_ids")
+        if ids is None:
+            cur = self.conn.execute("SELECT id FROM personnel WHERE active = 1")
+            ids = self._lookup_cache["personnel_active_ids"] = frozenset(r[0] for r in cur.fetchall())
+        return ids
+
+    def _invalidate_personnel_cache(self):
+        for key in ("personnel", "personnel_active", "personnel_active_ids"):
+            self._lookup_cache.pop(key, None)
 
     def get_personnel(self, person_id: int):
         if not self._personnel_table_exists():
@@ -892,6 +961,7 @@ class CalibrationRepository:
             (name.strip(), role.strip(), qualifications.strip(), review_expiry, 1 if active else 0),
         )
         self.conn.commit()
+        self._invalidate_personnel_cache()
         return cur.lastrowid
 
     def update_personnel(self, person_id: int, name: str, role: str = "", qualifications: str = "",
@@ -906,11 +976,13 @@ class CalibrationRepository:
             (name.strip(), role.strip(), qualifications.strip(), review_expiry, 1 if active else 0, person_id),
         )
         self.conn.commit()
+        self._invalidate_personnel_cache()
 
     def delete_personnel(self, person_id: int):
         self.conn.execute("DELETE FROM calibration_template_personnel WHERE person_id = ?", (person_id,))
         self.conn.execute("DELETE FROM personnel WHERE id = ?", (person_id,))
         self.conn.commit()
+        self._invalidate_personnel_cache()
 
     def list_personnel_authorized_for_template(self, template_id: int):
         """Personnel authorized to perform this template (for Performed by dropdown)."""
@@ -948,6 +1020,22 @@ class CalibrationRepository:
         )
         return [r[0] for r in cur.fetchall()]
 
+    def get_template_authorized_person_ids_bulk(self, template_ids) -> dict[int, list[int]]:
+        """Authorized person IDs for several templates in one query: {template_id: [person_id, ...]}."""
+        template_ids = list(template_ids)
+        out = {tid: [] for tid in template_ids}
+        if not template_ids or not self._personnel_table_exists():
+            return out
+        placeholders = ",".join("?" * len(template_ids))
+        cur = self.conn.execute(
+            "SELECT template_id, person_id FROM calibration_template_personnel "
+            f"WHERE template_id IN ({placeholders})",
+            template_ids,
+        )
+        for tid, pid in cur.fetchall():
+            out[tid].append(pid)
+        return out
+
     # ---------------- Calibration templates ----------------
 
     def list_templates_for_type(self, instrument_type_id: int, active_only: bool = True):
@@ -972,16 +1060,29 @@ class CalibrationRepository:
         return dict(row) if row else None
 
     def list_template_fields(self, template_id: int):
-        cur = self.conn.execute(
-            """
-            SELECT *
-            FROM calibration_template_fields
-            WHERE template_id = ?
-            ORDER BY sort_order ASC, id ASC
-            """,
-            (template_id,),
-        )
-        return [dict(r) for r in cur.fetchall()]
+        """
+        Fields for a template, ordered by sort_order. Results are cached per template_id
+        and invalidated on local field writes or when another connection changes the DB.
+        Returns fresh dict copies so callers may annotate them freely.
+        """
+        version = self._data_version()
+        if version is None or version != self._template_fields_cache_version:
+            self._template_fields_cache.clear()
+            self._template_fields_cache_version = version
+        cached = self._template_fields_cache.get(template_id)
+        if cached is None:
+            cur = self.conn.execute(
+                """
+                SELECT *
+                FROM calibration_template_fields
+                WHERE template_id = ?
+                ORDER BY sort_order ASC, id ASC
+                """,
+                (template_id,),
+            )
+            cached = tuple(dict(r) for r in cur.fetchall())
+            self._template_fields_cache[template_id] = cached
+        return [dict(f) for f in cached]
     
     def create_template(self, instrument_type_id: int, name: str,
                         version: int = 1, is_active: bool = True,
@@ -1067,6 +1168,7 @@ class CalibrationRepository:
             (template_id,),
         )
         self.conn.commit()
+        self._invalidate_template_fields_cache(template_id)
 
     def add_template_field(
         self,
@@ -1261,8 +1363,69 @@ class CalibrationRepository:
                 ),
             )
         self.conn.commit()
+        self._invalidate_template_fields_cache(template_id)
         return cur.lastrowid
 
+    # Columns copied by bulk_add_template_fields (template_id is supplied separately)
+    _TEMPLATE_FIELD_COPY_COLUMNS = (
+        "name", "label", "data_type", "unit", "required", "sort_order", "group_name",
+        "calc_type",
+        *(f"calc_ref{i}_name" for i in range(1, 13)),
+        "tolerance", "autofill_from_first_group", "default_value",
+        "tolerance_type", "tolerance_equation", "nominal_value", "tolerance_lookup_json",
+        "sig_figs", "stat_value_group", "appear_in_calibrations_table",
+        "plot_x_axis_name", "plot_y_axis_name", "plot_title",
+        "plot_x_min", "plot_x_max", "plot_y_min", "plot_y_max", "plot_best_fit",
+    )
+    _TEMPLATE_FIELD_FLAG_COLUMNS = frozenset((
+        "required", "autofill_from_first_group", "appear_in_calibrations_table", "plot_best_fit",
+    ))
+
+    def bulk_add_template_fields(self, template_id: int, fields: list[dict]) -> int:
+        """
+        Insert many template fields in one transaction (e.g. when cloning a template).
+        Each dict uses the same keys as add_template_field; missing keys are stored as NULL.
+        Only columns present in the current schema are written. Returns the number of rows inserted.
+        """
+        if not fields:
+            return 0
+        cur = self.conn.cursor()
+        try:
+            cur.execute("BEGIN")
+            cur.execute("PRAGMA table_info(calibration_template_fields)")
+            existing = {r[1] for r in cur.fetchall()}
+            cols = [c for c in self._TEMPLATE_FIELD_COPY_COLUMNS if c in existing]
+            flags = self._TEMPLATE_FIELD_FLAG_COLUMNS
+
+            def _row(f: dict) -> tuple:
+                out = [template_id]
+                for c in cols:
+                    val = f.get(c)
+                    if c in flags:
+                        val = 1 if val else 0
+                    elif c == "sig_figs":
+                        val = 3 if val is None else max(0, min(4, int(val)))
+                    elif c == "data_type" and not val:
+                        val = "number"
+                    elif c == "sort_order" and val is None:
+                        val = 0
+                    out.append(val)
+                return tuple(out)
+
+            rows = [_row(f) for f in fields]
+            cur.executemany(
+                f"INSERT INTO calibration_template_fields (template_id, {', '.join(cols)}) "
+                f"VALUES ({', '.join('?' * (len(cols) + 1))})",
+                rows,
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._invalidate_template_fields_cache(template_id)
+        return len(rows)
+
     def update_template_field(self, field_id: int, data: dict):
         """
         Update an existing template field. `data` should match get_data() from FieldEditDialog.
@@ -1349,6 +1512,7 @@ class CalibrationRepository:
             params,
         )
         self.conn.commit()
+        self._invalidate_template_fields_cache()
 
     def delete_template_field(self, field_id: int):
         # Remove calibration values that reference this field (FK is ON DELETE RESTRICT)
@@ -1361,6 +1525,7 @@ class CalibrationRepository:
             (field_id,),
         )
         self.conn.commit()
+        self._invalidate_template_fields_cache()
 
 
     # ---------------- Calibration records ----------------
@@ -1646,6 +1811,19 @@ class CalibrationRepository:
         )
         self.conn.commit()
 
+    def set_settings(self, values: dict[str, str]):
+        """Set several settings in one transaction (a single commit); nothing is written on error."""
+        try:
+            self.conn.executemany(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                list(values.items()),
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
     # ---------- Recipients ----------
 
     def list_recipients(self):
@@ -1674,17 +1852,21 @@ class CalibrationRepository:
     # ---------- Destinations ----------
 
     def list_destinations(self):
-        cur = self.conn.execute(
-            "SELECT id, name FROM destinations ORDER BY name"
+        return self._cached_rows(
+            "destinations",
+            "SELECT id, name FROM destinations ORDER BY name",
         )
-        return [dict(row) for row in cur.fetchall()]
 
     def list_destinations_full(self):
-        cur = self.conn.execute(
+        return self._cached_rows(
+            "destinations_full",
             "SELECT id, name, contact, email, phone, address "
-            "FROM destinations ORDER BY name"
+            "FROM destinations ORDER BY name",
         )
-        return [dict(row) for row in cur.fetchall()]
+
+    def _invalidate_destinations_cache(self):
+        self._lookup_cache.pop("destinations", None)
+        self._lookup_cache.pop("destinations_full", None)
 
     def get_destination_name(self, dest_id: int):
         if dest_id is None:
@@ -1703,6 +1885,7 @@ class CalibrationRepository:
             (name, contact, email, phone, address),
         )
         self.conn.commit()
+        self._invalidate_destinations_cache()
 
     def update_destination(self, dest_id: int, data: dict):
         data["id"] = dest_id
@@ -1719,10 +1902,12 @@ class CalibrationRepository:
             data,
         )
         self.conn.commit()
+        self._invalidate_destinations_cache()
 
     def delete_destination(self, dest_id: int):
         self.conn.execute("DELETE FROM destinations WHERE id = ?", (dest_id,))
         self.conn.commit()
+        self._invalidate_destinations_cache()
 
     # ---------- Instruments ----------
 
@@ -2033,23 +2218,41 @@ class CalibrationRepository:
         return [dict(r) for r in cur.fetchall()]
 
     def add_attachment(self, instrument_id: int, src_path: str, record_id: int | None = None):
-        src = Path(src_path)
-        if not src.exists():
-            raise FileNotFoundError(src_path)
+        self.add_attachments(instrument_id, [src_path], record_id=record_id)
+
+    def add_attachments(self, instrument_id: int, src_paths, record_id: int | None = None):
+        """
+        Copy each file into the attachments dir and insert all rows in one transaction.
+        If any copy or insert fails, nothing is inserted and the copies already made are removed.
+        """
+        srcs = [Path(p) for p in src_paths]
+        for src in srcs:
+            if not src.exists():
+                raise FileNotFoundError(str(src))
+        if not srcs:
+            return
 
         dest_dir = get_attachments_dir() / str(instrument_id)
         dest_dir.mkdir(parents=True, exist_ok=True)
-        unique_name = f"{src.stem}_{uuid.uuid4().hex[:8]}{src.suffix}"
-        dest_path = dest_dir / unique_name
-
-        shutil.copy2(str(src), str(dest_path))
-
-        self.conn.execute(
-            "INSERT INTO attachments (instrument_id, filename, file_path, record_id) "
-            "VALUES (?, ?, ?, ?)",
-            (instrument_id, src.name, str(dest_path), record_id),  # filename = display name
-        )
-        self.conn.commit()
+        copied = []
+        try:
+            for src in srcs:
+                unique_name = f"{src.stem}_{uuid.uuid4().hex[:8]}{src.suffix}"
+                dest_path = dest_dir / unique_name
+                shutil.copy2(str(src), str(dest_path))
+                copied.append(dest_path)
+            self.conn.executemany(
+                "INSERT INTO attachments (instrument_id, filename, file_path, record_id) "
+                "VALUES (?, ?, ?, ?)",
+                # filename = display name
+                [(instrument_id, src.name, str(dest), record_id) for src, dest in zip(srcs, copied, strict=True)],
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            for dest_path in copied:
+                dest_path.unlink(missing_ok=True)
+            raise
 
     def get_attachment(self, attachment_id: int):
         cur = self.conn.execute(
@@ -2059,6 +2262,40 @@ class CalibrationRepository:
         row = cur.fetchone()
         return dict(row) if row else None
 
+    def get_attachment_info(self, attachment_id: int):
+        """Attachment row without any legacy file_data blob (see copy_attachment_data)."""
+        cur = self.conn.execute(
+            "SELECT id, instrument_id, filename, file_path, uploaded_at, record_id "
+            "FROM attachments WHERE id = ?",
+            (attachment_id,),
+        )
+        row = cur.fetchone()
+        return dict(row) if row else None
+
+    def copy_attachment_data(self, attachment_id: int, dest_path, chunk_size: int = 1 << 20) -> bool:
+        """
+        Write an attachment's stored file_data (older databases kept file contents in the row)
+        to dest_path, chunk_size bytes at a time so a large file is never held in memory whole.
+        Returns False, without creating dest_path, when the row has no stored data.
+        """
+        cur = self.conn.execute("PRAGMA table_info(attachments)")
+        if "file_data" not in {r[1] for r in cur.fetchall()}:
+            return False
+        cur = self.conn.execute(
+            "SELECT rowid FROM attachments WHERE id = ? AND file_data IS NOT NULL", (attachment_id,)
+        )
+        row = cur.fetchone()
+        if not row:
+            return False
+        # Incremental blob I/O: each read continues where the last stopped
+        with self.conn.blobopen("attachments", "file_data", row[0], readonly=True) as blob:
+            if not len(blob):
+                return False
+            with Path(dest_path).open("wb") as f:
+                for chunk in iter(lambda: blob.read(chunk_size), b""):
+                    f.write(chunk)
+        return True
+
     def delete_attachment(self, attachment_id: int):
         """
         Delete a single attachment, removing both the DB row and the stored file.
@@ -23,6 +23,19 @@ def add_attachment(
     repo.add_attachment(instrument_id, src_path, record_id=record_id)
 
 
+def add_attachments(
+    repo: "CalibrationRepository",
+    instrument_id: int,
+    src_paths: list[str],
+    record_id: int | None = None,
+) -> None:
+    """Validate and add several attachments in one transaction. Raises FileNotFoundError if any path does not exist."""
+    for src_path in src_paths:
+        if not Path(src_path).exists():
+            raise FileNotFoundError(f"File not found: {src_path}")
+    repo.add_attachments(instrument_id, src_paths, record_id=record_id)
+
+
 def delete_attachment(repo: "CalibrationRepository", attachment_id: int) -> None:
     """Delete attachment by ID."""
     repo.delete_attachment(attachment_id)
@@ -12,3 +12,8 @@ if TYPE_CHECKING:
 def set_setting(repo: "CalibrationRepository", key: str, value: str) -> None:
     """Set a key-value setting. Delegates to repository."""
     repo.set_setting(key, value)
+
+
+def set_settings(repo: "CalibrationRepository", values: dict[str, str]) -> None:
+    """Set several key-value settings together (one transaction). Delegates to repository."""
+    repo.set_settings(values)
@@ -74,6 +74,16 @@ def add_template_field(repo: "CalibrationRepository", **kwargs: Any) -> int:
     return repo.add_template_field(**kwargs)
 
 
+def bulk_add_template_fields(
+    repo: "CalibrationRepository", template_id: int, fields: list[dict]
+) -> int:
+    """Add many template fields in a single transaction. Returns number of fields added."""
+    for f in fields:
+        if not (f.get("name") or "").strip():
+            raise ValueError("Field name is required")
+    return repo.bulk_add_template_fields(template_id, fields)
+
+
 def update_template_field(repo: "CalibrationRepository", field_id: int, data: dict) -> None:
     """Update template field. Delegates to repository."""
     repo.update_template_field(field_id, data)
@@ -0,0 +1,100 @@
+# test_calibration_form.py
+"""
+Tests for CalibrationFormDialog opening stored calibration records (runs offscreen).
+Run with: python -m pytest test_calibration_form.py -v
+Or: python test_calibration_form.py
+"""
+
+import dataclasses
+import os
+import sqlite3
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt5 import QtCore, QtWidgets
+except ImportError:
+    QtWidgets = None
+
+from database import CalibrationRepository, initialize_db
+
+
+def _make_repo() -> CalibrationRepository:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    initialize_db(conn)
+    return CalibrationRepository(conn)
+
+
+@unittest.skipIf(QtWidgets is None, "PyQt5 not installed")
+class TestOpenStoredRecord(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.repo = _make_repo()
+        self.template_id = self.repo.create_template(1, "Form")
+        self.instrument_id = self.repo.add_instrument({
+            "tag_number": "INST-1", "serial_number": None, "description": None, "location": "Lab",
+            "calibration_type": "SEND_OUT", "destination_id": None, "last_cal_date": "2025-01-01",
+            "next_due_date": "2030-01-01", "frequency_months": 12, "status": "ACTIVE", "notes": None,
+            "instrument_type_id": 1,
+        })
+
+    def _field(self, name, data_type, sort_order, group, label=None, **kw):
+        return self.repo.add_template_field(
+            self.template_id, name, label or name.upper(), data_type, None, False, sort_order, group, **kw
+        )
+
+    def _open(self, values, read_only=False):
+        from ui.dialogs.calibration_form_dialog import CalibrationFormDialog
+
+        record_id = self.repo.create_calibration_record(
+            self.instrument_id, self.template_id, "2025-01-01", "Tech", "PASS", "", values
+        )
+        instrument = dataclasses.asdict(self.repo.get_instrument(self.instrument_id))
+        dlg = CalibrationFormDialog(self.repo, instrument, record_id=record_id, read_only=read_only)
+        self.addCleanup(dlg.deleteLater)
+        dlg.show()
+        self._pump()
+        return dlg
+
+    @staticmethod
+    def _pump(ms=200):
+        # Let deferred display updates run
+        loop = QtCore.QEventLoop()
+        QtCore.QTimer.singleShot(ms, loop.quit)
+        loop.exec_()
+
+    def test_stat_field_shows_value_from_stored_inputs(self):
+        a = self._field("a", "number", 1, "G1")
+        b = self._field("b", "number", 2, "G1")
+        stat = self._field(
+            "s", "stat", 3, "G1", tolerance_equation="val1 + val2", calc_ref1_name="a", calc_ref2_name="b",
+        )
+        for read_only in (False, True):
+            dlg = self._open({a: "2", b: "4"}, read_only=read_only)
+            self.assertEqual(dlg.field_widgets[stat].text(), "6.000")
+
+    def test_convert_field_uses_inputs_on_unvisited_page(self):
+        cv = self._field("cv", "convert", 1, "G1", tolerance_equation="ref1 * 2", calc_ref1_name="r")
+        r = self._field("r", "number", 2, "G2")
+        for read_only in (False, True):
+            dlg = self._open({r: "3"}, read_only=read_only)
+            self.assertIsNone(dlg.field_widgets.get(r))  # second page not built yet
+            self.assertEqual(dlg.field_widgets[cv].text(), "6.000")
+
+    def test_autofill_skips_header_sharing_the_label(self):
+        self._field("reading_hdr", "field_header", 1, "G1", label="Reading")
+        r1 = self._field("reading_1", "number", 2, "G1", label="Reading")
+        r2 = self._field("reading_2", "number", 3, "G2", label="Reading", autofill_from_first_group=True)
+        dlg = self._open({r1: "42"})
+        dlg.on_next_group()
+        self._pump()
+        self.assertEqual(dlg.field_widgets[r2].text(), "42")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+# test_repository.py
+"""
+Unit tests for CalibrationRepository helpers that batch or cache database work.
+Run with: python -m pytest test_repository.py -v
+Or: python test_repository.py
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from database import CalibrationRepository, initialize_db
+
+
+def _make_repo() -> CalibrationRepository:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    initialize_db(conn)
+    return CalibrationRepository(conn)
+
+
+class TestBulkAddTemplateFields(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+        self.src_id = self.repo.create_template(1, "Source")
+        self.repo.add_template_field(
+            self.src_id, "a", "A", "number", "°F", True, 5, "G1",
+            calc_ref3_name="x", sig_figs=2, tolerance=0.5,
+        )
+        self.repo.add_template_field(
+            self.src_id, "b", "B", "bool", None, False, 7, None,
+            autofill_from_first_group=True,
+        )
+
+    def test_copies_all_columns(self):
+        src = self.repo.list_template_fields(self.src_id)
+        dst_id = self.repo.create_template(1, "Copy")
+        n = self.repo.bulk_add_template_fields(
+            dst_id, [dict(f, sort_order=i) for i, f in enumerate(src)]
+        )
+        self.assertEqual(n, 2)
+        dst = self.repo.list_template_fields(dst_id)
+        self.assertEqual(len(dst), 2)
+        for i, (a, b) in enumerate(zip(src, dst, strict=True)):
+            self.assertEqual(b["template_id"], dst_id)
+            self.assertEqual(b["sort_order"], i)
+            for key in a:
+                if key in ("id", "template_id", "sort_order"):
+                    continue
+                self.assertEqual(a[key], b[key], key)
+
+    def test_empty_list_is_noop(self):
+        dst_id = self.repo.create_template(1, "Empty")
+        self.assertEqual(self.repo.bulk_add_template_fields(dst_id, []), 0)
+        self.assertEqual(self.repo.list_template_fields(dst_id), [])
+
+    def test_failure_rolls_back(self):
+        dst_id = self.repo.create_template(1, "Bad")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repo.bulk_add_template_fields(
+                dst_id, [{"name": "ok", "label": "OK"}, {"name": "bad", "label": None}]
+            )
+        self.assertEqual(self.repo.list_template_fields(dst_id), [])
+
+
+class TestTemplateFieldsCache(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+        self.tpl_id = self.repo.create_template(1, "Cached")
+        self.field_id = self.repo.add_template_field(
+            self.tpl_id, "a", "A", "number", None, False, 0, None
+        )
+
+    def test_repeat_calls_hit_cache(self):
+        self.repo.list_template_fields(self.tpl_id)
+        self.assertIn(self.tpl_id, self.repo._template_fields_cache)
+
+    def test_returns_independent_copies(self):
+        first = self.repo.list_template_fields(self.tpl_id)
+        first[0]["label"] = "mutated"
+        self.assertEqual(self.repo.list_template_fields(self.tpl_id)[0]["label"], "A")
+
+    def test_writes_invalidate(self):
+        self.repo.list_template_fields(self.tpl_id)
+        self.repo.add_template_field(self.tpl_id, "b", "B", "number", None, False, 1, None)
+        self.assertEqual(len(self.repo.list_template_fields(self.tpl_id)), 2)
+        data = dict(self.repo.list_template_fields(self.tpl_id)[0], label="Renamed")
+        self.repo.update_template_field(self.field_id, data)
+        self.assertEqual(self.repo.list_template_fields(self.tpl_id)[0]["label"], "Renamed")
+        self.repo.delete_template_field(self.field_id)
+        self.assertEqual(len(self.repo.list_template_fields(self.tpl_id)), 1)
+
+
+class TestLookupCache(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+
+    def test_destination_writes_invalidate(self):
+        self.assertEqual(self.repo.list_destinations(), [])
+        self.repo.add_destination("Lab A")
+        dests = self.repo.list_destinations()
+        self.assertEqual([d["name"] for d in dests], ["Lab A"])
+        full = self.repo.list_destinations_full()
+        self.repo.update_destination(dests[0]["id"], dict(full[0], name="Lab B"))
+        self.assertEqual([d["name"] for d in self.repo.list_destinations()], ["Lab B"])
+        self.assertEqual([d["name"] for d in self.repo.list_destinations_full()], ["Lab B"])
+        self.repo.delete_destination(dests[0]["id"])
+        self.assertEqual(self.repo.list_destinations(), [])
+
+    def test_instrument_types_cached_and_invalidated(self):
+        before = self.repo.list_instrument_types()
+        self.assertIn("instrument_types", self.repo._lookup_cache)
+        before[0]["name"] = "mutated"
+        self.assertNotEqual(self.repo.list_instrument_types()[0]["name"], "mutated")
+        self.repo.add_instrument_type("Zz New Type")
+        self.assertEqual(len(self.repo.list_instrument_types()), len(before) + 1)
+
+    def test_personnel_writes_invalidate(self):
+        self.assertEqual(self.repo.list_personnel(active_only=False), [])
+        pid = self.repo.add_personnel("Ann", "Tech")
+        self.assertEqual([p["name"] for p in self.repo.list_personnel()], ["Ann"])
+        self.assertEqual(self.repo.get_active_personnel_ids(), {pid})
+        self.repo.update_personnel(pid, "Ann", "Tech", active=False)
+        self.assertEqual(self.repo.list_personnel(), [])
+        self.assertEqual(self.repo.get_active_personnel_ids(), frozenset())
+        self.assertEqual([p["active"] for p in self.repo.list_personnel(active_only=False)], [0])
+        self.repo.delete_personnel(pid)
+        self.assertEqual(self.repo.list_personnel(active_only=False), [])
+
+
+class TestCopyAttachmentData(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+        self.repo.conn.execute(
+            "INSERT INTO instruments (tag_number, next_due_date) VALUES ('T1', '2030-01-01')"
+        )
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def _insert(self, data=None) -> int:
+        cur = self.repo.conn.execute(
+            "INSERT INTO attachments (instrument_id, filename, file_path) VALUES (1, 'a.bin', '')"
+        )
+        if data is not None:
+            self.repo.conn.execute(
+                "UPDATE attachments SET file_data = ? WHERE id = ?", (data, cur.lastrowid)
+            )
+        return cur.lastrowid
+
+    def test_no_file_data_column(self):
+        att_id = self._insert()
+        self.assertFalse(self.repo.copy_attachment_data(att_id, self.tmp / "out"))
+        self.assertFalse((self.tmp / "out").exists())
+
+    def test_streams_in_chunks(self):
+        self.repo.conn.execute("ALTER TABLE attachments ADD COLUMN file_data BLOB")
+        data = bytes(range(256)) * 41
+        att_id = self._insert(data)
+        empty_id = self._insert(b"")
+        self.assertTrue(self.repo.copy_attachment_data(att_id, self.tmp / "out", chunk_size=1000))
+        self.assertEqual((self.tmp / "out").read_bytes(), data)
+        self.assertFalse(self.repo.copy_attachment_data(empty_id, self.tmp / "empty"))
+        self.assertNotIn("file_data", self.repo.get_attachment_info(att_id))
+
+
+class TestAddAttachments(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+        self.repo.conn.execute(
+            "INSERT INTO instruments (tag_number, next_due_date) VALUES ('T1', '2030-01-01')"
+        )
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = self.tmp / "store"
+        patcher = mock.patch("database.get_attachments_dir", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.src = []
+        for name in ("a.txt", "b.txt"):
+            path = self.tmp / name
+            path.write_text(name)
+            self.src.append(str(path))
+
+    def test_adds_all_files(self):
+        self.repo.add_attachments(1, self.src)
+        rows = self.repo.list_attachments(1)
+        self.assertEqual(sorted(r["filename"] for r in rows), ["a.txt", "b.txt"])
+        for r in rows:
+            self.assertEqual(Path(r["file_path"]).read_text(), r["filename"])
+
+    def test_missing_file_adds_nothing(self):
+        with self.assertRaises(FileNotFoundError):
+            self.repo.add_attachments(1, self.src + [str(self.tmp / "missing.txt")])
+        self.assertEqual(self.repo.list_attachments(1), [])
+        self.assertFalse(self.store.exists())
+
+
+class TestTemplateAuthorizedPersonIdsBulk(unittest.TestCase):
+    def test_groups_by_template(self):
+        repo = _make_repo()
+        t1 = repo.create_template(1, "T1")
+        t2 = repo.create_template(1, "T2")
+        t3 = repo.create_template(1, "T3")
+        a = repo.add_personnel("Ann")
+        b = repo.add_personnel("Bob")
+        repo.set_template_authorized_personnel(t1, [a, b])
+        repo.set_template_authorized_personnel(t2, [b])
+        got = repo.get_template_authorized_person_ids_bulk([t1, t2, t3])
+        self.assertEqual({tid: sorted(ids) for tid, ids in got.items()}, {t1: sorted([a, b]), t2: [b], t3: []})
+        self.assertEqual(got[t2], repo.get_template_authorized_person_ids(t2))
+        self.assertEqual(repo.get_template_authorized_person_ids_bulk([]), {})
+
+
+class TestSetSettings(unittest.TestCase):
+    def setUp(self):
+        self.repo = _make_repo()
+
+    def test_inserts_and_updates(self):
+        self.repo.set_setting("reminder_days", "14")
+        self.repo.set_settings({"reminder_days": "30", "operator_name": "Tess"})
+        self.assertEqual(self.repo.get_setting("reminder_days"), "30")
+        self.assertEqual(self.repo.get_setting("operator_name"), "Tess")
+
+    def test_failure_writes_nothing(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repo.set_settings({"quiet_start": "08:00", "quiet_end": None})
+        self.assertIsNone(self.repo.get_setting("quiet_start"))
+
+
+class TestTemplateFieldsCacheAcrossConnections(unittest.TestCase):
+    """Another user's commit (different connection) must not be hidden by the cache."""
+
+    def setUp(self):
+        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        tmp.close()
+        self.path = Path(tmp.name)
+        conns = []
+        for _ in range(2):
+            c = sqlite3.connect(str(self.path))
+            c.row_factory = sqlite3.Row
+            conns.append(c)
+        initialize_db(conns[0])
+        self.conns = conns
+        self.mine = CalibrationRepository(conns[0])
+        self.other = CalibrationRepository(conns[1])
+
+    def tearDown(self):
+        for c in self.conns:
+            c.close()
+        self.path.unlink(missing_ok=True)
+
+    def test_external_write_is_seen(self):
+        tpl_id = self.mine.create_template(1, "Shared")
+        self.assertEqual(self.mine.list_template_fields(tpl_id), [])
+        self.other.add_template_field(tpl_id, "a", "A", "number", None, False, 0, None)
+        self.assertEqual(len(self.mine.list_template_fields(tpl_id)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
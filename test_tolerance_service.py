@@ -5,6 +5,7 @@ Run with: python -m pytest test_tolerance_service.py -v
 Or: python test_tolerance_service.py
 """
 
+import re
 import sys
 import unittest
 
@@ -20,10 +21,17 @@ from tolerance_service import (
     list_variables,
     evaluate_tolerance_equation,
     evaluate_pass_fail,
+    equation_pass_fail,
     evaluate_tolerance_lookup,
+    parse_tolerance_lookup,
     validate_equation_variables,
     equation_has_pass_fail_condition,
+    equation_tolerance_display,
+    compile_tolerance_equation,
+    compile_equation,
     ALLOWED_VARIABLES,
+    _compile_node,
+    _eval_node,
 )
 
 
@@ -80,6 +88,11 @@ class TestListVariables(unittest.TestCase):
     def test_invalid_returns_empty(self):
         self.assertEqual(list_variables("1 +"), [])
 
+    def test_result_is_a_fresh_list(self):
+        names = list_variables("val1 + val2")
+        names.append("mutated")
+        self.assertEqual(list_variables(" val1 + val2 "), ["val1", "val2"])
+
 
 class TestEvaluateToleranceEquation(unittest.TestCase):
     def test_constant(self):
@@ -210,6 +223,16 @@ class TestEvaluateToleranceLookup(unittest.TestCase):
         j = '[{"range_low": 100, "range_high": 200, "tolerance": 1.0}]'
         self.assertEqual(evaluate_tolerance_lookup(j, 50), 0.0)
 
+    def test_parse_skips_bad_rows_and_caches(self):
+        j = '[{"range_low": 0, "range_high": 10, "tolerance": -0.2}, "x", {"range_low": "a"}, {"tolerance": 1}]'
+        rows = parse_tolerance_lookup(j)
+        self.assertEqual(rows, ((0.0, 10.0, -0.2), (float("-inf"), float("inf"), 1.0)))
+        self.assertIs(parse_tolerance_lookup(j), rows)
+        self.assertEqual(parse_tolerance_lookup("not json"), ())
+        self.assertEqual(parse_tolerance_lookup('{"range_low": 0}'), ())
+        self.assertAlmostEqual(evaluate_tolerance_lookup(j, 5), 0.2)
+        self.assertAlmostEqual(evaluate_tolerance_lookup(j, 50), 1.0)
+
 
 class TestEvaluatePassFail(unittest.TestCase):
     def test_fixed_pass(self):
@@ -255,6 +278,18 @@ class TestEvaluatePassFail(unittest.TestCase):
         self.assertFalse(pass2, "condition false (outside 1%) should fail")
         self.assertAlmostEqual(tol2, 0.0)
 
+    def test_equation_pass_fail_matches_evaluate_pass_fail(self):
+        for eq, nominal, reading in (
+            ("0.02 * abs(nominal)", 100.0, 101.0), ("0.02 * abs(nominal)", 100.0, 103.0),
+            ("reading <= nominal + 1", 10.0, 10.5), ("reading <= nominal + 1", 10.0, 12.0),
+        ):
+            v = {"nominal": nominal, "reading": reading}
+            tol = compile_equation(eq).evaluate(v)
+            self.assertEqual(
+                equation_pass_fail(tol, nominal, reading),
+                evaluate_pass_fail("equation", None, eq, nominal, reading, v),
+            )
+
     def test_lookup(self):
         j = '[{"range_low": 0, "range_high": 100, "tolerance": 1.0}]'
         pass_, tol, _ = evaluate_pass_fail(
@@ -314,6 +349,71 @@ class TestEquationPassFailCondition(unittest.TestCase):
         self.assertFalse(equation_has_pass_fail_condition("nominal + 1"))
 
 
+class TestCompileToleranceEquation(unittest.TestCase):
+    def test_matches_equation_tolerance_display(self):
+        eq = "reading <= 0.02 * nominal"
+        fn = compile_tolerance_equation(eq)
+        for vars_map in ({"reading": 1.0, "nominal": 100.0}, {"reading": 3.0, "nominal": 100.0}):
+            self.assertEqual(fn(vars_map), equation_tolerance_display(eq, vars_map))
+        self.assertEqual(fn({"reading": 1.0, "nominal": 100.0}), (1.0, "<=", 2.0, True))
+
+    def test_val_aliases(self):
+        fn = compile_tolerance_equation("ABS(val1 - ref2) <= 5")
+        self.assertEqual(fn({"ref1": 102.0, "val2": 100.0}), (2.0, "<=", 5.0, True))
+
+    def test_missing_variable_returns_none(self):
+        self.assertIsNone(compile_tolerance_equation("reading < nominal")({"reading": 1.0}))
+
+    def test_non_comparison_and_invalid(self):
+        self.assertIsNone(compile_tolerance_equation("0.02 * nominal")({"nominal": 1.0}))
+        self.assertIsNone(compile_tolerance_equation("val1 + ")({"val1": 1.0}))
+        self.assertIsNone(compile_tolerance_equation("")({}))
+
+    def test_cached_per_equation(self):
+        self.assertIs(compile_tolerance_equation("ref1 > 0"), compile_tolerance_equation("ref1 > 0"))
+
+
+class TestCompileEquation(unittest.TestCase):
+    def test_matches_uncompiled_functions(self):
+        eq = "ABS(reading - nominal) <= 0.02 * nominal"
+        c = compile_equation(eq)
+        vars_map = {"reading": 101.0, "nominal": 100.0}
+        self.assertEqual(c.evaluate(vars_map), evaluate_tolerance_equation(eq, vars_map))
+        self.assertEqual(c.display(vars_map), equation_tolerance_display(eq, vars_map))
+        self.assertEqual(list(c.variables), list_variables(eq))
+
+    def test_val_aliases(self):
+        self.assertAlmostEqual(compile_equation("val1 + ref2").evaluate({"ref1": 1.0, "val2": 2.0}), 3.0)
+
+    def test_invalid_raises_on_evaluate(self):
+        with self.assertRaises(SyntaxError):
+            compile_equation("val1 + ").evaluate({"val1": 1.0})
+        with self.assertRaises(ValueError):
+            compile_equation("").evaluate({})
+        with self.assertRaises(ValueError):
+            compile_equation("reading + 1").evaluate({})
+
+    def test_cached_per_equation(self):
+        self.assertIs(compile_equation("ref1 * 2"), compile_equation("ref1 * 2"))
+
+    def test_compiled_nodes_match_interpreter(self):
+        vars_map = {"reading": 10.0, "nominal": 8.0, "ref1": 2.0, "ref2": 0.0, "val1": 2.0}
+        for eq in (
+            "reading - nominal", "2 ^ 3 + 7 // 2 - 7 % 3", "-ref1 + +reading", "1 < ref1 <= 2 < reading",
+            "reading < nominal < 100", "ROUND(reading / 3)", "AVERAGE(ref1, reading, 3)",
+            "MIN(ref1, 5) + MAX(ref1, 5) + ABS(-4)", "STDEV([ref1, reading, nominal])",
+            "reading / ref2", "missing + 1", "ref1 & 1", "ref1 is 1", "FOO(ref1)", "reading and ref1",
+        ):
+            body = parse_equation(eq)
+            try:
+                expected = _eval_node(body, vars_map)
+            except (ValueError, TypeError) as e:
+                with self.assertRaisesRegex(type(e), re.escape(str(e))):
+                    _compile_node(body)(vars_map)
+            else:
+                self.assertEqual(_compile_node(body)(vars_map), expected, eq)
+
+
 def run_unittest():
     loader = unittest.TestLoader()
     suite = loader.loadTestsFromModule(sys.modules[__name__])
@@ -19,9 +19,10 @@ Equations use Excel-like syntax: + - * / ^ (power), < > <= >=, and functions:
 from __future__ import annotations
 
 import ast
+import functools
 import operator
 import re
-from typing import Any
+from typing import Any, Callable
 
 
 def _excel_to_python(equation: str) -> str:
@@ -272,10 +273,71 @@ def _eval_node(node: ast.AST, vars_map: dict[str, float]) -> float:
     raise ValueError(f"Unsupported expression: {type(node).__name__}")
 
 
+def _compile_node(node: ast.AST) -> Callable[[dict[str, float]], float]:
+    """
+    Turn an AST node into fn(vars_map) returning the same value as _eval_node(node, vars_map).
+    The common arithmetic/comparison/function nodes become nested closures, so repeated evaluation
+    skips the isinstance dispatch; anything unusual (disallowed constructs, list functions) is
+    delegated to _eval_node so errors are raised exactly as before, at evaluation time.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = float(node.value)
+        return lambda vars_map: value
+    if isinstance(node, ast.Name):
+        name = node.id
+
+        def variable(vars_map: dict[str, float]) -> float:
+            v = vars_map.get(name)
+            if v is None:
+                raise ValueError(f"Variable '{name}' not provided")
+            return float(v)
+
+        return variable
+    if isinstance(node, ast.BinOp) and type(node.op) in _ALLOWED_BINOPS:
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        op = _ALLOWED_BINOPS[type(node.op)]
+        if isinstance(node.op, ast.Div):
+            def divide(vars_map: dict[str, float]) -> float:
+                a = left(vars_map)
+                b = right(vars_map)
+                if b == 0:
+                    raise ValueError("Division by zero")
+                return op(a, b)
+
+            return divide
+        return lambda vars_map: op(left(vars_map), right(vars_map))
+    if isinstance(node, ast.Compare) and all(type(op) in _ALLOWED_COMPARE for op in node.ops):
+        first = _compile_node(node.left)
+        chain = [(_ALLOWED_COMPARE[type(op)], _compile_node(c)) for op, c in zip(node.ops, node.comparators, strict=True)]
+
+        def compare(vars_map: dict[str, float]) -> float:
+            left = first(vars_map)
+            for compare_fn, comparator in chain:
+                right = comparator(vars_map)
+                if compare_fn(left, right) == 0.0:
+                    return 0.0
+                left = right
+            return 1.0
+
+        return compare
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _ALLOWED_UNARY:
+        unary, operand = _ALLOWED_UNARY[type(node.op)], _compile_node(node.operand)
+        return lambda vars_map: unary(operand(vars_map))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _ALLOWED_FUNCS:
+        func = _ALLOWED_FUNCS[node.func.id]
+        args = [_compile_node(a) for a in node.args]
+        return lambda vars_map: float(func(*[a(vars_map) for a in args]))
+    return functools.partial(_eval_node, node)
+
+
+# Compiled form of each parsed body; parse_equation returns the same body object per equation string
+_compile_body = functools.lru_cache(maxsize=1024)(_compile_node)
+
+
 def parse_equation(equation: str) -> ast.Expression:
     """
     Parse tolerance equation string (Excel-like: + - * / ^ and ABS, MIN, MAX, ROUND).
-    Returns AST body.
+    Returns AST body. Parsed bodies are cached per equation string; they are never mutated.
 
     Raises:
         ValueError: On disallowed construct (attribute access, etc.) or empty equation.
@@ -284,7 +346,12 @@ def parse_equation(equation: str) -> ast.Expression:
     """
     if not (equation or "").strip():
         raise ValueError("Equation is empty")
-    eq = _excel_to_python(equation.strip())
+    return _parse_equation_cached(equation.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_equation_cached(equation: str) -> ast.AST:
+    eq = _excel_to_python(equation)
     tree = ast.parse(eq, mode="eval")
     # Reject attribute access, subscripts, etc. (ast.List allowed only as argument to LINEST)
     for node in ast.walk(tree):
@@ -298,11 +365,16 @@ def parse_equation(equation: str) -> ast.Expression:
 
 def list_variables(equation: str) -> list[str]:
     """Return ordered list of variable names used in the equation (excludes function names)."""
+    return list(_list_variables_cached(equation.strip()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _list_variables_cached(equation: str) -> tuple[str, ...]:
     try:
-        eq = _excel_to_python(equation.strip())
+        eq = _excel_to_python(equation)
         tree = ast.parse(eq, mode="eval")
     except SyntaxError:
-        return []
+        return ()
     names = []
     seen = set()
     _func_names = set(_ALLOWED_FUNCS) | {
@@ -315,7 +387,7 @@ def list_variables(equation: str) -> list[str]:
             if node.id not in seen:
                 seen.add(node.id)
                 names.append(node.id)
-    return names
+    return tuple(names)
 
 
 def parse_plot_equation(equation: str) -> tuple[list[str], list[str]]:
@@ -414,7 +486,28 @@ def evaluate_tolerance_equation(equation: str, vars_map: dict[str, float]) -> fl
     """
     v = _ensure_val_aliases(vars_map)
     body = parse_equation(equation)
-    return _eval_node(body, v)
+    return _compile_body(body)(v)
+
+
+def equation_pass_fail(tol_value: float, nominal: float, reading: float) -> tuple[bool, float, str]:
+    """
+    Pass/fail for an already evaluated equation result, as evaluate_pass_fail('equation', ...) reports it.
+    Lets callers holding a compiled equation (compile_equation) avoid evaluating it a second time.
+    """
+    diff = abs(reading - nominal)
+    # Equation result 0 or 1 (from comparison) = direct pass/fail; otherwise treat as tolerance band
+    if abs(tol_value - round(tol_value)) < 1e-9 and 0 <= tol_value <= 1:
+        pass_ = tol_value >= 0.5
+        explanation = (
+            f"Equation (condition) = {int(round(tol_value))} (1=pass, 0=fail) → {'PASS' if pass_ else 'FAIL'}"
+        )
+    else:
+        pass_ = diff <= tol_value
+        explanation = (
+            f"Tolerance (from equation) = {tol_value}; "
+            f"|reading − nominal| = {diff} → {'PASS' if pass_ else 'FAIL'}"
+        )
+    return pass_, tol_value, explanation
 
 
 def evaluate_pass_fail(
@@ -469,20 +562,7 @@ def evaluate_pass_fail(
             return False, 0.0, f"Equation error: {e}"
         except Exception as e:
             return False, 0.0, f"Equation error: {e}"
-        diff = abs(reading - nominal)
-        # Equation result 0 or 1 (from comparison) = direct pass/fail; otherwise treat as tolerance band
-        if abs(tol_value - round(tol_value)) < 1e-9 and 0 <= tol_value <= 1:
-            pass_ = tol_value >= 0.5
-            explanation = (
-                f"Equation (condition) = {int(round(tol_value))} (1=pass, 0=fail) → {'PASS' if pass_ else 'FAIL'}"
-            )
-        else:
-            pass_ = diff <= tol_value
-            explanation = (
-                f"Tolerance (from equation) = {tol_value}; "
-                f"|reading − nominal| = {diff} → {'PASS' if pass_ else 'FAIL'}"
-            )
-        return pass_, tol_value, explanation
+        return equation_pass_fail(tol_value, nominal, reading)
 
     if tolerance_type == "lookup" and tolerance_lookup_json:
         # L1: Lookup table — tolerance_lookup_json list of {range_low, range_high, tolerance}
@@ -503,25 +583,20 @@ def evaluate_pass_fail(
     return pass_, tol_value, explanation
 
 
-def evaluate_tolerance_lookup(
-    lookup_json: str | None,
-    nominal: float,
-) -> float:
+@functools.lru_cache(maxsize=256)
+def parse_tolerance_lookup(lookup_json: str) -> tuple[tuple[float, float, float], ...]:
     """
-    L1: Resolve tolerance from lookup table by nominal value.
-    lookup_json: JSON array of {"range_low", "range_high", "tolerance"}.
-    First range where range_low <= nominal < range_high (or <= range_high) wins.
-    Returns 0.0 if no match or invalid JSON.
+    Parse a lookup table once into (range_low, range_high, tolerance) rows; cached per JSON string.
+    Rows that are not objects or have non-numeric bounds are dropped. Returns () for invalid JSON.
     """
-    if not (lookup_json or "").strip():
-        return 0.0
     import json
     try:
         rows = json.loads(lookup_json.strip())
     except (json.JSONDecodeError, TypeError):
-        return 0.0
+        return ()
     if not isinstance(rows, list):
-        return 0.0
+        return ()
+    parsed = []
     for row in rows:
         if not isinstance(row, dict):
             continue
@@ -531,6 +606,23 @@ def evaluate_tolerance_lookup(
             tol = float(row.get("tolerance", 0))
         except (TypeError, ValueError):
             continue
+        parsed.append((low, high, tol))
+    return tuple(parsed)
+
+
+def evaluate_tolerance_lookup(
+    lookup_json: str | None,
+    nominal: float,
+) -> float:
+    """
+    L1: Resolve tolerance from lookup table by nominal value.
+    lookup_json: JSON array of {"range_low", "range_high", "tolerance"}.
+    First range where range_low <= nominal < range_high (or <= range_high) wins.
+    Returns 0.0 if no match or invalid JSON.
+    """
+    if not (lookup_json or "").strip():
+        return 0.0
+    for low, high, tol in parse_tolerance_lookup(lookup_json):
         if low <= nominal <= high:
             return abs(tol)
     return 0.0
@@ -547,11 +639,12 @@ def validate_equation_variables(equation: str) -> tuple[bool, list[str]]:
     Check that all variables in equation are in ALLOWED_VARIABLES.
     Returns (all_ok, list_of_unknown_names).
     """
-    names = list_variables(equation)
+    names = _list_variables_cached(equation.strip())
     unknown = [n for n in names if n not in ALLOWED_VARIABLES]
     return len(unknown) == 0, unknown
 
 
+@functools.lru_cache(maxsize=1024)
 def equation_has_pass_fail_condition(equation: str) -> bool:
     """
     Check that equation contains a comparison (<, >, <=, >=, ==).
@@ -594,26 +687,74 @@ def equation_tolerance_display(
     return (lhs_value, op_str, rhs_value, pass) for display as "lhs op rhs, PASS" or ", FAIL".
     Returns None if equation is not a single comparison (e.g. tolerance band expression).
     """
+    return compile_tolerance_equation(equation)(vars_map)
+
+
+def _no_display(vars_map: dict[str, float]) -> None:
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_tolerance_equation(
+    equation: str,
+) -> Callable[[dict[str, float]], tuple[float, str, float, bool] | None]:
+    """
+    Parse equation once and return fn(vars_map) with the same result as
+    equation_tolerance_display(equation, vars_map), for re-evaluating one equation with many inputs.
+    Invalid or non-comparison equations give a function that always returns None.
+    """
     if not (equation or "").strip():
-        return None
+        return _no_display
     try:
         body = parse_equation(equation.strip())
     except (ValueError, SyntaxError):
-        return None
+        return _no_display
     if not isinstance(body, ast.Compare) or len(body.ops) != 1 or len(body.comparators) != 1:
-        return None
-    v = _ensure_val_aliases(dict(vars_map))
-    try:
-        lhs = _eval_node(body.left, v)
-        op = body.ops[0]
-        op_str = _COMPARE_SYMBOLS.get(type(op))
-        if op_str is None:
-            return None
-        rhs = _eval_node(body.comparators[0], v)
-        compare_fn = _ALLOWED_COMPARE.get(type(op))
-        if compare_fn is None:
+        return _no_display
+    op = body.ops[0]
+    op_str = _COMPARE_SYMBOLS.get(type(op))
+    compare_fn = _ALLOWED_COMPARE.get(type(op))
+    if op_str is None or compare_fn is None:
+        return _no_display
+    left, right = _compile_node(body.left), _compile_node(body.comparators[0])
+
+    def display(vars_map: dict[str, float]) -> tuple[float, str, float, bool] | None:
+        v = _ensure_val_aliases(dict(vars_map))
+        try:
+            lhs = left(v)
+            rhs = right(v)
+        except (ValueError, TypeError):
             return None
-        pass_ = compare_fn(lhs, rhs) >= 0.5
-        return (lhs, op_str, rhs, pass_)
-    except (ValueError, TypeError):
-        return None
+        return (lhs, op_str, rhs, compare_fn(lhs, rhs) >= 0.5)
+
+    return display
+
+
+class CompiledEquation:
+    """
+    A tolerance equation parsed once, for evaluating it against many vars_maps (fields, passes, saves).
+    evaluate() matches evaluate_tolerance_equation(), display() matches equation_tolerance_display(),
+    and variables matches list_variables().
+    """
+
+    __slots__ = ("source", "variables", "display", "_fn")
+
+    def __init__(self, equation: str):
+        self.source = equation
+        self.variables = tuple(list_variables(equation))
+        self.display = compile_tolerance_equation(equation)
+        try:
+            self._fn = _compile_body(parse_equation(equation))
+        except (ValueError, SyntaxError):
+            self._fn = None
+
+    def evaluate(self, vars_map: dict[str, float]) -> float:
+        if self._fn is None:
+            parse_equation(self.source)  # raises the same error evaluate_tolerance_equation would
+        return self._fn(_ensure_val_aliases(vars_map))
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_equation(equation: str) -> CompiledEquation:
+    """Parse equation once; cached per equation string, so fields sharing an equation share the result."""
+    return CompiledEquation(equation)
@@ -7,7 +7,8 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 from database import CalibrationRepository
 from services import attachment_service
-from ui.help_content import get_help_content, HelpDialog
+from ui.dialogs.common import fill_table, show_loading_row
+from ui.help_content import show_help_dialog
 
 
 class AttachmentsDialog(QtWidgets.QDialog):
@@ -43,35 +44,39 @@ class AttachmentsDialog(QtWidgets.QDialog):
         btn_box.rejected.connect(self.accept)
         layout.addWidget(btn_box)
 
-        self._load_attachments()
+        # Table is filled on first show so constructing the dialog doesn't hit the database
+        self._loaded = False
+        show_loading_row(self.table)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            QtCore.QTimer.singleShot(0, self._load_attachments)
 
     def _show_help(self):
-        title, content = get_help_content("AttachmentsDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "AttachmentsDialog")
 
     def _load_attachments(self):
-        atts = self.repo.list_attachments(self.instrument_id)
-        self.table.setRowCount(len(atts))
-        for row, a in enumerate(atts):
+        def items(a):
             item_name = QtWidgets.QTableWidgetItem(a["filename"])
-            item_path = QtWidgets.QTableWidgetItem(a["file_path"])
-            item_upload = QtWidgets.QTableWidgetItem(a["uploaded_at"])
             item_name.setData(QtCore.Qt.UserRole, a["id"])
-            self.table.setItem(row, 0, item_name)
-            self.table.setItem(row, 1, item_path)
-            self.table.setItem(row, 2, item_upload)
+            return (
+                item_name,
+                QtWidgets.QTableWidgetItem(a["file_path"]),
+                QtWidgets.QTableWidgetItem(a["uploaded_at"]),
+            )
+
+        fill_table(self.table, self.repo.list_attachments(self.instrument_id), items)
 
     def _add_attachment(self):
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Select file"
+        paths, _ = QtWidgets.QFileDialog.getOpenFileNames(
+            self, "Select files"
         )
-        if not path:
+        if not paths:
             return
         try:
-            attachment_service.add_attachment(self.repo, self.instrument_id, path)
+            attachment_service.add_attachments(self.repo, self.instrument_id, paths)
             self._load_attachments()
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -91,30 +96,28 @@ class AttachmentsDialog(QtWidgets.QDialog):
         if not att_id:
             return
 
-        att = self.repo.get_attachment(att_id)
+        att = self.repo.get_attachment_info(att_id)
         if not att:
             return
 
-        file_data = att.get("file_data")
         filename = att.get("filename") or "attachment.bin"
         stored_path = att.get("file_path")
 
-        if file_data:
-            temp_dir = Path(tempfile.gettempdir()) / "cal_tracker_attachments"
+        # Contents stored in the row itself (older databases) are streamed to a temp file
+        temp_dir = Path(tempfile.gettempdir()) / "cal_tracker_attachments"
+        temp_path = temp_dir / filename
+        try:
             temp_dir.mkdir(parents=True, exist_ok=True)
-            temp_path = temp_dir / filename
-            try:
-                with temp_path.open("wb") as f:
-                    f.write(file_data)
+            if self.repo.copy_attachment_data(att_id, temp_path):
                 QtGui.QDesktopServices.openUrl(
                     QtCore.QUrl.fromLocalFile(str(temp_path))
                 )
                 return
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self, "Error opening attachment", str(e)
-                )
-                return
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self, "Error opening attachment", str(e)
+            )
+            return
 
         if stored_path:
             QtGui.QDesktopServices.openUrl(
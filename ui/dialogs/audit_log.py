@@ -3,7 +3,7 @@
 from PyQt5 import QtWidgets
 
 from database import CalibrationRepository
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 
 
 class AuditLogDialog(QtWidgets.QDialog):
@@ -34,11 +34,7 @@ class AuditLogDialog(QtWidgets.QDialog):
         self._load()
 
     def _show_help(self):
-        title, content = get_help_content("AuditLogDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "AuditLogDialog")
 
     def _load(self):
         rows = self.repo.get_audit_for_instrument(self.instrument_id)
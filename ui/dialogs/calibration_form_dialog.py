@@ -1,18 +1,317 @@
 # ui/dialogs/calibration_form_dialog.py - Calibration data entry form
 
-from datetime import datetime, date
+import bisect
+import functools
 import logging
 import os
+import re
 import sqlite3
-import tempfile
+import sys
 from pathlib import Path
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-from database import CalibrationRepository, StaleDataError
-from services import calibration_service, template_service
+from database import CalibrationRepository, StaleDataError, get_connection, get_effective_db_path
+from services import calibration_service
 from ui.dialogs.common import STANDARD_FIELD_WIDTH
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
+
+try:
+    from tolerance_service import (
+        _ensure_val_aliases,
+        compile_equation,
+        compile_tolerance_equation,
+        evaluate_pass_fail,
+        evaluate_tolerance_equation,
+        format_calculation_display,
+        parse_tolerance_lookup,
+    )
+except ImportError:
+    _ensure_val_aliases = compile_equation = compile_tolerance_equation = None
+    evaluate_pass_fail = evaluate_tolerance_equation = format_calculation_display = parse_tolerance_lookup = None
+
+
+logger = logging.getLogger(__name__)
+
+# calc_ref column names and the equation variables each ref slot fills (val1-val12 alias ref1-ref12)
+_CALC_REF_NAMES = tuple(f"calc_ref{i}_name" for i in range(1, 13))
+_REF_KEYS = tuple(f"ref{i}" for i in range(1, 13))
+_VAL_KEYS = tuple(f"val{i}" for i in range(1, 13))
+
+# Bool tolerance: stored values that read as true, and the accepted pass values
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_BOOL_PASS_VALUES = frozenset({"true", "false"})
+
+# calc_types whose computed value is checked against the field's tolerance
+_DIFF_CALC_TYPES = frozenset({"ABS_DIFF", "PCT_ERROR", "PCT_DIFF", "MIN_OF", "MAX_OF", "RANGE_OF"})
+
+# values_by_name.get default for refs whose name is absent (distinct from a stored None)
+_MISSING = object()
+
+
+def _field_sort_key(f: dict) -> int:
+    return f.get("sort_order") or 0
+
+
+@functools.lru_cache(maxsize=256)
+def _unit_suffix_re(unit: str) -> re.Pattern:
+    """Compiled matcher for a trailing unit (plus any whitespace before it); units are a small fixed set per template."""
+    return re.compile(rf"\s*{re.escape(unit)}$")
+
+
+@functools.lru_cache(maxsize=2048)
+def _eval_cached(eq: str, vars_items: tuple) -> float:
+    """evaluate_tolerance_equation memoized on (equation, sorted vars); recomputes repeat the same inputs a lot."""
+    return evaluate_tolerance_equation(eq, dict(vars_items))
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_cached(value: float, decimal_places: int) -> str:
+    return format_calculation_display(value, decimal_places=decimal_places)
+
+
+# Stored autofill flag values (the column is an INTEGER 0/1; True/False hash the same as 1/0)
+_AUTOFILL_FLAGS = {None: False, 0: False, "0": False, 1: True, "1": True}
+
+
+def _coerce_autofill_flag(f: dict) -> bool:
+    """autofill_from_first_group as a bool: 1, True, "1" -> True; 0, False, "0", None -> False."""
+    flag = f.get("autofill_from_first_group")
+    try:
+        return _AUTOFILL_FLAGS[flag]
+    except (KeyError, TypeError):
+        pass
+    try:
+        return bool(int(flag))
+    except (ValueError, TypeError):
+        return bool(flag)
+
+
+# Trailing "_<digits>" suffix that distinguishes per-group copies of a field (e.g. "date_2" -> "date")
+_TRAILING_NUM_RE = re.compile(r"_\d+$")
+
+# Read-only / display field types that never feed values_by_name
+_DISPLAY_ONLY_TYPES = frozenset(("tolerance", "convert", "stat", "reference_cal_date", "field_header"))
+
+
+# ---- Autofill widget readers/writers, dispatched on the exact widget class ----
+# Readers return the widget's value as text (None = nothing to copy); writers apply it with signals blocked
+# (the caller repaints the page once afterwards).
+# Bool fields are a plain QWidget holding pass/fail radio buttons, which is the fallback for both.
+
+def _read_line(w):
+    return w.text()
+
+
+def _read_check(w):
+    return "1" if w.isChecked() else "0"
+
+
+def _read_date(w):
+    return w.date().toString("yyyy-MM-dd")
+
+
+def _read_combo(w):
+    return w.currentData() or w.currentText()
+
+
+def _read_radio_container(w):
+    p = getattr(w, "_pass_btn", None)
+    if p is None:
+        return None
+    return "1" if p.isChecked() else "0"
+
+
+def _write_line(w, value, f):
+    with QtCore.QSignalBlocker(w):
+        w.setText(value)
+
+
+def _write_check(w, value, f):
+    with QtCore.QSignalBlocker(w):
+        w.setChecked(value == "1" or (value and value.lower() == "true"))
+
+
+def _write_date(w, value, f):
+    date = QtCore.QDate.fromString(value, QtCore.Qt.ISODate)
+    if date.isValid():
+        with QtCore.QSignalBlocker(w):
+            w.setDate(date)
+
+
+def _write_combo(w, value, f):
+    # Signature combos match by data (filename) first, then by text; other combos by text.
+    # Signature combos carry the shared model's lookup dicts, so no findData/findText scan.
+    data_index = getattr(w, "_data_index", None)
+    if data_index is not None:
+        idx = data_index.get(value, -1) if f.get("data_type") == "signature" else -1
+        if idx < 0:
+            idx = w._text_index.get(value, -1)
+    else:
+        idx = w.findData(value) if f.get("data_type") == "signature" else -1
+        if idx < 0:
+            idx = w.findText(value)
+    if idx >= 0:
+        with QtCore.QSignalBlocker(w):
+            w.setCurrentIndex(idx)
+
+
+def _write_radio_container(w, value, f):
+    p = getattr(w, "_pass_btn", None)
+    if p is None:
+        return
+    is_pass = value == "1" or (value and str(value).lower() in ("true", "yes"))
+    with QtCore.QSignalBlocker(w):
+        p.setChecked(is_pass)
+        fail_btn = getattr(w, "_fail_btn", None)
+        if fail_btn:
+            fail_btn.setChecked(not is_pass)
+
+
+_READERS = {
+    QtWidgets.QLineEdit: _read_line,
+    QtWidgets.QCheckBox: _read_check,
+    QtWidgets.QDateEdit: _read_date,
+    QtWidgets.QComboBox: _read_combo,
+}
+_WRITERS = {
+    QtWidgets.QLineEdit: _write_line,
+    QtWidgets.QCheckBox: _write_check,
+    QtWidgets.QDateEdit: _write_date,
+    QtWidgets.QComboBox: _write_combo,
+}
+
+
+# ---- Save-time value collectors, dispatched on data_type (resolved once per field in _index_fields) ----
+
+def _collect_bool(w):
+    pass_btn = getattr(w, "_pass_btn", None)
+    return "1" if (pass_btn and pass_btn.isChecked()) else "0"
+
+
+def _collect_signature(w):
+    return (w.currentData() or "") if isinstance(w, QtWidgets.QComboBox) else ""
+
+
+def _collect_text(w):
+    return w.text().strip()
+
+
+_COLLECTORS = {
+    "bool": _collect_bool,
+    "date": _read_date,
+    "signature": _collect_signature,
+}
+
+
+# Every string float() accepts has a digit or spells nan/inf; anything else is rejected without raising
+_FLOAT_HINT_RE = re.compile(r"\d|nan|inf", re.IGNORECASE)
+
+
+def _to_float(v) -> float | None:
+    """float(str(v).strip()), or None if v is None, empty, or not a number."""
+    if v in (None, ""):
+        return None
+    s = str(v).strip()
+    if not _FLOAT_HINT_RE.search(s):
+        return None
+    try:
+        return float(s)
+    except (TypeError, ValueError):
+        return None
+
+
+class _ValuesTable(dict):
+    """
+    Field values by name for one save (accept): the raw text values, plus their float conversions
+    memoized per name so the computation and tolerance passes don't re-parse the same strings.
+    Assigning a name drops its memoized floats.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._floats = {}
+        self._numbers = {}
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name, value)
+        self._floats.pop(name, None)
+        self._numbers.pop(name, None)
+
+    def get_float(self, name) -> float | None:
+        """float(str(value).strip()) for name, or None if it is missing, empty, or not a number."""
+        try:
+            return self._floats[name]
+        except KeyError:
+            pass
+        num = self._floats[name] = _to_float(self.get(name))
+        return num
+
+    def get_number(self, name, unit: str) -> float | None:
+        """
+        Value for name parsed with its trailing unit stripped (see _parse_numeric_stripping_unit), or None.
+        A ref's unit is fixed by its name (_get_unit_for_ref), so the result is memoized per name.
+        """
+        try:
+            return self._numbers[name]
+        except KeyError:
+            pass
+        num = self._numbers[name] = CalibrationFormDialog._parse_numeric_stripping_unit(self.get(name), unit)
+        return num
+
+
+class _SignatureScanSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(list)
+
+
+class _SignatureScanTask(QtCore.QRunnable):
+    """Runs the Signatures/ scan on the global thread pool (the folder may be on a slow network share)."""
+
+    def __init__(self, scan):
+        super().__init__()
+        self.signals = _SignatureScanSignals()
+        self._scan = scan
+
+    def run(self):
+        try:
+            items = self._scan()
+        except Exception:
+            items = []
+        self.signals.done.emit(items)
+
+
+class _SaveRecordSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)  # None on success, else the exception raised
+
+
+class _SaveRecordTask(QtCore.QRunnable):
+    """
+    Writes a calibration record on the global thread pool, so a slow server share doesn't freeze the form.
+    sqlite3 connections belong to the thread that opened them, so the task opens (and closes) its own
+    on db_path. Without a db_path, run() must be called on the UI thread and saves through the form's repo.
+    """
+
+    def __init__(self, save, db_path: Path | None):
+        super().__init__()
+        self.signals = _SaveRecordSignals()
+        self.db_path = db_path
+        self._save = save
+
+    def run(self):
+        try:
+            if self.db_path is None:
+                self._save(None)
+            else:
+                conn = get_connection(self.db_path)
+                try:
+                    self._save(CalibrationRepository(conn))
+                finally:
+                    conn.close()
+        except Exception as e:
+            self.signals.done.emit(e)
+        else:
+            self.signals.done.emit(None)
+
 
 class CalibrationFormDialog(QtWidgets.QDialog):
     """
@@ -20,6 +319,10 @@ class CalibrationFormDialog(QtWidgets.QDialog):
     Supports both New and Edit (if record_id provided).
     read_only=True disables edits (Approved/Archived records).
     """
+    # Signatures/ scan shared by all dialogs: (resolved dir, mtime_ns) -> [(stem, filename), ...]
+    _SIG_CACHE: dict = {}
+    _SIG_IMAGE_EXTENSIONS = frozenset((".png", ".jpg", ".jpeg", ".gif", ".bmp"))
+
     def __init__(self, repo: CalibrationRepository, instrument: dict,
                  record_id: int | None = None, parent=None, read_only: bool = False):
         super().__init__(parent)
@@ -30,6 +333,43 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         self.template = None
         self.fields = []
         self.field_widgets = {}  # field_id -> widget
+        self._sig_model = None  # shared item model for all signature combos on the form
+        self._sig_loaded = False  # True once the Signatures/ scan has filled _sig_model
+        self._pending_sig_values = {}  # combo -> filename to select once the scan arrives
+        self._sig_data_index = {}  # filename -> row in _sig_model (first match, like findData)
+        self._sig_text_index = {}  # display text -> row in _sig_model (first match, like findText)
+        self._saving = False  # True while _SaveRecordTask is writing the record
+        # data_type -> widget builder; anything unlisted (text) falls back to _mk_text
+        self._builders = {
+            "number": self._mk_number,
+            "bool": self._mk_bool,
+            "date": self._mk_date,
+            "non_affected_date": self._mk_date,
+            "signature": self._mk_signature,
+            "reference": self._mk_reference,
+            "tolerance": self._mk_computed_display,
+            "stat": self._mk_computed_display,
+            "convert": self._mk_computed_display,
+            "reference_cal_date": self._mk_computed_display,
+            "field_header": self._mk_field_header,
+        }
+        self._index_fields()
+
+        # Coalesces recomputes of convert/stat/reference_cal_date fields: each edit restarts
+        # the timer, so a burst of keystrokes triggers a single recompute.
+        self._recalc_timer = QtCore.QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._recalculate_computed_fields)
+        self._dirty_names = set()  # input field names edited since the last recompute
+
+        # Debounces autofill on group navigation: each prev/next restarts the timer, so a burst
+        # of clicks runs one autofill pass for the group the user lands on.
+        self._autofill_timer = QtCore.QTimer(self)
+        self._autofill_timer.setSingleShot(True)
+        self._autofill_timer.setInterval(30)
+        self._autofill_timer.timeout.connect(self._apply_autofill_to_current_group)
+        self._values_by_name = {}  # input values by name; entries re-read only for dirty names
 
         inst_tag = instrument.get("tag_number", str(instrument["id"]))
         self.setWindowTitle(f"Calibration - {inst_tag}" + (" (read-only)" if read_only else ""))
@@ -43,7 +383,7 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         layout.addWidget(QtWidgets.QLabel(" | ".join(info_parts)))
 
         # Stack of group pages
-        self.stack = QtWidgets.QStackedWidget()
+        self.stack = self._new_stack()
         layout.addWidget(self.stack)
 
         # Group navigation
@@ -62,6 +402,9 @@ class CalibrationFormDialog(QtWidgets.QDialog):
 
         self.group_names = []
         self.current_group_index = 0
+        self._date_widgets = []  # (field name, QDateEdit) for "date" fields; see _sync_date_to_all_date_fields
+        self._pending_pages = {}  # page index -> fields, for pages whose widgets are not built yet
+        self._stored_values = None  # (by_field, values_by_name) of the record being edited
 
 
         # Bottom: general cal metadata
@@ -123,17 +466,17 @@ class CalibrationFormDialog(QtWidgets.QDialog):
     
     def _sync_date_to_all_date_fields(self, new_date):
         """When Cal date is changed, set all date-type template fields to the same date."""
-        if not hasattr(self, "fields") or not hasattr(self, "field_widgets"):
+        if not hasattr(self, "_date_widgets"):
             return
-        for f in self.fields:
-            if (f.get("data_type") or "").strip().lower() != "date":
-                continue
-            fid = f.get("id")
-            w = self.field_widgets.get(fid)
-            if w and isinstance(w, QtWidgets.QDateEdit):
-                w.blockSignals(True)
+        for name, w in self._date_widgets:
+            with QtCore.QSignalBlocker(w):
                 w.setDate(new_date)
-                w.blockSignals(False)
+            self._schedule_recalc(name)
+        # Date fields on pages not built yet will pick up Cal date too (see _unbuilt_input_value)
+        for flist in self._pending_pages.values():
+            for f in flist:
+                if f["_dt"] == "date":
+                    self._schedule_recalc(self._field_meta["name"][self._field_meta["pos"][f["id"]]])
 
     def _on_performed_combo_changed(self, index):
         is_other = self.performed_combo.currentText() == "Other..."
@@ -182,14 +525,12 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         # Result combo removed; result is derived from tolerance pass/fail
 
     def _show_help(self):
-        title, content = get_help_content("CalibrationFormDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "CalibrationFormDialog")
 
     def reject(self):
         """Confirm before closing (Escape or Cancel) when filling out a calibration."""
+        if self._saving:
+            return  # the record is being written; _on_record_saved closes or re-enables the form
         if self.read_only:
             super().reject()
             return
@@ -235,110 +576,115 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             return templates[0]
 
         # Let user choose if multiple
-        names = [f"{t['name']} (v{t['version']})" for t in templates]
-        items = [names[i] for i in range(len(names))]
+        by_label = {}
+        for t in templates:
+            by_label.setdefault(f"{t['name']} (v{t['version']})", t)
         item, ok = QtWidgets.QInputDialog.getItem(
             self,
             "Select template",
             "Calibration template:",
-            items,
+            list(by_label),
             0,
             False,
         )
         if not ok:
             return None
-        idx = items.index(item)
-        return templates[idx]
+        return by_label[item]
+
+    def _new_stack(self) -> QtWidgets.QStackedWidget:
+        """Create the (empty) stacked widget that holds one page per field group."""
+        return QtWidgets.QStackedWidget()
+
+    def _replace_stack(self):
+        """Swap in a fresh stack; deleting the old container at once is far cheaper than removing pages one by one."""
+        old = self.stack
+        self.stack = self._new_stack()
+        self.layout().replaceWidget(old, self.stack)
+        old.setParent(None)
+        old.deleteLater()
 
     def _build_dynamic_form(self):
+        # Suspend painting so Qt does one layout pass for the whole rebuild instead of one per row
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_dynamic_form_pages()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_dynamic_form_pages(self):
         # Clear old pages
-        while self.stack.count():
-            w = self.stack.widget(0)
-            self.stack.removeWidget(w)
-            w.deleteLater()
+        if self.stack.count():
+            self._replace_stack()
 
         self.field_widgets.clear()
+        self._sig_model = None
+        self._sig_loaded = False
+        self._pending_sig_values = {}
+        self._sig_data_index = {}
+        self._sig_text_index = {}
+        self._stored_values = None
 
         self.fields = self.repo.list_template_fields(self.template["id"])
-
-        # Split into header vs grouped
-        header_fields = [f for f in self.fields if not f.get("group_name")]
+        self._index_fields()
+        # Bound the memoized evaluations to the template being loaded
+        _eval_cached.cache_clear()
+        _format_cached.cache_clear()
+
+        # Split into header vs grouped in one pass: fields are kept sorted by sort_order on
+        # insertion (insort is stable for ties) and each group's min sort_order is tracked as we go
+        header_fields = []
         grouped = {}
+        min_sort = {}
         for f in self.fields:
             g = f.get("group_name")
-            if g:
-                grouped.setdefault(g, []).append(f)
-        
+            so = f.get("sort_order") or 0
+            if not g:
+                bisect.insort(header_fields, f, key=_field_sort_key)
+                continue
+            flist = grouped.get(g)
+            if flist is None:
+                grouped[g] = [f]
+                min_sort[g] = so
+            else:
+                bisect.insort(flist, f, key=_field_sort_key)
+                if so < min_sort[g]:
+                    min_sort[g] = so
+
         # Sort group names by min sort_order
-        ordered_groups = []
-        for gname, flist in grouped.items():
-            min_sort = min((f.get("sort_order") or 0) for f in flist)
-            ordered_groups.append((gname, min_sort, flist))
-        ordered_groups.sort(key=lambda t: t[1])
+        ordered_groups = sorted(
+            ((gname, min_sort[gname], flist) for gname, flist in grouped.items()),
+            key=lambda t: t[1],
+        )
 
-        # If there are no named groups, treat header as a single page
+        # If there are no named groups, treat header as a single page; otherwise one page per
+        # group with the header fields on the first page
         if not ordered_groups and header_fields:
-            page = QtWidgets.QWidget()
-            form = QtWidgets.QFormLayout(page)
-            for f in sorted(header_fields, key=lambda f: f.get("sort_order") or 0):
-                w = self._create_field_widget(f)
-                self.field_widgets[f["id"]] = w
-                if (f.get("data_type") or "").strip().lower() == "field_header":
-                    form.addRow(w)
-                else:
-                    label_text = f["label"]
-                    if f.get("unit"):
-                        label_text += f" ({f['unit']})"
-                    form.addRow(label_text, w)
-            self.stack.addWidget(page)
+            page_fields = [header_fields]
             self.group_names = [""]
         else:
-            # Build one page per group; header fields go on first page
-            first_page = True
-            for gname, _, flist in ordered_groups:
-                page = QtWidgets.QWidget()
-                form = QtWidgets.QFormLayout(page)
-
-                if first_page and header_fields:
-                    for f in sorted(header_fields, key=lambda f: f.get("sort_order") or 0):
-                        w = self._create_field_widget(f)
-                        self.field_widgets[f["id"]] = w
-                        if (f.get("data_type") or "").strip().lower() == "field_header":
-                            form.addRow(w)
-                        else:
-                            label_text = f["label"]
-                            if f.get("unit"):
-                                label_text += f" ({f['unit']})"
-                            form.addRow(label_text, w)
-                    first_page = False
-
-                for f in sorted(flist, key=lambda f: f.get("sort_order") or 0):
-                    w = self._create_field_widget(f)
-                    self.field_widgets[f["id"]] = w
-                    if (f.get("data_type") or "").strip().lower() == "field_header":
-                        form.addRow(w)
-                    else:
-                        label_text = f["label"]
-                        if f.get("unit"):
-                            label_text += f" ({f['unit']})"
-                        form.addRow(label_text, w)
-
-                self.stack.addWidget(page)
-
+            page_fields = [flist for (_, _, flist) in ordered_groups]
+            if page_fields and header_fields:
+                page_fields[0] = header_fields + page_fields[0]
             self.group_names = [gname for (gname, _, _) in ordered_groups]
 
+        # Pages start as empty placeholders; each one's widgets are built the first time it is
+        # shown (see _materialize_page), so opening the dialog only costs the first page.
+        self._pending_pages = {}
+        self._date_widgets = []
+        for idx, flist in enumerate(page_fields):
+            self.stack.addWidget(QtWidgets.QWidget())
+            self._pending_pages[idx] = flist
+
         self.current_group_index = 0
         self._update_group_nav()
 
-        self._connect_convert_updates()
+        # Seed every input name, including those on pages not built yet (see _unbuilt_input_value)
+        self._values_by_name = {}
+        self._refresh_values_by_name(self._field_meta["inputs_by_name"])
         self._update_convert_fields()
         self._update_stat_fields()
         self._update_reference_cal_date_fields()
 
-        # Sync Cal date to all date-type fields (so they match when form is first built)
-        if hasattr(self, "date_edit"):
-            self._sync_date_to_all_date_fields(self.date_edit.date())
-
         # Load and display template notes
         if self.template:
             template_notes = str(self.template.get("notes", "") or "")
@@ -351,89 +697,337 @@ class CalibrationFormDialog(QtWidgets.QDialog):
                 self.template_notes_label.show()
                 self.template_notes_display.show()
     
+    def _materialize_page(self, idx: int):
+        """Build the widgets of page idx (a placeholder until first shown) and wire them into the form."""
+        flist = self._pending_pages.pop(idx, None)
+        if flist is None:
+            return
+        form = QtWidgets.QFormLayout(self.stack.widget(idx))
+        for f in flist:
+            w = self._create_field_widget(f)
+            self.field_widgets[f["id"]] = w
+            if f["_dt"] == "field_header":
+                form.addRow(w)
+            else:
+                label_text = f["label"]
+                if f.get("unit"):
+                    label_text += f" ({f['unit']})"
+                form.addRow(label_text, w)
+            if self.read_only:
+                w.setEnabled(False)
+
+        self._connect_convert_updates(flist)
+
+        # Date fields follow Cal date until the user (or a stored value) sets them
+        meta = self._field_meta
+        new_dates = []
+        for f in flist:
+            i = meta["pos"][f["id"]]
+            w = self.field_widgets[f["id"]]
+            if meta["dt"][i] == "date" and isinstance(w, QtWidgets.QDateEdit):
+                new_dates.append((meta["name"][i], w))
+        self._date_widgets.extend(new_dates)
+        if new_dates and hasattr(self, "date_edit"):
+            for _, w in new_dates:
+                with QtCore.QSignalBlocker(w):
+                    w.setDate(self.date_edit.date())
+
+        if self._stored_values is not None:
+            self._load_stored_values(flist)
+
+        # Refresh computed fields on this page and any elsewhere that read this page's inputs
+        for f in flist:
+            i = meta["pos"][f["id"]]
+            self._dirty_names.add(meta["name"][i])
+            if meta["dt"][i] in meta["kind_idx"]:
+                self._dirty_names.update(r for r in meta["refs"][i] if r)
+        self._recalc_timer.start()
+
+    def _materialize_all_pages(self):
+        """Build any pages not shown yet (needed before reading every field's value, e.g. on save)."""
+        for idx in sorted(self._pending_pages):
+            self._materialize_page(idx)
+
+    def _index_fields(self):
+        """
+        Precompute per-field metadata from self.fields as parallel lists (same index as self.fields),
+        so recomputes on every keystroke are tight loops instead of repeated dict.get/strip/lower chains.
+        pos maps a field id to its index; inputs_by_name maps a name to the indices of input fields carrying it.
+        kind_idx lists the indices of computed (convert, stat, reference_cal_date) fields;
+        deps maps an input field name to the indices of computed fields that reference it;
+        last_by_name maps a name to the index of the last field carrying it (that field's value wins by name).
+        """
+        meta = {
+            "pos": {}, "inputs_by_name": {}, "ids": [], "dt": [], "name": [], "unit": [], "eq": [], "refs": [], "decimals": [],
+            "kind_idx": {"convert": [], "stat": [], "reference_cal_date": []},
+            "deps": {},
+            "last_by_name": {},
+        }
+        for idx, f in enumerate(self.fields):
+            dt = sys.intern((f.get("data_type") or "").strip().lower())
+            meta["pos"][f["id"]] = idx
+            meta["ids"].append(f["id"])
+            meta["dt"].append(dt)
+            meta["name"].append((f.get("name") or f.get("field_name") or "").strip())
+            meta["unit"].append((f.get("unit") or "").strip())
+            meta["eq"].append((f.get("tolerance_equation") or "").strip())
+            meta["refs"].append(tuple(f.get(k) for k in _CALC_REF_NAMES))
+            f["_ref_names"] = meta["refs"][idx]
+            f["_has_refs"] = any(meta["refs"][idx])
+            try:
+                decimals = max(0, min(4, int(f.get("sig_figs") or 3)))
+            except (TypeError, ValueError):
+                decimals = 3
+            meta["decimals"].append(decimals)
+            f["_decimals"] = decimals
+            # Nominal value as a float (0.0 when blank or not numeric), for tolerance and equation vars
+            nominal_str = f.get("nominal_value")
+            try:
+                f["_nominal"] = float(str(nominal_str).strip()) if nominal_str not in (None, "") else 0.0
+            except (TypeError, ValueError):
+                f["_nominal"] = 0.0
+            # Normalized values read on every group navigation, cached on the field itself
+            name_full = f.get("name") or ""
+            f["_dt"] = dt
+            f["_group"] = f.get("group_name") or ""
+            f["_autofill"] = _coerce_autofill_flag(f)
+            f["_base_name"] = _TRAILING_NUM_RE.sub("", name_full).strip().lower() if name_full else ""
+            f["_label_norm"] = (f.get("label") or "").strip().lower()
+            # "lhs op rhs" display evaluator, parsed once per template load
+            f["_tol_eval"] = (
+                compile_tolerance_equation(meta["eq"][idx])
+                if compile_tolerance_equation is not None and meta["eq"][idx] else None
+            )
+            f["_tol_type"] = sys.intern((f.get("tolerance_type") or "fixed").lower())
+            f["_eq_tol"] = f["_tol_type"] == "equation" and f["_tol_eval"] is not None
+            # Parsed tolerance_equation (evaluate/display/variables), shared by fields with the same equation
+            f["_equation"] = compile_equation(f.get("tolerance_equation") or "") if compile_equation is not None else None
+            # Lookup tables are parsed here too, so a save only scans the cached rows
+            lookup_json = f.get("tolerance_lookup_json")
+            if parse_tolerance_lookup is not None and f["_tol_type"] == "lookup" and isinstance(lookup_json, str) and lookup_json.strip():
+                parse_tolerance_lookup(lookup_json)
+            # Save-time reader (None for display-only types) and whether an empty value blocks saving
+            raw_dt = f.get("data_type")
+            f["_collect"] = None if raw_dt in _DISPLAY_ONLY_TYPES else _COLLECTORS.get(raw_dt, _collect_text)
+            f["_required_input"] = bool(f.get("required")) and not f.get("calc_type")
+            f["_zero_is_empty"] = raw_dt != "bool"
+            if dt not in _DISPLAY_ONLY_TYPES and meta["name"][idx]:
+                meta["inputs_by_name"].setdefault(meta["name"][idx], []).append(idx)
+            if meta["name"][idx]:
+                meta["last_by_name"][meta["name"][idx]] = idx
+            if dt in meta["kind_idx"]:
+                meta["kind_idx"][dt].append(idx)
+                refs = meta["refs"][idx] if dt != "reference_cal_date" else meta["refs"][idx][:1]
+                for ref_name in refs:
+                    if ref_name:
+                        dependents = meta["deps"].setdefault(ref_name, [])
+                        if idx not in dependents:
+                            dependents.append(idx)
+        self._field_meta = meta
+
+        # group name ("" for header fields) -> fields in template order
+        self._fields_by_group = {}
+        for f in self.fields:
+            self._fields_by_group.setdefault(f["_group"], []).append(f)
+
+        # Groups containing at least one autofill field
+        self._autofill_groups = {f["_group"] for f in self.fields if f["_autofill"]}
+
+        # lower(name) / lower(label) -> unit; first field wins, as in a front-to-back scan
+        self._unit_by_ref = {}
+        for f in self.fields:
+            unit = (f.get("unit") or "").strip()
+            for key in (f.get("name") or "", f.get("label") or ""):
+                key = key.strip().lower()
+                if key:
+                    self._unit_by_ref.setdefault(key, unit)
+
+        # (slot, ref name, ref unit, "refN", "valN") for each calc_ref slot that is set, in slot order;
+        # a template reuses a few ref names across many fields, so each name's unit is resolved once
+        unit_of = {}
+        for f in self.fields:
+            for name in f["_ref_names"]:
+                if name and name not in unit_of:
+                    unit_of[name] = self._get_unit_for_ref(name)
+            f["_active_refs"] = tuple(
+                (i, name, unit_of[name], rk, vk)
+                for i, (name, rk, vk) in enumerate(zip(f["_ref_names"], _REF_KEYS, _VAL_KEYS, strict=True), 1)
+                if name
+            )
+            # The slots the field's equation reads (as refN or valN); only those need values at save time
+            used = set(f["_equation"].variables) if f["_equation"] is not None else None
+            f["_eq_refs"] = (
+                f["_active_refs"] if used is None
+                else tuple(ref for ref in f["_active_refs"] if ref[3] in used or ref[4] in used)
+            )
+
+        # Fields each save-time computation/tolerance pass applies to, in template order
+        buckets = {
+            "calc": [], "calc_tol": [], "custom_eq": [], "convert": [], "reference_cal_date": [],
+            "bool_tol": [], "other_tol": [], "tolerance": [],
+        }
+        for f in self.fields:
+            calc_type = f.get("calc_type")
+            raw_dt = f.get("data_type") or ""
+            if calc_type:
+                buckets["calc"].append(f)
+            if calc_type in _DIFF_CALC_TYPES:
+                buckets["calc_tol"].append(f)
+            elif calc_type == "CUSTOM_EQUATION":
+                buckets["custom_eq"].append(f)
+            if f["_dt"] in ("convert", "reference_cal_date", "tolerance"):
+                buckets[f["_dt"]].append(f)
+            if raw_dt == "bool" and f.get("tolerance_type") == "bool":
+                buckets["bool_tol"].append(f)
+            if not calc_type and raw_dt not in ("bool", "tolerance", "convert", "stat", "reference_cal_date"):
+                buckets["other_tol"].append(f)
+        self._field_buckets = buckets
+
+    @classmethod
+    def _signature_items(cls) -> list[tuple[str, str]]:
+        """(stem, filename) for each image in Signatures/. Cached until the directory's mtime changes."""
+        signatures_dir = Path("Signatures")
+        try:
+            key = (str(signatures_dir.resolve()), os.stat(signatures_dir).st_mtime_ns)
+        except OSError:
+            return []
+        items = cls._SIG_CACHE.get(key)
+        if items is None:
+            items = [
+                (file_path.stem, file_path.name)
+                for file_path in signatures_dir.iterdir()
+                if file_path.is_file() and file_path.suffix.lower() in cls._SIG_IMAGE_EXTENSIONS
+            ]
+            cls._SIG_CACHE.clear()
+            cls._SIG_CACHE[key] = items
+        return items
+
+    def _signature_model(self) -> QtGui.QStandardItemModel:
+        """
+        Item model shared by every signature combo on this form. It starts with just the blank
+        entry; the signature files are appended when the background scan of Signatures/ finishes.
+        """
+        if self._sig_model is None:
+            model = QtGui.QStandardItemModel(self)
+            item = QtGui.QStandardItem("")
+            item.setData(None, QtCore.Qt.UserRole)
+            model.appendRow(item)
+            self._sig_model = model
+            self._sig_text_index[""] = 0
+            task = _SignatureScanTask(self._signature_items)
+            task.signals.done.connect(self._on_signature_items, QtCore.Qt.QueuedConnection)
+            QtCore.QThreadPool.globalInstance().start(task)
+        return self._sig_model
+
+    def _on_signature_items(self, items):
+        """Fill the shared signature model and apply selections that were waiting for it."""
+        if self._sig_model is None or self._sig_loaded:
+            return
+        self._sig_loaded = True
+        row = self._sig_model.rowCount()
+        for text, data in items:
+            item = QtGui.QStandardItem(text)
+            item.setData(data, QtCore.Qt.UserRole)
+            self._sig_model.appendRow(item)
+            self._sig_data_index.setdefault(data, row)
+            self._sig_text_index.setdefault(text, row)
+            row += 1
+        pending, self._pending_sig_values = self._pending_sig_values, {}
+        for w, value in pending.items():
+            self._select_signature(w, value)
+
+    def _ensure_signature_items(self):
+        """Finish the signature scan synchronously if it is still running (e.g. saving right after open)."""
+        if self._sig_model is not None and not self._sig_loaded:
+            self._on_signature_items(self._signature_items())
+
+    def _select_signature(self, w: QtWidgets.QComboBox, value):
+        """Select value (a filename) in a signature combo, or remember it until the scan arrives."""
+        idx = self._sig_data_index.get(value, -1)
+        if idx >= 0:
+            w.setCurrentIndex(idx)
+        elif not self._sig_loaded:
+            self._pending_sig_values[w] = value
+
+    # ---- Field widget builders (dispatched by data_type in _create_field_widget) ----
+
+    def _mk_number(self, f):
+        w = QtWidgets.QLineEdit()
+        w.setPlaceholderText("Number")
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        return w
+
+    def _mk_bool(self, f):
+        w = QtWidgets.QWidget()
+        layout = QtWidgets.QHBoxLayout(w)
+        layout.setContentsMargins(0, 0, 0, 0)
+        pass_btn = QtWidgets.QRadioButton("Pass")
+        pass_btn.setObjectName("pass_btn")
+        fail_btn = QtWidgets.QRadioButton("Fail")
+        fail_btn.setObjectName("fail_btn")
+        btn_group = QtWidgets.QButtonGroup(w)
+        btn_group.addButton(pass_btn)
+        btn_group.addButton(fail_btn)
+        layout.addWidget(pass_btn)
+        layout.addWidget(fail_btn)
+        fail_btn.setChecked(True)
+        # Direct references so readers don't have to findChild() the buttons by name
+        w._pass_btn = pass_btn
+        w._fail_btn = fail_btn
+        return w
+
+    def _mk_date(self, f):
+        w = QtWidgets.QDateEdit(calendarPopup=True)
+        w.setDisplayFormat("yyyy-MM-dd")
+        w.setDate(QtCore.QDate.currentDate())
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        return w
+
+    def _mk_signature(self, f):
+        w = QtWidgets.QComboBox()
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        w.setModel(self._signature_model())
+        # The lookup dicts are shared (and filled in place) along with the model
+        w._data_index = self._sig_data_index
+        w._text_index = self._sig_text_index
+        default_sig = f.get("default_value")
+        if default_sig:
+            self._select_signature(w, default_sig)
+        return w
+
+    def _mk_reference(self, f):
+        w = QtWidgets.QLineEdit()
+        w.setPlaceholderText("Reference value")
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        ref_val = f.get("default_value") or ""
+        if ref_val:
+            w.setText(str(ref_val))
+        return w
+
+    def _mk_computed_display(self, f):
+        """Read-only display for tolerance, stat, convert, and reference_cal_date fields."""
+        w = QtWidgets.QLineEdit()
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        w.setReadOnly(True)
+        w.setPlaceholderText("—")
+        w.setText("—")
+        return w
+
+    def _mk_field_header(self, f):
+        w = QtWidgets.QLabel(f.get("label") or f.get("name") or "—")
+        font = w.font()
+        font.setBold(True)
+        font.setPointSize(font.pointSize() + 2)
+        w.setFont(font)
+        return w
+
+    def _mk_text(self, f):
+        w = QtWidgets.QLineEdit()
+        w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        return w
+
     def _create_field_widget(self, f):
-        data_type = f["data_type"]
-        w = None
-
-        if data_type == "number":
-            w = QtWidgets.QLineEdit()
-            w.setPlaceholderText("Number")
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-        elif data_type == "bool":
-            w = QtWidgets.QWidget()
-            layout = QtWidgets.QHBoxLayout(w)
-            layout.setContentsMargins(0, 0, 0, 0)
-            pass_btn = QtWidgets.QRadioButton("Pass")
-            pass_btn.setObjectName("pass_btn")
-            fail_btn = QtWidgets.QRadioButton("Fail")
-            fail_btn.setObjectName("fail_btn")
-            btn_group = QtWidgets.QButtonGroup(w)
-            btn_group.addButton(pass_btn)
-            btn_group.addButton(fail_btn)
-            layout.addWidget(pass_btn)
-            layout.addWidget(fail_btn)
-            fail_btn.setChecked(True)
-        elif data_type == "date" or data_type == "non_affected_date":
-            w = QtWidgets.QDateEdit(calendarPopup=True)
-            w.setDisplayFormat("yyyy-MM-dd")
-            w.setDate(QtCore.QDate.currentDate())
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-        elif data_type == "signature":
-            w = QtWidgets.QComboBox()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            w.addItem("", None)
-            from pathlib import Path
-            signatures_dir = Path("Signatures")
-            if signatures_dir.exists():
-                image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".bmp"}
-                for file_path in signatures_dir.iterdir():
-                    if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                        w.addItem(file_path.stem, file_path.name)
-            default_sig = f.get("default_value")
-            if default_sig:
-                idx = w.findData(default_sig)
-                if idx >= 0:
-                    w.setCurrentIndex(idx)
-        elif data_type == "reference":
-            w = QtWidgets.QLineEdit()
-            w.setPlaceholderText("Reference value")
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            ref_val = f.get("default_value") or ""
-            if ref_val:
-                w.setText(str(ref_val))
-        elif data_type == "tolerance":
-            w = QtWidgets.QLineEdit()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            w.setReadOnly(True)
-            w.setPlaceholderText("—")
-            w.setText("—")
-        elif data_type == "stat":
-            w = QtWidgets.QLineEdit()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            w.setReadOnly(True)
-            w.setPlaceholderText("—")
-            w.setText("—")
-        elif data_type == "convert":
-            w = QtWidgets.QLineEdit()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            w.setReadOnly(True)
-            w.setPlaceholderText("—")
-            w.setText("—")
-        elif data_type == "reference_cal_date":
-            w = QtWidgets.QLineEdit()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
-            w.setReadOnly(True)
-            w.setPlaceholderText("—")
-            w.setText("—")
-        elif data_type == "field_header":
-            w = QtWidgets.QLabel(f.get("label") or f.get("name") or "—")
-            font = w.font()
-            font.setBold(True)
-            font.setPointSize(font.pointSize() + 2)
-            w.setFont(font)
-        else:  # text / default
-            w = QtWidgets.QLineEdit()
-            w.setMinimumWidth(STANDARD_FIELD_WIDTH)
+        w = self._builders.get(f["data_type"], self._mk_text)(f)
 
         # Computed fields are read-only
         if f.get("calc_type"):
@@ -441,25 +1035,18 @@ class CalibrationFormDialog(QtWidgets.QDialog):
                 w.setReadOnly(True)
             elif isinstance(w, QtWidgets.QCheckBox):
                 w.setEnabled(False)
-            elif isinstance(w, QtWidgets.QWidget) and w.findChild(QtWidgets.QRadioButton, "pass_btn"):
+            elif getattr(w, "_pass_btn", None) is not None:
                 w.setEnabled(False)
             elif isinstance(w, QtWidgets.QDateEdit):
                 w.setReadOnly(True)
         
-        # Set up autofill connections for fields with autofill enabled
         return w
 
     def _get_unit_for_ref(self, ref_name: str) -> str:
         """Return the unit for the template field matching ref_name (by name or label)."""
         if not ref_name:
             return ""
-        ref_clean = (ref_name or "").strip().lower()
-        for f in self.fields:
-            fn = (f.get("name") or "").strip().lower()
-            fl = (f.get("label") or "").strip().lower()
-            if fn == ref_clean or fl == ref_clean:
-                return (f.get("unit") or "").strip()
-        return ""
+        return self._unit_by_ref.get(ref_name.strip().lower(), "")
 
     @staticmethod
     def _parse_numeric_stripping_unit(val_text, unit: str):
@@ -471,89 +1058,133 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             return None
         u = (unit or "").strip()
         if u:
-            if s.endswith(u):
-                s = s[:-len(u)].strip()
-            elif s.endswith(" " + u):
-                s = s[:-len(" " + u)].strip()
+            s = _unit_suffix_re(u).sub("", s, count=1)
         try:
             return float(s)
         except (TypeError, ValueError):
             return None
 
+    @staticmethod
+    def _input_widget_value(dt: str, w) -> str:
+        """Current value of an input widget, as text (bool -> "1"/"0", date -> yyyy-MM-dd)."""
+        if dt == "bool":
+            pass_btn = getattr(w, "_pass_btn", None)
+            return "1" if (pass_btn and pass_btn.isChecked()) else "0"
+        if dt == "date":
+            return w.date().toString("yyyy-MM-dd") if hasattr(w, "date") else ""
+        if dt == "signature" and isinstance(w, QtWidgets.QComboBox):
+            return w.currentData() or w.currentText() or ""
+        return (w.text() or "").strip() if hasattr(w, "text") else ""
+
     def _get_current_values_by_name(self) -> dict[str, str]:
         """Current form values by field name (from widgets). Excludes tolerance, convert, stat, reference_cal_date, and field_header (display-only)."""
         out = {}
-        for f in self.fields:
-            dt = f.get("data_type") or ""
-            if dt in ("tolerance", "convert", "stat", "reference_cal_date", "field_header"):
-                continue
-            fid = f["id"]
-            name = (f.get("name") or f.get("field_name") or "").strip()
-            if not name:
+        meta = self._field_meta
+        for fid, dt, name in zip(meta["ids"], meta["dt"], meta["name"], strict=True):
+            if dt in _DISPLAY_ONLY_TYPES or not name:
                 continue
             w = self.field_widgets.get(fid)
             if not w:
                 continue
-            if dt == "bool":
-                pass_btn = w.findChild(QtWidgets.QRadioButton, "pass_btn") if hasattr(w, "findChild") else None
-                out[name] = "1" if (pass_btn and pass_btn.isChecked()) else "0"
-            elif dt == "date":
-                out[name] = w.date().toString("yyyy-MM-dd") if hasattr(w, "date") else ""
-            elif dt == "signature" and isinstance(w, QtWidgets.QComboBox):
-                out[name] = w.currentData() or w.currentText() or ""
-            else:
-                out[name] = (w.text() or "").strip() if hasattr(w, "text") else ""
+            out[name] = self._input_widget_value(dt, w)
         return out
 
+    def _unbuilt_input_value(self, idx: int) -> str:
+        """Value input field idx will read once its page is built: the stored value, else the widget default."""
+        meta = self._field_meta
+        dt = meta["dt"][idx]
+        v = self._stored_values[0].get(meta["ids"][idx]) if self._stored_values is not None else None
+        val_text = v.get("value_text") if v else None
+        if dt == "bool":
+            return "1" if val_text == "1" or (val_text and str(val_text).lower() in ("true", "yes")) else "0"
+        if dt == "date":
+            d = QtCore.QDate.fromString(str(val_text or ""), QtCore.Qt.ISODate)
+            if not d.isValid():
+                d = self.date_edit.date() if hasattr(self, "date_edit") else QtCore.QDate.currentDate()
+            return d.toString("yyyy-MM-dd")
+        if not v and dt in ("reference", "signature"):
+            val_text = self.fields[idx].get("default_value")
+        return str(val_text or "").strip()
+
+    def _refresh_values_by_name(self, names):
+        """Re-read only the given names into self._values_by_name (the last field with a name wins).
+
+        Fields on pages not built yet contribute the value they will show once built, so computed
+        fields on the current page see the same inputs as when every page was built up front.
+        """
+        meta = self._field_meta
+        for name in names:
+            value = None
+            for idx in meta["inputs_by_name"].get(name, ()):
+                w = self.field_widgets.get(meta["ids"][idx])
+                if w:
+                    value = self._input_widget_value(meta["dt"][idx], w)
+                else:
+                    value = self._unbuilt_input_value(idx)
+            if value is None:
+                self._values_by_name.pop(name, None)
+            else:
+                self._values_by_name[name] = value
+
     def _update_convert_fields(self):
         """Update read-only convert field widgets from current input values and equations."""
-        try:
-            from tolerance_service import evaluate_tolerance_equation, format_calculation_display
-        except ImportError:
+        self._update_computed_fields("convert")
+
+    def _update_computed_fields(self, kind: str, only: set[int] | None = None):
+        """
+        Recompute read-only convert/stat widgets (kind) from current input values and equations.
+        only: restrict to these field indices (from the dependency map); None = all of this kind.
+        """
+        if evaluate_tolerance_equation is None:
             return
-        values_by_name = self._get_current_values_by_name()
-        for f in self.fields:
-            if (f.get("data_type") or "").strip().lower() != "convert":
-                continue
-            eq = (f.get("tolerance_equation") or "").strip()
+        meta = self._field_meta
+        indices = meta["kind_idx"][kind]
+        if only is not None:
+            indices = [idx for idx in indices if idx in only]
+        if not indices:
+            return
+        values_by_name = self._values_by_name
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        for idx in indices:
+            eq = meta["eq"][idx]
             if not eq:
                 continue
-            fid = f["id"]
-            w = self.field_widgets.get(fid)
+            w = self.field_widgets.get(meta["ids"][idx])
             if not w or not hasattr(w, "setText"):
                 continue
-            vars_map = {"nominal": 0.0, "reading": 0.0}
-            for i in range(1, 13):
-                ref_name = f.get(f"calc_ref{i}_name")
-                if ref_name and ref_name in values_by_name:
-                    v = values_by_name.get(ref_name)
-                    if v not in (None, ""):
-                        unit = self._get_unit_for_ref(ref_name)
-                        num = self._parse_numeric_stripping_unit(v, unit)
-                        if num is not None:
-                            vars_map[f"ref{i}"] = num
-                            vars_map[f"val{i}"] = num
+            vars_map.clear()
+            vars_map["nominal"] = 0.0
+            vars_map["reading"] = 0.0
+            for _i, ref_name, unit, rk, vk in self.fields[idx]["_eq_refs"]:
+                v = values_by_name.get(ref_name)
+                if v not in (None, ""):
+                    num = self._parse_numeric_stripping_unit(v, unit)
+                    if num is not None:
+                        vars_map[rk] = num
+                        vars_map[vk] = num
             try:
-                result = evaluate_tolerance_equation(eq, vars_map)
-                decimals = max(0, min(4, int(f.get("sig_figs") or 3)))
-                w.setText(format_calculation_display(result, decimal_places=decimals))
+                result = _eval_cached(eq, tuple(sorted(vars_map.items())))
+                w.setText(_format_cached(result, meta["decimals"][idx]))
             except (ValueError, TypeError):
                 w.setText("—")
 
-    def _update_reference_cal_date_fields(self):
+    def _update_reference_cal_date_fields(self, only: set[int] | None = None):
         """Update reference_cal_date widgets: look up instrument by ref1 value, display last_cal_date."""
-        values_by_name = self._get_current_values_by_name()
-        for f in self.fields:
-            if (f.get("data_type") or "").strip().lower() != "reference_cal_date":
-                continue
-            ref1_name = f.get("calc_ref1_name")
-            if not ref1_name or ref1_name not in values_by_name:
+        meta = self._field_meta
+        indices = meta["kind_idx"]["reference_cal_date"]
+        if only is not None:
+            indices = [idx for idx in indices if idx in only]
+        if not indices:
+            return
+        values_by_name = self._values_by_name
+        for idx in indices:
+            ref1_name = meta["refs"][idx][0]
+            if not ref1_name:
                 continue
             id_or_tag = (values_by_name.get(ref1_name) or "").strip()
             if not id_or_tag:
                 continue
-            fid = f["id"]
-            w = self.field_widgets.get(fid)
+            w = self.field_widgets.get(meta["ids"][idx])
             if not w or not hasattr(w, "setText"):
                 continue
             try:
@@ -567,235 +1198,144 @@ class CalibrationFormDialog(QtWidgets.QDialog):
 
     def _update_stat_fields(self):
         """Update read-only stat field widgets from current input values and equations."""
-        try:
-            from tolerance_service import evaluate_tolerance_equation, format_calculation_display
-        except ImportError:
+        self._update_computed_fields("stat")
+
+    def _recalculate_computed_fields(self):
+        """Refresh computed (convert, stat, reference_cal_date) widgets that depend on edited inputs."""
+        deps = self._field_meta["deps"]
+        only = set()
+        for name in self._dirty_names:
+            only.update(deps.get(name, ()))
+        self._refresh_values_by_name(self._dirty_names)
+        self._dirty_names.clear()
+        if not only:
             return
-        values_by_name = self._get_current_values_by_name()
-        for f in self.fields:
-            if (f.get("data_type") or "").strip().lower() != "stat":
-                continue
-            eq = (f.get("tolerance_equation") or "").strip()
-            if not eq:
-                continue
-            fid = f["id"]
-            w = self.field_widgets.get(fid)
-            if not w or not hasattr(w, "setText"):
-                continue
-            vars_map = {"nominal": 0.0, "reading": 0.0}
-            for i in range(1, 13):
-                ref_name = f.get(f"calc_ref{i}_name")
-                if ref_name and ref_name in values_by_name:
-                    v = values_by_name.get(ref_name)
-                    if v not in (None, ""):
-                        unit = self._get_unit_for_ref(ref_name)
-                        num = self._parse_numeric_stripping_unit(v, unit)
-                        if num is not None:
-                            vars_map[f"ref{i}"] = num
-                            vars_map[f"val{i}"] = num
-            try:
-                result = evaluate_tolerance_equation(eq, vars_map)
-                decimals = max(0, min(4, int(f.get("sig_figs") or 3)))
-                w.setText(format_calculation_display(result, decimal_places=decimals))
-            except (ValueError, TypeError):
-                w.setText("—")
-
-    def _connect_convert_updates(self):
-        """Connect input widgets so convert, stat, and reference_cal_date fields update when user types."""
-        def schedule_update():
-            QtCore.QTimer.singleShot(0, lambda: (
-                self._update_convert_fields(),
-                self._update_stat_fields(),
-                self._update_reference_cal_date_fields(),
-            ))
-
-        for f in self.fields:
+        self._update_computed_fields("convert", only)
+        self._update_computed_fields("stat", only)
+        self._update_reference_cal_date_fields(only)
+
+    def _schedule_full_recalc(self):
+        """Queue a recompute of every computed field (e.g. after loading stored values)."""
+        self._dirty_names.update(self._field_meta["deps"])
+        self._recalc_timer.start()
+
+    def _schedule_recalc(self, name: str, *_):
+        """Slot for input-widget change signals; marks name dirty and (re)starts the recalc timer."""
+        self._dirty_names.add(name)
+        self._recalc_timer.start()
+
+    def _connect_convert_updates(self, fields=None):
+        """Connect input widgets so convert, stat, and reference_cal_date fields update when user types.
+        Only inputs that some computed field references are connected. fields: subset to connect (default all)."""
+        deps = self._field_meta["deps"]
+        for f in (self.fields if fields is None else fields):
             dt = f.get("data_type") or ""
             if dt in ("tolerance", "convert", "stat", "reference_cal_date"):
                 continue
+            name = (f.get("name") or f.get("field_name") or "").strip()
+            if name not in deps:
+                continue
             fid = f["id"]
             w = self.field_widgets.get(fid)
             if not w:
                 continue
+            slot = functools.partial(self._schedule_recalc, name)
             if dt == "bool":
-                pass_btn = w.findChild(QtWidgets.QRadioButton, "pass_btn") if hasattr(w, "findChild") else None
-                fail_btn = w.findChild(QtWidgets.QRadioButton, "fail_btn") if hasattr(w, "findChild") else None
+                pass_btn = getattr(w, "_pass_btn", None)
+                fail_btn = getattr(w, "_fail_btn", None)
                 if pass_btn:
-                    pass_btn.toggled.connect(schedule_update)
+                    pass_btn.toggled.connect(slot)
                 if fail_btn:
-                    fail_btn.toggled.connect(schedule_update)
+                    fail_btn.toggled.connect(slot)
             elif dt == "date" and hasattr(w, "dateChanged"):
-                w.dateChanged.connect(schedule_update)
+                w.dateChanged.connect(slot)
             elif dt == "signature" and isinstance(w, QtWidgets.QComboBox):
-                w.currentIndexChanged.connect(schedule_update)
+                w.currentIndexChanged.connect(slot)
             elif hasattr(w, "textChanged"):
-                w.textChanged.connect(schedule_update)
+                w.textChanged.connect(slot)
     
     def _apply_autofill_to_current_group(self):
         """Apply autofill values from the previous group to the currently visible group."""
         # Only apply autofill if we're not on the first group (need a previous group to autofill from)
         if self.current_group_index == 0:
             return
-        
+
         # Get all fields in the previous group that have autofill enabled
         if not self.group_names or len(self.group_names) == 0:
             return
-        
+
         # Find fields in the previous group (the one we just came from)
         prev_group_index = self.current_group_index - 1
         if prev_group_index < 0 or prev_group_index >= len(self.group_names):
             return
-        
+
         prev_group_name = self.group_names[prev_group_index]
-        prev_group_fields = [f for f in self.fields if (f.get("group_name") or "") == prev_group_name]
-        
+        prev_group_fields = self._fields_by_group.get(prev_group_name, [])
+
         # Get current group name
         current_group_name = ""
         if self.group_names and self.current_group_index < len(self.group_names):
             current_group_name = self.group_names[self.current_group_index]
-        
+
         # Find fields in the current group
-        current_group_fields = [f for f in self.fields if (f.get("group_name") or "") == current_group_name]
-        
-        # For each autofill-enabled field in the CURRENT group, get its value from matching fields in PREVIOUS group
-        # This is more intuitive: enable autofill on the field you want to auto-fill
-        for current_field in current_group_fields:
-            # Check autofill flag - handle both int (0/1) and bool (False/True) and string ("0"/"1")
-            autofill_flag = current_field.get("autofill_from_first_group")
-            
-            # Convert to boolean: 1, True, "1" = True; 0, False, "0", None = False
-            try:
-                is_autofill = bool(int(autofill_flag)) if autofill_flag is not None else False
-            except (ValueError, TypeError):
-                is_autofill = bool(autofill_flag) if autofill_flag else False
-            
-            if not is_autofill:
-                continue
-            
-            current_field_id = current_field["id"]
-            if current_field_id not in self.field_widgets:
-                continue
-            
-            current_widget = self.field_widgets[current_field_id]
-            current_data_type = current_field.get("data_type", "text")
-            
-            # Find matching field in the previous group by name or label
-            # Try to match by label first (more user-friendly), then by base name (without numeric suffix)
-            current_field_name_full = current_field.get("name") or ""
-            current_field_label = current_field.get("label") or ""
-            
-            if not current_field_name_full and not current_field_label:
-                continue
-            
-            # Extract base name by removing trailing numbers (e.g., "date_2" -> "date", "digital_sig_1" -> "digital_sig")
-            import re
-            current_base_name = re.sub(r'_\d+$', '', current_field_name_full) if current_field_name_full else ""
-            
-            matched = False
-            for prev_field in prev_group_fields:
-                prev_field_name = prev_field.get("name") or ""
-                prev_field_label = prev_field.get("label") or ""
-                prev_base_name = re.sub(r'_\d+$', '', prev_field_name) if prev_field_name else ""
-                
-                # Match by label first (exact match), then by base name (without suffix)
-                match_by_label = prev_field_label and current_field_label and prev_field_label.strip().lower() == current_field_label.strip().lower()
-                match_by_base_name = prev_base_name and current_base_name and prev_base_name.strip().lower() == current_base_name.strip().lower()
-                
-                if match_by_label or match_by_base_name:
-                    matched = True
-                    prev_field_id = prev_field["id"]
-                    if prev_field_id not in self.field_widgets:
+        current_group_fields = self._fields_by_group.get(current_group_name, [])
+
+        # Index the previous group once by normalized label and base name (positions in group order),
+        # so a current field tries its matches front to back, as a scan of the group would
+        prev_by_label = {}
+        prev_by_base = {}
+        for pos, prev_field in enumerate(prev_group_fields):
+            if prev_field["_label_norm"]:
+                prev_by_label.setdefault(prev_field["_label_norm"], []).append(pos)
+            if prev_field["_base_name"]:
+                prev_by_base.setdefault(prev_field["_base_name"], []).append(pos)
+
+        # Deliver any posted events (e.g. a pending edit on the previous group's widgets) once, up front,
+        # rather than re-entering the event loop for every matched field
+        QtWidgets.QApplication.sendPostedEvents(None, 0)
+
+        # No intermediate paints while fields are written; re-enabling updates schedules the
+        # single repaint of the page (setUpdatesEnabled(True) implies update())
+        current_page = self.stack.currentWidget()
+        if current_page:
+            current_page.setUpdatesEnabled(False)
+        try:
+            # For each autofill-enabled field in the CURRENT group, get its value from matching fields in PREVIOUS group
+            # This is more intuitive: enable autofill on the field you want to auto-fill
+            for current_field in current_group_fields:
+                if not current_field["_autofill"]:
+                    continue
+
+                current_field_id = current_field["id"]
+                if current_field_id not in self.field_widgets:
+                    continue
+
+                current_widget = self.field_widgets[current_field_id]
+
+                # Find matching field in the previous group by label or by base name, i.e. the name
+                # without its numeric suffix (e.g., "date_2" -> "date", "digital_sig_1" -> "digital_sig")
+                matches = set(prev_by_label.get(current_field["_label_norm"], ()))
+                matches.update(prev_by_base.get(current_field["_base_name"], ()))
+                for pos in sorted(matches):
+                    prev_widget = self.field_widgets.get(prev_group_fields[pos]["id"])
+                    if prev_widget is None:
                         continue
-                    
-                    # Get the current value from the previous group's widget
-                    prev_widget = self.field_widgets[prev_field_id]
-                    
-                    # Force widget to process any pending events to ensure value is committed
-                    QtWidgets.QApplication.processEvents()
-                    
-                    value = None
-                    
-                    if isinstance(prev_widget, QtWidgets.QLineEdit):
-                        value = prev_widget.text()
-                    elif isinstance(prev_widget, QtWidgets.QCheckBox):
-                        value = "1" if prev_widget.isChecked() else "0"
-                    elif isinstance(prev_widget, QtWidgets.QWidget):
-                        p = prev_widget.findChild(QtWidgets.QRadioButton, "pass_btn")
-                        if p is not None:
-                            value = "1" if p.isChecked() else "0"
-                    elif isinstance(prev_widget, QtWidgets.QDateEdit):
-                        value = prev_widget.date().toString("yyyy-MM-dd")
-                    elif isinstance(prev_widget, QtWidgets.QComboBox):
-                        value = prev_widget.currentData() or ""
-                        # Also try currentText if currentData is empty
-                        if not value:
-                            value = prev_widget.currentText()
-                    
-                    # Skip only if value is None (not if it's empty string, as empty might be valid)
+
+                    # Read from the previous group's widget and write into the current one (see _READERS/_WRITERS)
+                    value = _READERS.get(type(prev_widget), _read_radio_container)(prev_widget)
+
+                    # Skip only if value is None (e.g. a field_header label), not if it's empty string,
+                    # as empty might be valid; the next match may still have a value
                     if value is None:
                         continue
-                    
-                    # Apply the value, blocking signals to prevent recursive updates
-                    if isinstance(current_widget, QtWidgets.QLineEdit):
-                        current_widget.blockSignals(True)
-                        current_widget.setText(value)
-                        current_widget.blockSignals(False)
-                        current_widget.update()
-                        current_widget.repaint()
-                    elif isinstance(current_widget, QtWidgets.QCheckBox):
-                        current_widget.blockSignals(True)
-                        current_widget.setChecked(value == "1" or (value and value.lower() == "true"))
-                        current_widget.blockSignals(False)
-                        current_widget.update()
-                        current_widget.repaint()
-                    elif isinstance(current_widget, QtWidgets.QWidget):
-                        p = current_widget.findChild(QtWidgets.QRadioButton, "pass_btn")
-                        if p is not None:
-                            current_widget.blockSignals(True)
-                            is_pass = value == "1" or (value and str(value).lower() in ("true", "yes"))
-                            p.setChecked(is_pass)
-                            f = current_widget.findChild(QtWidgets.QRadioButton, "fail_btn")
-                            if f:
-                                f.setChecked(not is_pass)
-                            current_widget.blockSignals(False)
-                            current_widget.update()
-                            current_widget.repaint()
-                    elif isinstance(current_widget, QtWidgets.QDateEdit):
-                        current_widget.blockSignals(True)
-                        try:
-                            date = QtCore.QDate.fromString(value, "yyyy-MM-dd")
-                            if date.isValid():
-                                current_widget.setDate(date)
-                        except Exception:
-                            pass
-                        current_widget.blockSignals(False)
-                        current_widget.update()
-                        current_widget.repaint()
-                    elif isinstance(current_widget, QtWidgets.QComboBox):
-                        current_widget.blockSignals(True)
-                        # For combo boxes, try to match by data first, then by text
-                        if current_data_type == "signature":
-                            idx = current_widget.findData(value)
-                            if idx < 0:
-                                idx = current_widget.findText(value)
-                            if idx >= 0:
-                                current_widget.setCurrentIndex(idx)
-                        else:
-                            # For other combo boxes, match by text
-                            idx = current_widget.findText(value)
-                            if idx >= 0:
-                                current_widget.setCurrentIndex(idx)
-                        current_widget.blockSignals(False)
-                        current_widget.update()
-                        current_widget.repaint()
+
+                    _WRITERS.get(type(current_widget), _write_radio_container)(current_widget, value, current_field)
+                    # Signals were blocked above; queue dependents of this field explicitly
+                    self._schedule_recalc(self._field_meta["name"][self._field_meta["pos"][current_field_id]])
                     break  # Found matching field, move to next current group field
-        
-        # Force UI update after all autofill operations
-        QtWidgets.QApplication.processEvents()
-        current_page = self.stack.currentWidget()
-        if current_page:
-            current_page.update()
-            current_page.repaint()
+        finally:
+            if current_page:
+                current_page.setUpdatesEnabled(True)
 
     def _update_group_nav(self):
         count = self.stack.count()
@@ -810,19 +1350,22 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         if self.current_group_index > count - 1:
             self.current_group_index = count - 1
 
+        self._materialize_page(self.current_group_index)
         self.stack.setCurrentIndex(self.current_group_index)
-        # Force update and repaint to ensure the new page is visible
+        # Schedule an update so the new page is painted on the next event-loop pass
         current_widget = self.stack.currentWidget()
         if current_widget:
             current_widget.show()
             current_widget.update()
-            current_widget.repaint()
         self.stack.update()
-        self.stack.repaint()
         
-        # Apply autofill values from previous group to current group
-        # Use QTimer to ensure the new page is fully visible before applying autofill
-        QtCore.QTimer.singleShot(10, self._apply_autofill_to_current_group)
+        # Apply autofill values from previous group to current group (only groups that have autofill fields)
+        # once the new page is visible; rapid navigation restarts the timer instead of queueing passes
+        if (self.current_group_index > 0 and self.current_group_index < len(self.group_names)
+                and self.group_names[self.current_group_index] in self._autofill_groups):
+            self._autofill_timer.start()
+        else:
+            self._autofill_timer.stop()
         
         self.prev_btn.setEnabled(self.current_group_index > 0)
         self.next_btn.setEnabled(self.current_group_index < count - 1)
@@ -883,11 +1426,9 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         self._build_performed_by_combo()
 
         # Fill metadata
-        try:
-            d = datetime.strptime(rec["cal_date"], "%Y-%m-%d").date()
-            self.date_edit.setDate(QtCore.QDate(d.year, d.month, d.day))
-        except Exception:
-            pass
+        d = QtCore.QDate.fromString(rec.get("cal_date") or "", QtCore.Qt.ISODate)
+        if d.isValid():
+            self.date_edit.setDate(d)
 
         performed_by = rec.get("performed_by") or ""
         idx = self.performed_combo.findText(performed_by)
@@ -912,92 +1453,17 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             self.template_notes_label.show()
             self.template_notes_display.show()
 
-        # Fill field values
+        # Fill field values (pages built later load theirs in _materialize_page)
         vals = self.repo.get_calibration_values(self.record_id)
         by_field = {v["field_id"]: v for v in vals}
         values_by_name = {v.get("field_name"): v.get("value_text") for v in vals}
-        for f in self.fields:
-            fid = f["id"]
-            w = self.field_widgets.get(fid)
-            if not w:
-                continue
-            dt = f["data_type"]
-            if dt == "field_header":
-                continue
-            v = by_field.get(fid)
-            if not v:
-                continue
-            val_text = v.get("value_text")
-            if dt == "bool":
-                pass_btn = w.findChild(QtWidgets.QRadioButton, "pass_btn") if hasattr(w, "findChild") else None
-                fail_btn = w.findChild(QtWidgets.QRadioButton, "fail_btn") if hasattr(w, "findChild") else None
-                if pass_btn and fail_btn:
-                    is_pass = val_text == "1" or (val_text and str(val_text).lower() in ("true", "yes"))
-                    pass_btn.setChecked(is_pass)
-                    fail_btn.setChecked(not is_pass)
-            elif dt in ("date", "non_affected_date"):
-                try:
-                    d = datetime.strptime(val_text, "%Y-%m-%d").date()
-                    w.setDate(QtCore.QDate(d.year, d.month, d.day))
-                except Exception:
-                    pass
-            elif dt == "signature":
-                # For signature combobox, find by data (filename)
-                if isinstance(w, QtWidgets.QComboBox):
-                    idx = w.findData(val_text)
-                    if idx >= 0:
-                        w.setCurrentIndex(idx)
-            else:
-                w.setText(val_text or "")
-
-        # For equation-tolerance fields, show "lhs op rhs, PASS/FAIL" in the template form
-        try:
-            from tolerance_service import equation_tolerance_display
-            for f in self.fields:
-                fid = f["id"]
-                w = self.field_widgets.get(fid)
-                if not w or not hasattr(w, "setText"):
-                    continue
-                v = by_field.get(fid)
-                if not v:
-                    continue
-                tol_type = (f.get("tolerance_type") or "").lower()
-                if tol_type != "equation" or not f.get("tolerance_equation"):
-                    continue
-                nominal = 0.0
-                nominal_str = f.get("nominal_value")
-                if nominal_str not in (None, ""):
-                    try:
-                        nominal = float(str(nominal_str).strip())
-                    except (TypeError, ValueError):
-                        pass
-                reading = 0.0
-                val_text = v.get("value_text")
-                if val_text not in (None, ""):
-                    try:
-                        reading = float(str(val_text).strip())
-                    except (TypeError, ValueError):
-                        pass
-                vars_map = {"nominal": nominal, "reading": reading}
-                for i in range(1, 6):
-                    ref_name = f.get(f"calc_ref{i}_name")
-                    if ref_name and ref_name in values_by_name:
-                        try:
-                            vars_map[f"ref{i}"] = float(values_by_name[ref_name] or 0)
-                        except (TypeError, ValueError):
-                            vars_map[f"ref{i}"] = 0.0
-                parts = equation_tolerance_display(f.get("tolerance_equation"), vars_map)
-                if parts is not None:
-                    lhs, op_str, rhs, pass_ = parts
-                    from tolerance_service import format_calculation_display
-                    _dec = max(0, min(4, int(f.get("sig_figs") or 3)))
-                    w.setText(f"{format_calculation_display(lhs, decimal_places=_dec)} {op_str} {format_calculation_display(rhs, decimal_places=_dec)}, {'PASS' if pass_ else 'FAIL'}")
-        except ImportError:
-            pass
-        # One-time display for tolerance-type (data_type) fields from stored values
-        self._populate_tolerance_field_displays_from_values(values_by_name)
+        self._stored_values = (by_field, values_by_name)
+        self._load_stored_values([f for f in self.fields if f["id"] in self.field_widgets])
+        self._schedule_full_recalc()
 
     def accept(self):
+        if self._saving:
+            return
         if not self.template:
             super().reject()
             return
@@ -1013,56 +1479,145 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         field_values = self._collect_field_values()
         if field_values is None:
             return
-        values_by_name = {}
-        for f in self.fields:
-            name = (f.get("name") or f.get("field_name") or "").strip()
-            if name:
-                values_by_name[name] = field_values.get(f["id"])
-
-        self._apply_computations(field_values, values_by_name)
-        # Rebuild values_by_name after computations (computed values now in field_values)
-        for f in self.fields:
-            name = (f.get("name") or f.get("field_name") or "").strip()
+        meta = self._field_meta
+        values_by_name = _ValuesTable()
+        for fid, name in zip(meta["ids"], meta["name"], strict=True):
             if name:
-                values_by_name[name] = field_values.get(f["id"])
+                values_by_name[name] = field_values.get(fid)
+
+        computed = self._apply_computations(field_values, values_by_name)
+        # Computed values are now in field_values; carry them into values_by_name for the tolerance checks
+        # (a name shared by several fields keeps the value of the last one, as when the table was built)
+        for fid, val in computed.items():
+            idx = meta["pos"][fid]
+            name = meta["name"][idx]
+            if name and meta["last_by_name"][name] == idx:
+                values_by_name[name] = val
         any_out_of_tol, _ = self._check_tolerance_pass_fail(field_values, values_by_name, "PASS")
         result = "FAIL" if any_out_of_tol else "PASS"
 
         ok_btn = self.btn_box.button(QtWidgets.QDialogButtonBox.Ok)
         if ok_btn:
             ok_btn.setEnabled(False)
+        self._saving = True
+        task = _SaveRecordTask(
+            lambda repo: self._save_calibration_record(cal_date, performed_by, result, notes, field_values, repo=repo),
+            self._record_db_path(),
+        )
+        task.signals.done.connect(self._on_record_saved, QtCore.Qt.QueuedConnection)
+        if task.db_path is None:
+            task.run()  # no database file to open a second connection on; write on this thread
+        else:
+            QtCore.QThreadPool.globalInstance().start(task)
+
+    def _record_db_path(self) -> Path | None:
+        """The server database file self.repo is connected to, or None (e.g. an in-memory database)."""
+        try:
+            row = self.repo.conn.execute("PRAGMA database_list").fetchone()
+        except (AttributeError, sqlite3.Error):
+            return None
+        if not row or not row[2]:
+            return None
+        db_path = get_effective_db_path()
         try:
-            self._save_calibration_record(cal_date, performed_by, result, notes, field_values)
-        except StaleDataError as e:
+            return db_path if Path(row[2]).resolve() == db_path.resolve() else None
+        except OSError:
+            return None
+
+    def _on_record_saved(self, error):
+        """Finish accept() once _SaveRecordTask is done: brief 'Saved!' feedback, or report the error."""
+        self._saving = False
+        ok_btn = self.btn_box.button(QtWidgets.QDialogButtonBox.Ok)
+        if isinstance(error, StaleDataError):
             if ok_btn:
                 ok_btn.setEnabled(True)
-            logger.warning("Calibration save failed (stale data): record_id=%s instrument_id=%s: %s", self.record_id, getattr(self, "instrument_id", None), e)
+            logger.warning("Calibration save failed (stale data): record_id=%s instrument_id=%s: %s", self.record_id, getattr(self, "instrument_id", None), error)
             QtWidgets.QMessageBox.warning(
                 self,
                 "Save failed",
-                str(e) + "\n\nClose this dialog, refresh the history, and try again.",
+                str(error) + "\n\nClose this dialog, refresh the history, and try again.",
             )
             return
-        except Exception as e:
+        if error is not None:
             if ok_btn:
                 ok_btn.setEnabled(True)
-            logger.warning("Calibration save failed: record_id=%s instrument_id=%s: %s", self.record_id, getattr(self, "instrument_id", None), e, exc_info=True)
-            QtWidgets.QMessageBox.critical(self, "Error saving calibration", str(e))
+            logger.warning("Calibration save failed: record_id=%s instrument_id=%s: %s", self.record_id, getattr(self, "instrument_id", None), error, exc_info=error)
+            QtWidgets.QMessageBox.critical(self, "Error saving calibration", str(error))
             return
 
         if ok_btn:
             ok_btn.setText("Saved!")
         QtCore.QTimer.singleShot(400, self._finish_accept)
 
-    def _populate_tolerance_field_displays_from_values(self, values_by_name: dict):
-        """One-time: set read-only tolerance/stat field widgets from values_by_name (e.g. from DB when editing)."""
-        try:
-            from tolerance_service import equation_tolerance_display, list_variables, format_calculation_display, evaluate_tolerance_equation
-        except ImportError:
+    def _load_stored_values(self, fields):
+        """Fill the (already built) widgets of fields from the record being edited."""
+        by_field, values_by_name = self._stored_values
+        for f in fields:
+            fid = f["id"]
+            w = self.field_widgets.get(fid)
+            if not w:
+                continue
+            dt = f["data_type"]
+            if dt == "field_header":
+                continue
+            v = by_field.get(fid)
+            if not v:
+                continue
+            val_text = v.get("value_text")
+            if dt == "bool":
+                pass_btn = getattr(w, "_pass_btn", None)
+                fail_btn = getattr(w, "_fail_btn", None)
+                if pass_btn and fail_btn:
+                    is_pass = val_text == "1" or (val_text and str(val_text).lower() in ("true", "yes"))
+                    pass_btn.setChecked(is_pass)
+                    fail_btn.setChecked(not is_pass)
+            elif dt in ("date", "non_affected_date"):
+                d = QtCore.QDate.fromString(str(val_text or ""), QtCore.Qt.ISODate)
+                if d.isValid():
+                    w.setDate(d)
+            elif dt == "signature":
+                # For signature combobox, find by data (filename)
+                if isinstance(w, QtWidgets.QComboBox):
+                    self._select_signature(w, val_text)
+            else:
+                w.setText(val_text or "")
+
+            # For equation-tolerance fields, show "lhs op rhs, PASS/FAIL" in the template form
+            if f["_eq_tol"] and hasattr(w, "setText"):
+                self._show_equation_tolerance(f, w, val_text, values_by_name)
+
+        # One-time display for tolerance-type (data_type) fields from stored values
+        self._populate_tolerance_field_displays_from_values(values_by_name, fields)
+
+    def _show_equation_tolerance(self, f, w, val_text, values_by_name):
+        """Set w to "lhs op rhs, PASS/FAIL" for an equation-tolerance field's stored reading."""
+        nominal = f["_nominal"]
+        reading = _to_float(val_text)
+        if reading is None:
+            reading = 0.0
+        vars_map = {"nominal": nominal, "reading": reading}
+        for i, ref_name, _unit, rk, _vk in f["_eq_refs"]:
+            if i > 5:
+                break
+            v = values_by_name.get(ref_name, _MISSING)
+            if v is not _MISSING:
+                try:
+                    vars_map[rk] = float(v or 0)
+                except (TypeError, ValueError):
+                    vars_map[rk] = 0.0
+        parts = f["_tol_eval"](vars_map)
+        if parts is not None:
+            lhs, op_str, rhs, pass_ = parts
+            _dec = f["_decimals"]
+            w.setText(f"{format_calculation_display(lhs, decimal_places=_dec)} {op_str} {format_calculation_display(rhs, decimal_places=_dec)}, {'PASS' if pass_ else 'FAIL'}")
+
+    def _populate_tolerance_field_displays_from_values(self, values_by_name: dict, fields=None):
+        """One-time: set read-only tolerance/stat field widgets from values_by_name (e.g. from DB when editing).
+        fields: subset to populate (default all)."""
+        if format_calculation_display is None:
             return
-        for f in self.fields:
-            dt = (f.get("data_type") or "").strip().lower()
-            if dt not in ("tolerance", "stat"):
+        for f in (self.fields if fields is None else fields):
+            if f["_dt"] not in ("tolerance", "stat"):
                 continue
             fid = f["id"]
             w = self.field_widgets.get(fid)
@@ -1072,44 +1627,32 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             if not eq:
                 w.setText("—")
                 continue
-            nominal = 0.0
-            nominal_str = f.get("nominal_value")
-            if nominal_str not in (None, ""):
-                try:
-                    nominal = float(str(nominal_str).strip())
-                except (TypeError, ValueError):
-                    pass
+            nominal = f["_nominal"]
             vars_map = {"nominal": nominal, "reading": 0.0}
-            for i in range(1, 13):
-                ref_name = f.get(f"calc_ref{i}_name")
-                if ref_name and ref_name in values_by_name and values_by_name.get(ref_name) not in (None, ""):
-                    try:
-                        vars_map[f"ref{i}"] = float(str(values_by_name[ref_name]).strip())
-                    except (TypeError, ValueError):
-                        pass
-            if "reading" in list_variables(eq):
+            for _i, ref_name, _unit, rk, _vk in f["_eq_refs"]:
+                num = _to_float(values_by_name.get(ref_name))
+                if num is not None:
+                    vars_map[rk] = num
+            if "reading" in f["_equation"].variables:
                 ref1 = f.get("calc_ref1_name")
-                if ref1 and ref1 in values_by_name and values_by_name.get(ref1) not in (None, ""):
-                    try:
-                        vars_map["reading"] = float(str(values_by_name[ref1]).strip())
-                    except (TypeError, ValueError):
-                        pass
-            from tolerance_service import _ensure_val_aliases
+                num = _to_float(values_by_name.get(ref1)) if ref1 else None
+                if num is not None:
+                    vars_map["reading"] = num
             vars_map = _ensure_val_aliases(vars_map)
-            required_vars = list_variables(eq)
+            required_vars = f["_equation"].variables
             if any(var not in vars_map for var in required_vars):
                 w.setText("—")
                 continue
             try:
-                if dt == "stat":
-                    result = evaluate_tolerance_equation(eq, vars_map)
-                    _dec = max(0, min(4, int(f.get("sig_figs") or 3)))
+                if f["_dt"] == "stat":
+                    result = f["_equation"].evaluate(vars_map)
+                    _dec = f["_decimals"]
                     w.setText(format_calculation_display(result, decimal_places=_dec))
                 else:
-                    parts = equation_tolerance_display(eq, vars_map)
+                    parts = f["_tol_eval"](vars_map)
                     if parts is not None:
                         lhs, op_str, rhs, pass_ = parts
-                        _dec = max(0, min(4, int(f.get("sig_figs") or 3)))
+                        _dec = f["_decimals"]
                         w.setText(f"{format_calculation_display(lhs, decimal_places=_dec)} {op_str} {format_calculation_display(rhs, decimal_places=_dec)}, {'PASS' if pass_ else 'FAIL'}")
                     else:
                         w.setText("—")
@@ -1118,35 +1661,22 @@ class CalibrationFormDialog(QtWidgets.QDialog):
 
     def _collect_field_values(self) -> dict[int, str] | None:
         """Collect user-entered values from widgets. Returns None if validation fails. Skips tolerance-, convert-, and reference_cal_date-type (computed) fields."""
+        self._materialize_all_pages()  # unvisited pages still hold their defaults (or stored values) and must be saved too
+        self._ensure_signature_items()
         field_values: dict[int, str] = {}
+        widgets = self.field_widgets
         for f in self.fields:
-            fid = f["id"]
-            dt = f["data_type"]
-            if dt in ("tolerance", "convert", "stat", "reference_cal_date", "field_header"):
+            collect = f["_collect"]
+            if collect is None:
                 continue
-            w = self.field_widgets.get(fid)
+            fid = f["id"]
+            w = widgets.get(fid)
             if w is None:
                 continue
-            val = None
+            val = collect(w)
 
-            if dt == "bool":
-                pass_btn = w.findChild(QtWidgets.QRadioButton, "pass_btn") if hasattr(w, "findChild") else None
-                val = "1" if (pass_btn and pass_btn.isChecked()) else "0"
-            elif dt == "date":
-                val = w.date().toString("yyyy-MM-dd")
-            elif dt == "signature":
-                if isinstance(w, QtWidgets.QComboBox):
-                    val = w.currentData() or ""
-                else:
-                    val = ""
-            else:
-                val = w.text().strip()
-
-            is_computed = bool(f.get("calc_type"))
-            is_required = bool(f.get("required"))
-
-            if is_required and not is_computed:
-                if val is None or val == "" or (val == "0" and dt != "bool"):
+            if f["_required_input"]:
+                if val is None or val == "" or (val == "0" and f["_zero_is_empty"]):
                     logger.warning("Calibration validation failed: required field '%s' (label '%s') is empty", f.get("name"), f.get("label"))
                     QtWidgets.QMessageBox.warning(
                         self, "Validation", f"Field '{f['label']}' is required.",
@@ -1157,81 +1687,55 @@ class CalibrationFormDialog(QtWidgets.QDialog):
 
         return field_values
 
-    def _apply_computations(self, field_values: dict[int, str], values_by_name: dict[str, str]) -> None:
-        """Apply computed field values (ABS_DIFF, PCT_ERROR, etc.) in place."""
-        for f in self.fields:
+    def _apply_computations(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> dict[int, str]:
+        """
+        Apply computed field values (ABS_DIFF, PCT_ERROR, etc.) to field_values in place.
+        Computations read only the pre-computation values_by_name; returns the computed values by field id.
+        """
+        computed: dict[int, str] = {}
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        for f in self._field_buckets["calc"]:
             calc_type = f.get("calc_type")
-            if not calc_type:
-                continue
 
             fid = f["id"]
 
             if calc_type == "ABS_DIFF":
                 ref1 = f.get("calc_ref1_name")
                 ref2 = f.get("calc_ref2_name")
-                v1 = values_by_name.get(ref1)
-                v2 = values_by_name.get(ref2)
+                a = values_by_name.get_float(ref1)
+                b = values_by_name.get_float(ref2)
                 result_val = ""
-                try:
-                    if v1 not in (None, "") and v2 not in (None, ""):
-                        a = float(v1)
-                        b = float(v2)
-                        result_val = f"{abs(a - b):.3f}"
-                except (TypeError, ValueError):
-                    result_val = ""
-                field_values[fid] = result_val
+                if a is not None and b is not None:
+                    result_val = f"{abs(a - b):.3f}"
+                computed[fid] = result_val
 
             elif calc_type == "PCT_ERROR":
                 # Value 1 = measured, Value 2 = reference
                 ref1 = f.get("calc_ref1_name")
                 ref2 = f.get("calc_ref2_name")
-                v1 = values_by_name.get(ref1)
-                v2 = values_by_name.get(ref2)
+                a = values_by_name.get_float(ref1)
+                b = values_by_name.get_float(ref2)
                 result_val = ""
-                try:
-                    if v1 not in (None, "") and v2 not in (None, ""):
-                        a = float(v1)
-                        b = float(v2)
-                        if b != 0:
-                            result_val = f"{(abs(a - b) / abs(b) * 100):.3f}"
-                        else:
-                            result_val = ""
-                except (TypeError, ValueError):
-                    result_val = ""
-                field_values[fid] = result_val
+                if a is not None and b is not None and b != 0:
+                    result_val = f"{(abs(a - b) / abs(b) * 100):.3f}"
+                computed[fid] = result_val
 
             elif calc_type == "PCT_DIFF":
                 # Percent difference: |V1 - V2| / avg(V1,V2) * 100 = 200*|V1-V2|/(V1+V2); order of fields does not matter
                 ref1 = f.get("calc_ref1_name")
                 ref2 = f.get("calc_ref2_name")
-                v1 = values_by_name.get(ref1)
-                v2 = values_by_name.get(ref2)
+                a = values_by_name.get_float(ref1)
+                b = values_by_name.get_float(ref2)
                 result_val = ""
-                try:
-                    if v1 not in (None, "") and v2 not in (None, ""):
-                        a = float(v1)
-                        b = float(v2)
-                        denom = a + b
-                        if denom != 0:
-                            result_val = f"{(200.0 * abs(a - b) / denom):.3f}"
-                        else:
-                            result_val = ""
-                except (TypeError, ValueError):
-                    result_val = ""
-                field_values[fid] = result_val
+                if a is not None and b is not None and a + b != 0:
+                    result_val = f"{(200.0 * abs(a - b) / (a + b)):.3f}"
+                computed[fid] = result_val
 
             elif calc_type in ("MIN_OF", "MAX_OF", "RANGE_OF"):
-                ref_names = [f.get(f"calc_ref{i}_name") for i in range(1, 13)]
-                nums = []
-                for r in ref_names:
-                    if not r:
-                        continue
-                    v = values_by_name.get(r)
-                    if v not in (None, ""):
-                        try:
-                            nums.append(float(v))
-                        except (TypeError, ValueError):
-                            pass
+                nums = [
+                    x for x in (values_by_name.get_float(r) for r in f["_ref_names"] if r)
+                    if x is not None
+                ] if f["_has_refs"] else []
                 result_val = ""
                 if len(nums) >= 2:
                     if calc_type == "MIN_OF":
@@ -1240,85 +1744,57 @@ class CalibrationFormDialog(QtWidgets.QDialog):
                         result_val = f"{max(nums):.3f}"
                     else:  # RANGE_OF
                         result_val = f"{(max(nums) - min(nums)):.3f}"
-                field_values[fid] = result_val
+                computed[fid] = result_val
 
             elif calc_type == "CUSTOM_EQUATION":
-                ref_names = [f.get(f"calc_ref{i}_name") for i in range(1, 13)]
-                vars_map = {"nominal": 0.0, "reading": 0.0}
-                nominal_str = f.get("nominal_value")
-                if nominal_str not in (None, ""):
-                    try:
-                        vars_map["nominal"] = float(str(nominal_str).strip())
-                    except (TypeError, ValueError):
-                        pass
-                for i, r in enumerate(ref_names, 1):
-                    if r and r in values_by_name:
-                        v = values_by_name.get(r)
-                        unit = self._get_unit_for_ref(r)
-                        num = self._parse_numeric_stripping_unit(v, unit)
+                vars_map.clear()
+                vars_map["nominal"] = f["_nominal"]
+                vars_map["reading"] = 0.0
+                for _i, r, unit, rk, _vk in f["_eq_refs"]:
+                    if r in values_by_name:
+                        num = values_by_name.get_number(r, unit)
                         if num is not None:
-                            vars_map[f"ref{i}"] = num
+                            vars_map[rk] = num
                         else:
                             try:
-                                vars_map[f"ref{i}"] = float(values_by_name[r] or 0)
+                                vars_map[rk] = float(values_by_name[r] or 0)
                             except (TypeError, ValueError):
-                                vars_map[f"ref{i}"] = 0.0
+                                vars_map[rk] = 0.0
                 eq = f.get("tolerance_equation")
                 result_val = ""
                 if eq:
                     try:
-                        from tolerance_service import equation_tolerance_display
-                        parts = equation_tolerance_display(eq, vars_map)
+                        parts = f["_equation"].display(vars_map)
                         if parts is not None:
                             lhs, op_str, rhs, pass_ = parts
-                            from tolerance_service import format_calculation_display
-                            _dec = max(0, min(4, int(f.get("sig_figs") or 3)))
+                            _dec = f["_decimals"]
                             result_val = f"{format_calculation_display(lhs, decimal_places=_dec)} {op_str} {format_calculation_display(rhs, decimal_places=_dec)}, {'PASS' if pass_ else 'FAIL'}"
                         else:
-                            from tolerance_service import evaluate_tolerance_equation
-                            val = evaluate_tolerance_equation(eq, vars_map)
+                            val = f["_equation"].evaluate(vars_map)
                             result_val = "Pass" if val >= 0.5 else "Fail"
                     except Exception:
                         result_val = "Fail"
-                field_values[fid] = result_val
+                computed[fid] = result_val
 
         # Convert-type (data_type "convert") fields: value = equation evaluated from refs
-        try:
-            from tolerance_service import evaluate_tolerance_equation, format_calculation_display
-        except ImportError:
-            pass
-        else:
-            for f in self.fields:
-                if (f.get("data_type") or "").strip().lower() != "convert":
-                    continue
+        if format_calculation_display is not None:
+            for f in self._field_buckets["convert"]:
                 eq = (f.get("tolerance_equation") or "").strip()
                 if not eq:
                     continue
                 fid = f["id"]
-                vars_map = {"nominal": 0.0, "reading": 0.0}
-                for i in range(1, 13):
-                    ref_name = f.get(f"calc_ref{i}_name")
-                    if ref_name and ref_name in values_by_name:
-                        v = values_by_name.get(ref_name)
-                        if v not in (None, ""):
-                            unit = self._get_unit_for_ref(ref_name)
-                            num = self._parse_numeric_stripping_unit(v, unit)
-                            if num is not None:
-                                vars_map[f"ref{i}"] = num
-                                vars_map[f"val{i}"] = num
+                self._fill_ref_vars(vars_map, f, values_by_name, 0.0)
                 try:
-                    result = evaluate_tolerance_equation(eq, vars_map)
-                    decimals = max(0, min(4, int(f.get("sig_figs") or 3)))
-                    field_values[fid] = format_calculation_display(result, decimal_places=decimals)
+                    result = f["_equation"].evaluate(vars_map)
+                    decimals = f["_decimals"]
+                    computed[fid] = format_calculation_display(result, decimal_places=decimals)
                 except (ValueError, TypeError):
-                    field_values[fid] = ""
+                    computed[fid] = ""
 
         # Reference cal date: value = last_cal_date of instrument matching ref1 (ID or tag)
-        for f in self.fields:
-            if (f.get("data_type") or "").strip().lower() != "reference_cal_date":
-                continue
+        for f in self._field_buckets["reference_cal_date"]:
             ref1_name = f.get("calc_ref1_name")
-            if not ref1_name or ref1_name not in values_by_name:
+            if not ref1_name:
                 continue
             id_or_tag = (values_by_name.get(ref1_name) or "").strip()
             if not id_or_tag:
@@ -1327,30 +1803,63 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             try:
                 inst = self.repo.get_instrument_by_id_or_tag(id_or_tag)
                 if inst and inst.last_cal_date:
-                    field_values[fid] = inst.last_cal_date
+                    computed[fid] = inst.last_cal_date
                 else:
-                    field_values[fid] = ""
+                    computed[fid] = ""
             except Exception:
-                field_values[fid] = ""
+                computed[fid] = ""
 
         # If you ever add more calc types, handle them here.
+        field_values.update(computed)
+        return computed
+
+    @staticmethod
+    def _fill_ref_vars(
+        vars_map: dict,
+        f: dict,
+        values_by_name: "_ValuesTable",
+        nominal: float,
+        plain_float_fallback: bool = False,
+    ) -> None:
+        """Refill vars_map with nominal, reading=0 and refN/valN from f's refs (shared by the convert and tolerance-field passes)."""
+        vars_map.clear()
+        vars_map["nominal"] = nominal
+        vars_map["reading"] = 0.0
+        for _i, ref_name, unit, rk, vk in f["_eq_refs"]:
+            v = values_by_name.get(ref_name)
+            if v in (None, ""):
+                continue
+            num = values_by_name.get_number(ref_name, unit)
+            if num is None and plain_float_fallback:
+                num = values_by_name.get_float(ref_name)
+            if num is not None:
+                vars_map[rk] = num
+                vars_map[vk] = num
 
     def _check_tolerance_pass_fail(
         self,
         field_values: dict[int, str],
-        values_by_name: dict[str, str],
+        values_by_name: "_ValuesTable",
         result: str,
     ) -> tuple[bool, str]:
-        """Check tolerance on computed/bool fields. Returns (any_out_of_tol, result)."""
-        any_out_of_tol = False
-        try:
-            from tolerance_service import evaluate_pass_fail
-        except ImportError:
-            evaluate_pass_fail = None
-        for f in self.fields:
-            if f.get("calc_type") not in ("ABS_DIFF", "PCT_ERROR", "PCT_DIFF", "MIN_OF", "MAX_OF", "RANGE_OF"):
-                continue
-
+        """Check tolerance on computed/bool fields. Returns (any_out_of_tol, result); stops at the first failure."""
+        checks = [self._check_calc_tolerances]
+        if evaluate_pass_fail:
+            checks += [
+                self._check_custom_equations,
+                self._check_bool_tolerances,
+                self._check_field_tolerances,
+                self._check_tolerance_fields,
+            ]
+        for check in checks:
+            if check(field_values, values_by_name):
+                return (True, "FAIL")
+        return (False, "PASS")
+
+    def _check_calc_tolerances(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> bool:
+        """Computed difference fields (ABS_DIFF, PCT_ERROR, ...) against their tolerance. True on the first failure."""
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        for f in self._field_buckets["calc_tol"]:
             tol_raw = f.get("tolerance")
             tol_fixed = None
             if tol_raw not in (None, ""):
@@ -1372,24 +1881,21 @@ class CalibrationFormDialog(QtWidgets.QDialog):
                 continue
 
             if evaluate_pass_fail:
-                ref1 = f.get("calc_ref1_name")
-                ref2 = f.get("calc_ref2_name")
-                ref3 = f.get("calc_ref3_name")
-                ref4 = f.get("calc_ref4_name")
-                ref5 = f.get("calc_ref5_name")
-                vars_map = {"nominal": 0.0, "reading": diff}
-                for i, r in enumerate((ref1, ref2, ref3, ref4, ref5), 1):
-                    if r and r in values_by_name:
-                        v = values_by_name.get(r)
-                        unit = self._get_unit_for_ref(r)
-                        num = self._parse_numeric_stripping_unit(v, unit)
+                vars_map.clear()
+                vars_map["nominal"] = 0.0
+                vars_map["reading"] = diff
+                for i, r, unit, rk, _vk in f["_eq_refs"]:
+                    if i > 5:
+                        break
+                    if r in values_by_name:
+                        num = values_by_name.get_number(r, unit)
                         if num is not None:
-                            vars_map[f"ref{i}"] = num
+                            vars_map[rk] = num
                         else:
                             try:
-                                vars_map[f"ref{i}"] = float(values_by_name[r] or 0)
+                                vars_map[rk] = float(values_by_name[r] or 0)
                             except (TypeError, ValueError):
-                                vars_map[f"ref{i}"] = 0.0
+                                vars_map[rk] = 0.0
                 pass_, _, _ = evaluate_pass_fail(
                     f.get("tolerance_type"),
                     tol_fixed,
@@ -1400,223 +1906,159 @@ class CalibrationFormDialog(QtWidgets.QDialog):
                     tolerance_lookup_json=f.get("tolerance_lookup_json"),
                 )
                 if not pass_:
-                    any_out_of_tol = True
-                    break
+                    return True
             else:
                 if tol_fixed is not None and diff > tol_fixed:
-                    any_out_of_tol = True
+                    return True
+        return False
+
+    def _check_custom_equations(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> bool:
+        """CUSTOM_EQUATION fields: the formula itself is the pass/fail condition. True on the first failure."""
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        for f in self._field_buckets["custom_eq"]:
+            eq = f.get("tolerance_equation")
+            if not eq:
+                continue
+            vars_map.clear()
+            vars_map["nominal"] = f["_nominal"]
+            vars_map["reading"] = 0.0
+            for i, r, _unit, rk, _vk in f["_eq_refs"]:
+                if i > 5:
                     break
-
-        # Third-b: Custom equation (pass/fail from formula)
-        if not any_out_of_tol and evaluate_pass_fail:
-            for f in self.fields:
-                if f.get("calc_type") != "CUSTOM_EQUATION":
+                if r in values_by_name:
+                    vars_map[rk] = values_by_name.get_float(r) or 0.0
+            try:
+                val = f["_equation"].evaluate(vars_map)
+                if val < 0.5:
+                    return True
+            except Exception:
+                return True
+        return False
+
+    def _check_bool_tolerances(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> bool:
+        """Bool tolerance: the value must match the configured pass value (true/false). True on the first failure."""
+        for f in self._field_buckets["bool_tol"]:
+            pass_when = (f.get("tolerance_equation") or "true").strip().lower()
+            if pass_when not in _BOOL_PASS_VALUES:
+                continue
+            fid = f["id"]
+            val_txt = field_values.get(fid)
+            if val_txt is None:
+                continue
+            reading_bool = val_txt in _TRUTHY
+            reading_float = 1.0 if reading_bool else 0.0
+            pass_, _, _ = evaluate_pass_fail(
+                "bool",
+                None,
+                pass_when,
+                nominal=0.0,
+                reading=reading_float,
+                vars_map={},
+                tolerance_lookup_json=None,
+            )
+            if not pass_:
+                return True
+        return False
+
+    def _check_field_tolerances(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> bool:
+        """Other fields with tolerance (number, reference, etc. — equation, fixed, percent, lookup).
+        Convert fields are skipped: they are computed display values, not tolerance checks. True on the first failure."""
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        for f in self._field_buckets["other_tol"]:
+            tol_type = f["_tol_type"]
+            if not f.get("tolerance_equation") and f.get("tolerance") is None and tol_type not in ("equation", "percent", "lookup"):
+                continue
+            fid = f["id"]
+            val_txt = field_values.get(fid)
+            if val_txt is None or val_txt == "":
+                continue
+            unit_f = (f.get("unit") or "").strip()
+            reading = self._parse_numeric_stripping_unit(val_txt, unit_f)
+            if reading is None:
+                reading = _to_float(val_txt)
+                if reading is None:
                     continue
-                eq = f.get("tolerance_equation")
-                if not eq:
+            nominal = f["_nominal"]
+            vars_map.clear()
+            vars_map["nominal"] = nominal
+            vars_map["reading"] = reading
+            for _i, r, unit, rk, _vk in f["_eq_refs"]:
+                v = values_by_name.get(r, _MISSING)
+                if v is _MISSING:
                     continue
-                ref_names = [
-                    f.get("calc_ref1_name"),
-                    f.get("calc_ref2_name"),
-                    f.get("calc_ref3_name"),
-                    f.get("calc_ref4_name"),
-                    f.get("calc_ref5_name"),
-                ]
-                vars_map = {"nominal": 0.0, "reading": 0.0}
-                nominal_str = f.get("nominal_value")
-                if nominal_str not in (None, ""):
-                    try:
-                        vars_map["nominal"] = float(str(nominal_str).strip())
-                    except (TypeError, ValueError):
-                        pass
-                for i, r in enumerate(ref_names, 1):
-                    if r and r in values_by_name:
-                        try:
-                            vars_map[f"ref{i}"] = float(values_by_name[r] or 0)
-                        except (TypeError, ValueError):
-                            vars_map[f"ref{i}"] = 0.0
+                num = values_by_name.get_number(r, unit)
+                if num is None:
+                    num = values_by_name.get_float(r) if v not in (None, "") else 0.0
+                if num is not None:
+                    vars_map[rk] = num
+            tol_fixed = None
+            tol_raw = f.get("tolerance")
+            if tol_raw not in (None, ""):
                 try:
-                    from tolerance_service import evaluate_tolerance_equation
-                    val = evaluate_tolerance_equation(eq, vars_map)
-                    if val < 0.5:
-                        any_out_of_tol = True
-                        break
-                except Exception:
-                    any_out_of_tol = True
-                    break
-
-        # Fourth pass: bool tolerance — auto-FAIL if bool field value doesn't match configured pass (true/false)
-        if not any_out_of_tol and evaluate_pass_fail:
-            for f in self.fields:
-                if f.get("data_type") != "bool" or f.get("tolerance_type") != "bool":
-                    continue
-                pass_when = (f.get("tolerance_equation") or "true").strip().lower()
-                if pass_when not in ("true", "false"):
-                    continue
-                fid = f["id"]
-                val_txt = field_values.get(fid)
-                if val_txt is None:
-                    continue
-                reading_bool = val_txt in ("1", "true", "yes", "on")
-                reading_float = 1.0 if reading_bool else 0.0
+                    tol_fixed = float(str(tol_raw))
+                except (TypeError, ValueError):
+                    pass
+            try:
                 pass_, _, _ = evaluate_pass_fail(
-                    "bool",
-                    None,
-                    pass_when,
-                    nominal=0.0,
-                    reading=reading_float,
-                    vars_map={},
-                    tolerance_lookup_json=None,
+                    tol_type,
+                    tol_fixed,
+                    f.get("tolerance_equation"),
+                    nominal,
+                    reading,
+                    vars_map=vars_map,
+                    tolerance_lookup_json=f.get("tolerance_lookup_json"),
                 )
                 if not pass_:
-                    any_out_of_tol = True
-                    break
-
-        # Fifth pass: other fields with tolerance (number, reference, etc. — equation, fixed, percent, lookup)
-        # Skip convert: they are computed display values, not tolerance checks.
-        if not any_out_of_tol and evaluate_pass_fail:
-            for f in self.fields:
-                if f.get("calc_type") or (f.get("data_type") or "") == "bool" or (f.get("data_type") or "") == "tolerance" or (f.get("data_type") or "") == "convert" or (f.get("data_type") or "") == "stat" or (f.get("data_type") or "") == "reference_cal_date":
-                    continue
-                tol_type = (f.get("tolerance_type") or "fixed").lower()
-                if not f.get("tolerance_equation") and f.get("tolerance") is None and tol_type not in ("equation", "percent", "lookup"):
-                    continue
-                fid = f["id"]
-                val_txt = field_values.get(fid)
-                if val_txt is None or val_txt == "":
-                    continue
-                unit_f = (f.get("unit") or "").strip()
-                reading = self._parse_numeric_stripping_unit(val_txt, unit_f)
-                if reading is None:
-                    try:
-                        reading = float(str(val_txt).strip())
-                    except (TypeError, ValueError):
-                        continue
-                nominal = 0.0
-                nominal_str = f.get("nominal_value")
-                if nominal_str not in (None, ""):
-                    try:
-                        nominal = float(str(nominal_str).strip())
-                    except (TypeError, ValueError):
-                        pass
-                vars_map = {"nominal": nominal, "reading": reading}
-                for i in range(1, 13):
-                    r = f.get(f"calc_ref{i}_name")
-                    if r and r in values_by_name:
-                        v = values_by_name.get(r)
-                        unit = self._get_unit_for_ref(r)
-                        num = self._parse_numeric_stripping_unit(v, unit)
-                        if num is not None:
-                            vars_map[f"ref{i}"] = num
-                        else:
-                            try:
-                                vars_map[f"ref{i}"] = float(str(v or 0).strip())
-                            except (TypeError, ValueError):
-                                pass
-                tol_fixed = None
-                tol_raw = f.get("tolerance")
-                if tol_raw not in (None, ""):
-                    try:
-                        tol_fixed = float(str(tol_raw))
-                    except (TypeError, ValueError):
-                        pass
-                try:
-                    pass_, _, _ = evaluate_pass_fail(
-                        tol_type,
-                        tol_fixed,
-                        f.get("tolerance_equation"),
-                        nominal,
-                        reading,
-                        vars_map=vars_map,
-                        tolerance_lookup_json=f.get("tolerance_lookup_json"),
-                    )
-                    if not pass_:
-                        any_out_of_tol = True
-                        break
-                except Exception:
-                    any_out_of_tol = True
-                    break
-
-        # Sixth pass: tolerance-type (data_type "tolerance") fields — not in field_values; evaluate from values_by_name
-        if not any_out_of_tol and evaluate_pass_fail:
-            for f in self.fields:
-                if (f.get("data_type") or "").strip().lower() != "tolerance":
-                    continue
-                eq = (f.get("tolerance_equation") or "").strip()
-                if not eq:
-                    continue
-                nominal = 0.0
-                nominal_str = f.get("nominal_value")
-                if nominal_str not in (None, ""):
-                    try:
-                        nominal = float(str(nominal_str).strip())
-                    except (TypeError, ValueError):
-                        pass
-                vars_map = {"nominal": nominal, "reading": 0.0}
-                for i in range(1, 13):
-                    ref_name = f.get(f"calc_ref{i}_name")
-                    if ref_name and ref_name in values_by_name:
-                        v = values_by_name.get(ref_name)
-                        if v not in (None, ""):
-                            unit = self._get_unit_for_ref(ref_name)
-                            num = self._parse_numeric_stripping_unit(v, unit)
-                            if num is not None:
-                                vars_map[f"ref{i}"] = num
-                                vars_map[f"val{i}"] = num
-                            else:
-                                try:
-                                    n = float(str(v).strip())
-                                    vars_map[f"ref{i}"] = n
-                                    vars_map[f"val{i}"] = n
-                                except (TypeError, ValueError):
-                                    pass
-                try:
-                    from tolerance_service import list_variables
-                    if "reading" in list_variables(eq):
-                        ref1 = f.get("calc_ref1_name")
-                        if ref1 and ref1 in values_by_name:
-                            v = values_by_name.get(ref1)
-                            if v not in (None, ""):
-                                unit1 = self._get_unit_for_ref(ref1)
-                                num1 = self._parse_numeric_stripping_unit(v, unit1)
-                                if num1 is not None:
-                                    vars_map["reading"] = num1
-                                else:
-                                    try:
-                                        vars_map["reading"] = float(str(v).strip())
-                                    except (TypeError, ValueError):
-                                        pass
-                except ImportError:
-                    pass
-                for i in range(1, 13):
-                    rk, vk = f"ref{i}", f"val{i}"
-                    if rk in vars_map and vk not in vars_map:
-                        vars_map[vk] = vars_map[rk]
-                try:
-                    from tolerance_service import list_variables, equation_tolerance_display
-                    required = list_variables(eq)
-                    if any(var not in vars_map for var in required):
-                        continue
-                    parts = equation_tolerance_display(eq, vars_map)
-                    if parts is not None:
-                        _, _, _, pass_ = parts
-                        if not pass_:
-                            any_out_of_tol = True
-                            break
-                    else:
-                        reading = vars_map.get("reading", 0.0)
-                        pass_, _, _ = evaluate_pass_fail(
-                            "equation", None, eq, nominal, reading,
-                            vars_map=vars_map, tolerance_lookup_json=None,
-                        )
-                        if not pass_:
-                            any_out_of_tol = True
-                            break
-                except Exception:
-                    continue
-
-        derived_result = "FAIL" if any_out_of_tol else "PASS"
-        return (any_out_of_tol, derived_result)
+                    return True
+            except Exception:
+                return True
+        return False
+
+    def _check_tolerance_fields(self, field_values: dict[int, str], values_by_name: "_ValuesTable") -> bool:
+        """Tolerance-type (data_type "tolerance") fields: not in field_values, so evaluated from values_by_name. True on the first failure."""
+        vars_map = {}  # scratch for the evaluators (they copy it), refilled per field
+        outcomes: dict[tuple, bool] = {}
+        for f in self._field_buckets["tolerance"]:
+            eq = (f.get("tolerance_equation") or "").strip()
+            if not eq:
+                continue
+            nominal = f["_nominal"]
+            self._fill_ref_vars(vars_map, f, values_by_name, nominal, plain_float_fallback=True)
+            refs = f["_active_refs"]
+            if "reading" in f["_equation"].variables and refs and refs[0][0] == 1:
+                _, ref1, unit1, _, _ = refs[0]
+                v = values_by_name.get(ref1)
+                if v not in (None, ""):
+                    num1 = values_by_name.get_number(ref1, unit1)
+                    if num1 is None:
+                        num1 = values_by_name.get_float(ref1)
+                    if num1 is not None:
+                        vars_map["reading"] = num1
+            if any(var not in vars_map for var in f["_equation"].variables):
+                continue
+            # Repeated tolerance clauses over the same inputs share one evaluation per save
+            key = (eq, tuple(sorted(vars_map.items())))
+            failed = outcomes.get(key)
+            if failed is None:
+                failed = outcomes[key] = self._tolerance_equation_fails(f, eq, nominal, vars_map)
+            if failed:
+                return True
+        return False
+
+    def _tolerance_equation_fails(self, f: dict, eq: str, nominal: float, vars_map: dict) -> bool:
+        """Evaluate one tolerance-type field's equation; errors count as not failing."""
+        try:
+            parts = f["_equation"].display(vars_map)
+            if parts is not None:
+                return not parts[3]
+            reading = vars_map.get("reading", 0.0)
+            pass_, _, _ = evaluate_pass_fail(
+                "equation", None, eq, nominal, reading,
+                vars_map=vars_map, tolerance_lookup_json=None,
+            )
+            return not pass_
+        except Exception:
+            return False
 
     def _save_calibration_record(
         self,
@@ -1625,11 +2067,13 @@ class CalibrationFormDialog(QtWidgets.QDialog):
         result: str,
         notes: str,
         field_values: dict[int, str],
+        repo: CalibrationRepository | None = None,
     ) -> None:
-        """Persist calibration record. Raises on error."""
+        """Persist calibration record (through repo, default self.repo). Raises on error."""
+        repo = repo or self.repo
         if self.record_id is None:
             calibration_service.create_calibration_record(
-                self.repo,
+                repo,
                 self.instrument["id"],
                 self.template["id"],
                 cal_date,
@@ -1641,7 +2085,7 @@ class CalibrationFormDialog(QtWidgets.QDialog):
             )
         else:
             calibration_service.update_calibration_record(
-                self.repo,
+                repo,
                 self.record_id,
                 cal_date,
                 performed_by,
@@ -6,7 +6,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 from database import CalibrationRepository
 from services import calibration_service, template_service, attachment_service
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 from ui.dialogs.calibration_form_dialog import CalibrationFormDialog
 from pdf_export import (
     calibration_record_display_date,
@@ -139,11 +139,7 @@ class CalibrationHistoryDialog(QtWidgets.QDialog):
         self._load_records()
 
     def _show_help(self):
-        title, content = get_help_content("CalibrationHistoryDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "CalibrationHistoryDialog")
     
     def on_open_file(self):
         atts = self._attachments_for_selected_record()
@@ -530,7 +526,18 @@ class CalibrationHistoryDialog(QtWidgets.QDialog):
                 v = _vb.get(s.lower())
                 return v
 
-            def _get_ref_value(ref_name, _gv=group_vals):
+            # Index this group's fields by lowercased name/label once so ref lookups are O(1).
+            # setdefault keeps the first match in value order, same as the old linear scan.
+            ref_index = {}
+            for gv in group_vals:
+                tf = template_fields_by_id.get(gv.get("field_id"))
+                if not tf:
+                    continue
+                entry = (gv.get("value_text"), (tf.get("unit") or "").strip())
+                ref_index.setdefault((tf.get("name") or "").strip().lower(), entry)
+                ref_index.setdefault((tf.get("label") or "").strip().lower(), entry)
+
+            def _get_ref_value(ref_name, _idx=ref_index):
                 """Resolve ref to value: try _get_value first, then match any field in this group by name or label (case-insensitive)."""
                 rv = _get_value(ref_name)
                 if rv is not None:
@@ -538,45 +545,19 @@ class CalibrationHistoryDialog(QtWidgets.QDialog):
                 ref_clean = (ref_name or "").strip()
                 if not ref_clean:
                     return None
-                ref_lower = ref_clean.lower()
-                for v in _gv:
-                    tf = template_fields_by_id.get(v.get("field_id"))
-                    if not tf:
-                        continue
-                    fn = (tf.get("name") or "").strip()
-                    fl = (tf.get("label") or "").strip()
-                    if fn.lower() == ref_lower or fl.lower() == ref_lower:
-                        return v.get("value_text")
-                return None
+                hit = _idx.get(ref_clean.lower())
+                return hit[0] if hit else None
 
-            def _get_ref_value_and_unit(ref_name, _gv=group_vals):
+            def _get_ref_value_and_unit(ref_name, _idx=ref_index):
                 """Like _get_ref_value but also return the ref field's unit (for stripping when parsing). Returns (value_text, unit)."""
+                ref_clean = (ref_name or "").strip()
+                hit = _idx.get(ref_clean.lower())
                 rv = _get_value(ref_name)
                 if rv is not None:
-                    ref_clean = (ref_name or "").strip()
-                    ref_lower = ref_clean.lower() if ref_clean else ""
-                    for v in _gv:
-                        tf = template_fields_by_id.get(v.get("field_id"))
-                        if not tf:
-                            continue
-                        fn = (tf.get("name") or "").strip()
-                        fl = (tf.get("label") or "").strip()
-                        if fn.lower() == ref_lower or fl.lower() == ref_lower:
-                            return (rv, (tf.get("unit") or "").strip())
-                    return (rv, "")
-                ref_clean = (ref_name or "").strip()
-                if not ref_clean:
+                    return (rv, hit[1] if hit else "")
+                if not ref_clean or not hit:
                     return (None, "")
-                ref_lower = ref_clean.lower()
-                for v in _gv:
-                    tf = template_fields_by_id.get(v.get("field_id"))
-                    if not tf:
-                        continue
-                    fn = (tf.get("name") or "").strip()
-                    fl = (tf.get("label") or "").strip()
-                    if fn.lower() == ref_lower or fl.lower() == ref_lower:
-                        return (v.get("value_text"), (tf.get("unit") or "").strip())
-                return (None, "")
+                return hit
 
             def _parse_numeric_stripping_unit(val_text, unit):
                 """Parse value as float, stripping trailing unit (e.g. '122.0 °F' with unit '°F' -> 122.0)."""
@@ -843,13 +824,9 @@ class CalibrationHistoryDialog(QtWidgets.QDialog):
                                         vars_map[f"val{i}"] = 0.0
                         try:
                             from tolerance_service import list_variables
-                            if "reading" in list_variables(eq):
-                                ref1 = f.get("calc_ref1_name")
-                                if ref1:
-                                    rv1, runit1 = _get_ref_value_and_unit(ref1)
-                                    if rv1 not in (None, ""):
-                                        num1 = _parse_numeric_stripping_unit(rv1, runit1)
-                                        vars_map["reading"] = num1 if num1 is not None else 0.0
+                            # ref1 was already resolved above; reuse it instead of a second lookup
+                            if "reading" in list_variables(eq) and "ref1" in vars_map:
+                                vars_map["reading"] = vars_map["ref1"]
                         except ImportError:
                             pass
                         for i in range(1, 13):
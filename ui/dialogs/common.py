@@ -1,5 +1,7 @@
 # ui/dialogs/common.py - Shared constants and helpers for dialogs
 
+from PyQt5 import QtCore, QtWidgets
+
 STANDARD_FIELD_WIDTH = 280
 
 
@@ -11,3 +13,32 @@ def parse_float_optional(s: str):
         return float(str(s).strip())
     except ValueError:
         return None
+
+
+def fill_table(table, rows, make_items) -> None:
+    """
+    Replace a QTableWidget's contents with one table row per entry of rows; make_items(entry)
+    returns that row's QTableWidgetItems in column order. Sorting, the table's signals and
+    repaints are held off until every item is in place.
+    """
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    was_blocked = table.blockSignals(True)
+    try:
+        table.setRowCount(len(rows))
+        for r, entry in enumerate(rows):
+            for c, item in enumerate(make_items(entry)):
+                table.setItem(r, c, item)
+    finally:
+        table.blockSignals(was_blocked)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+
+def show_loading_row(table) -> None:
+    """Show a single placeholder "Loading…" row until the table's real contents are filled in."""
+    item = QtWidgets.QTableWidgetItem("Loading…")
+    item.setFlags(QtCore.Qt.NoItemFlags)
+    table.setRowCount(1)
+    table.setItem(0, 0, item)
@@ -2,7 +2,7 @@
 
 from PyQt5 import QtWidgets, QtGui
 
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 
 
 class DestinationEditDialog(QtWidgets.QDialog):
@@ -13,11 +13,11 @@ class DestinationEditDialog(QtWidgets.QDialog):
 
         form = QtWidgets.QFormLayout(self)
 
-        self.name_edit = QtWidgets.QLineEdit(self.dest.get("name", ""))
-        self.contact_edit = QtWidgets.QLineEdit(self.dest.get("contact", ""))
-        self.email_edit = QtWidgets.QLineEdit(self.dest.get("email", ""))
-        self.phone_edit = QtWidgets.QLineEdit(self.dest.get("phone", ""))
-        self.addr_edit = QtWidgets.QPlainTextEdit(self.dest.get("address", ""))
+        self.name_edit = QtWidgets.QLineEdit(self.dest.get("name") or "")
+        self.contact_edit = QtWidgets.QLineEdit(self.dest.get("contact") or "")
+        self.email_edit = QtWidgets.QLineEdit(self.dest.get("email") or "")
+        self.phone_edit = QtWidgets.QLineEdit(self.dest.get("phone") or "")
+        self.addr_edit = QtWidgets.QPlainTextEdit(self.dest.get("address") or "")
         option = QtGui.QTextOption()
         option.setWrapMode(QtGui.QTextOption.WordWrap)
         self.addr_edit.document().setDefaultTextOption(option)
@@ -37,11 +37,7 @@ class DestinationEditDialog(QtWidgets.QDialog):
         form.addRow(btn_box)
 
     def _show_help(self):
-        title, content = get_help_content("DestinationEditDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "DestinationEditDialog")
 
     def get_data(self):
         name = self.name_edit.text().strip()
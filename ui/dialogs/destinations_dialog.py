@@ -4,7 +4,8 @@ from PyQt5 import QtWidgets, QtCore
 
 from database import CalibrationRepository
 from services import destination_service
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
+from ui.table_models import RecordTableModel
 from ui.dialogs.destination_edit_dialog import DestinationEditDialog
 
 
@@ -16,11 +17,15 @@ class DestinationsDialog(QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout(self)
 
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["Name", "Contact", "Email", "Phone", "Address"]
-        )
+        self.model = RecordTableModel([
+            ("Name", "name"),
+            ("Contact", "contact"),
+            ("Email", "email"),
+            ("Phone", "phone"),
+            ("Address", "address"),
+        ], parent=self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
@@ -45,44 +50,31 @@ class DestinationsDialog(QtWidgets.QDialog):
         btn_box.rejected.connect(self.accept)
         layout.addWidget(btn_box)
 
-        self._load_destinations()
+        # Table is filled on first show so constructing the dialog doesn't hit the database
+        self._loaded = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            QtCore.QTimer.singleShot(0, self._load_destinations)
 
     def _show_help(self):
-        title, content = get_help_content("DestinationsDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "DestinationsDialog")
 
     def _load_destinations(self):
-        dests = self.repo.list_destinations_full()
-        self.table.setRowCount(len(dests))
-        for row, d in enumerate(dests):
-            item_name = QtWidgets.QTableWidgetItem(d["name"])
-            item_name.setData(QtCore.Qt.UserRole, d["id"])
-            item_contact = QtWidgets.QTableWidgetItem(d.get("contact") or "")
-            item_email = QtWidgets.QTableWidgetItem(d.get("email") or "")
-            item_phone = QtWidgets.QTableWidgetItem(d.get("phone") or "")
-            item_addr = QtWidgets.QTableWidgetItem(d.get("address") or "")
-
-            self.table.setItem(row, 0, item_name)
-            self.table.setItem(row, 1, item_contact)
-            self.table.setItem(row, 2, item_email)
-            self.table.setItem(row, 3, item_phone)
-            self.table.setItem(row, 4, item_addr)
+        self.model.set_rows(self.repo.list_destinations_full())
 
     def _selected_row(self):
-        idx = self.table.currentRow()
+        idx = self.table.currentIndex().row()
         return idx if idx >= 0 else None
 
     def _selected_dest_id(self):
         row = self._selected_row()
         if row is None:
             return None
-        item = self.table.item(row, 0)
-        if not item:
-            return None
-        return item.data(QtCore.Qt.UserRole)
+        dest = self.model.row_at(row)
+        return dest["id"] if dest else None
 
     def on_add(self):
         dlg = DestinationEditDialog(parent=self)
@@ -100,14 +92,7 @@ class DestinationsDialog(QtWidgets.QDialog):
         if dest_id is None:
             return
 
-        dest = {
-            "id": dest_id,
-            "name": self.table.item(row, 0).text(),
-            "contact": self.table.item(row, 1).text(),
-            "email": self.table.item(row, 2).text(),
-            "phone": self.table.item(row, 3).text(),
-            "address": self.table.item(row, 4).text(),
-        }
+        dest = dict(self.model.rows[row])
 
         dlg = DestinationEditDialog(dest=dest, parent=self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
@@ -121,7 +106,7 @@ class DestinationsDialog(QtWidgets.QDialog):
         row = self._selected_row()
         if dest_id is None or row is None:
             return
-        name = self.table.item(row, 0).text()
+        name = self.model.rows[row]["name"]
         resp = QtWidgets.QMessageBox.question(
             self,
             "Delete destination",
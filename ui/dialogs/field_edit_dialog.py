@@ -2,15 +2,30 @@
 
 from PyQt5 import QtWidgets, QtCore
 
+from tolerance_service import (
+    compile_equation,
+    equation_has_pass_fail_condition,
+    equation_pass_fail,
+    list_variables,
+    parse_equation,
+    parse_plot_equation,
+    validate_equation_variables,
+)
 from ui.dialogs.common import STANDARD_FIELD_WIDTH, parse_float_optional
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 
 class FieldEditDialog(QtWidgets.QDialog):
+    # Equation variables offered as Insert: buttons
+    _INSERT_VARIABLES = ("nominal", "reading") + tuple(f"val{i}" for i in range(1, 13))
+
     def __init__(self, field=None, existing_fields=None, parent=None):
         super().__init__(parent)
         self.field = field or {}
         self.existing_fields = existing_fields or []
         self.setWindowTitle("Field" + (" - Edit" if field else " - New"))
+        # Set once the widgets the callbacks touch late (Insert buttons, validation label,
+        # test panel) exist; callbacks run during construction skip those parts until then.
+        self._ui_ready = False
 
         # Use scroll area so Tolerance type / Equation option is reachable on smaller screens
         scroll = QtWidgets.QScrollArea()
@@ -53,40 +68,28 @@ class FieldEditDialog(QtWidgets.QDialog):
 
         self.group_edit = QtWidgets.QLineEdit(self.field.get("group_name") or "")
         self.group_edit.setMinimumWidth(_min_field_w)
-        self.group_edit.textChanged.connect(self._refresh_value_combos)
+        # Value combos follow the group once typing pauses (each keystroke restarts the timer)
+        self._group_timer = QtCore.QTimer(self)
+        self._group_timer.setSingleShot(True)
+        self._group_timer.setInterval(150)
+        self._group_timer.timeout.connect(self._refresh_value_combos)
+        self.group_edit.textChanged.connect(lambda _text: self._group_timer.start())
 
         self.reference_value_edit = QtWidgets.QLineEdit(self.field.get("default_value") or "")
         self.reference_value_edit.setMinimumWidth(_min_field_w)
         self.reference_value_label = QtWidgets.QLabel("Reference value")
 
-        self.ref1_combo = QtWidgets.QComboBox()
-        self.ref2_combo = QtWidgets.QComboBox()
-        self.ref3_combo = QtWidgets.QComboBox()
-        self.ref4_combo = QtWidgets.QComboBox()
-        self.ref5_combo = QtWidgets.QComboBox()
-        self.ref6_combo = QtWidgets.QComboBox()
-        self.ref7_combo = QtWidgets.QComboBox()
-        self.ref8_combo = QtWidgets.QComboBox()
-        self.ref9_combo = QtWidgets.QComboBox()
-        self.ref10_combo = QtWidgets.QComboBox()
-        self.ref11_combo = QtWidgets.QComboBox()
-        self.ref12_combo = QtWidgets.QComboBox()
+        self.ref_combos = [QtWidgets.QComboBox() for _ in range(12)]
         self._populate_value_combos()
 
         def set_cb_from_name(cb, name):
-            if not name:
-                return
-            for i in range(cb.count()):
-                if cb.itemData(i) == name:
-                    cb.setCurrentIndex(i)
-                    break
-
-        for i, cb in enumerate([self.ref1_combo, self.ref2_combo, self.ref3_combo, self.ref4_combo, self.ref5_combo,
-                                 self.ref6_combo, self.ref7_combo, self.ref8_combo, self.ref9_combo, self.ref10_combo,
-                                 self.ref11_combo, self.ref12_combo], 1):
+            idx = self._value_index.get(name) if name else None
+            if idx is not None:
+                cb.setCurrentIndex(idx)
+
+        for i, cb in enumerate(self.ref_combos, 1):
             set_cb_from_name(cb, self.field.get(f"calc_ref{i}_name"))
-        for cb in (self.ref6_combo, self.ref7_combo, self.ref8_combo, self.ref9_combo, self.ref10_combo,
-                   self.ref11_combo, self.ref12_combo):
+        for cb in self.ref_combos[5:]:
             cb.currentIndexChanged.connect(self._update_val_ref_visibility)
 
         self.tol_type_combo = QtWidgets.QComboBox()
@@ -106,6 +109,10 @@ class FieldEditDialog(QtWidgets.QDialog):
         self.tol_type_combo.currentIndexChanged.connect(self._on_tolerance_type_changed)
 
         self.tol_equation_edit = QtWidgets.QLineEdit(self.field.get("tolerance_equation") or "")
+        self._eq_validate_timer = QtCore.QTimer(self)
+        self._eq_validate_timer.setSingleShot(True)
+        self._eq_validate_timer.setInterval(150)
+        self._eq_validate_timer.timeout.connect(self._on_equation_changed)
         self.tol_equation_edit.setMinimumWidth(_min_field_w)
         self.tol_equation_edit.setPlaceholderText("e.g. reading <= 0.02 * nominal or val1 < val2 + 0.5")
         self.tol_equation_edit.setToolTip(
@@ -144,35 +151,15 @@ class FieldEditDialog(QtWidgets.QDialog):
         show_decimals = (dt or "").strip().lower() in ("number", "convert", "tolerance", "reference", "stat")
         self.sig_figs_spin.setVisible(show_decimals)
         self.sig_figs_label.setVisible(show_decimals)
-        if hasattr(self, "appear_in_cal_check"):
-            self.appear_in_cal_check.setVisible((dt or "").strip().lower() in ("number", "convert"))
+        self.appear_in_cal_check.setVisible((dt or "").strip().lower() in ("number", "convert"))
         form.addRow("Tolerance type", self.tol_type_combo)
         form.addRow(self.tol_equation_label, self.tol_equation_edit)
         form.addRow(self.tol_bool_pass_label, self.tol_bool_pass_combo)
-        self.val1_label = QtWidgets.QLabel("val1 field")
-        self.val2_label = QtWidgets.QLabel("val2 field")
-        self.val3_label = QtWidgets.QLabel("val3 field (optional)")
-        self.val4_label = QtWidgets.QLabel("val4 field (optional)")
-        self.val5_label = QtWidgets.QLabel("val5 field (optional)")
-        self.val6_label = QtWidgets.QLabel("val6 (optional)")
-        self.val7_label = QtWidgets.QLabel("val7 (optional)")
-        self.val8_label = QtWidgets.QLabel("val8 (optional)")
-        self.val9_label = QtWidgets.QLabel("val9 (optional)")
-        self.val10_label = QtWidgets.QLabel("val10 (optional)")
-        self.val11_label = QtWidgets.QLabel("val11 (optional)")
-        self.val12_label = QtWidgets.QLabel("val12 (optional)")
-        form.addRow(self.val1_label, self.ref1_combo)
-        form.addRow(self.val2_label, self.ref2_combo)
-        form.addRow(self.val3_label, self.ref3_combo)
-        form.addRow(self.val4_label, self.ref4_combo)
-        form.addRow(self.val5_label, self.ref5_combo)
-        form.addRow(self.val6_label, self.ref6_combo)
-        form.addRow(self.val7_label, self.ref7_combo)
-        form.addRow(self.val8_label, self.ref8_combo)
-        form.addRow(self.val9_label, self.ref9_combo)
-        form.addRow(self.val10_label, self.ref10_combo)
-        form.addRow(self.val11_label, self.ref11_combo)
-        form.addRow(self.val12_label, self.ref12_combo)
+        self.val_labels = [QtWidgets.QLabel(f"val{i} field") for i in (1, 2)]
+        self.val_labels += [QtWidgets.QLabel(f"val{i} field (optional)") for i in (3, 4, 5)]
+        self.val_labels += [QtWidgets.QLabel(f"val{i} (optional)") for i in range(6, 13)]
+        for lbl, cb in zip(self.val_labels, self.ref_combos, strict=True):
+            form.addRow(lbl, cb)
         # Track which val6-val12 rows user has added (so they stay visible)
         self._added_val_indices = set()
         for i in range(6, 13):
@@ -226,10 +213,10 @@ class FieldEditDialog(QtWidgets.QDialog):
         self._on_type_changed(self.type_combo.currentText())
         self.var_btn_layout = QtWidgets.QHBoxLayout()
         self.var_btn_layout.addWidget(QtWidgets.QLabel("Insert:"))
-        for var_name in ("nominal", "reading", "val1", "val2", "val3", "val4", "val5", "val6", "val7", "val8", "val9", "val10", "val11", "val12"):
+        for var_name in self._INSERT_VARIABLES:
             btn = QtWidgets.QPushButton(var_name)
             btn.setMaximumWidth(52)
-            btn.clicked.connect(lambda checked, v=var_name: self._insert_variable(v))
+            btn.clicked.connect(self._on_var_button)
             self.var_btn_layout.addWidget(btn)
         self.var_btn_layout.addStretch()
         self.var_btn_widget = QtWidgets.QWidget()
@@ -240,7 +227,8 @@ class FieldEditDialog(QtWidgets.QDialog):
         self.tol_validation_label.setWordWrap(True)
         self.tol_validation_label.setStyleSheet("color: #c00; font-size: 0.9em;")
         form.addRow("", self.tol_validation_label)
-        self.tol_equation_edit.textChanged.connect(self._on_equation_changed)
+        # Validate once typing pauses (each keystroke restarts the timer)
+        self.tol_equation_edit.textChanged.connect(lambda _text: self._eq_validate_timer.start())
         # M3: Test equation panel
         self.test_group = QtWidgets.QGroupBox("Test equation")
         test_layout = QtWidgets.QFormLayout(self.test_group)
@@ -256,9 +244,15 @@ class FieldEditDialog(QtWidgets.QDialog):
         test_layout.addRow("Reading:", self.test_reading_spin)
         test_layout.addRow("Tolerance:", self.test_tolerance_label)
         test_layout.addRow("Pass/Fail:", self.test_passfail_label)
-        for w in (self.test_nominal_spin, self.test_reading_spin):
-            w.valueChanged.connect(self._update_test_result)
+        # Spin boxes are connected only while the panel is shown (see _set_test_group_visible);
+        # their changes re-run the preview once they pause, like equation typing
+        self._test_signals_connected = False
+        self._test_result_timer = QtCore.QTimer(self)
+        self._test_result_timer.setSingleShot(True)
+        self._test_result_timer.setInterval(150)
+        self._test_result_timer.timeout.connect(self._update_test_result)
         form.addRow(self.test_group)
+        self._ui_ready = True
         self._on_tolerance_type_changed(self.tol_type_combo.currentIndex())
         self._update_test_result()
 
@@ -303,21 +297,21 @@ class FieldEditDialog(QtWidgets.QDialog):
         data_type = (self.type_combo.currentData() or self.type_combo.currentText() or "").strip().lower().replace(" ", "_")
         if data_type in ("stat", "plot"):
             return ""  # Stat/plot: show all template fields in val1..val12 dropdowns
-        return (self.group_edit.text() or "").strip() if hasattr(self, "group_edit") else ""
+        return (self.group_edit.text() or "").strip()
 
     def _populate_value_combos(self):
         """Populate val1-val12 ref combos. Filtered by Group for tolerance/convert; stat shows all fields."""
         group = self._get_value_combo_group()
+        self._last_group = group
         fields = self.existing_fields
         if group:
             fields = [f for f in fields if (f.get("group_name") or "").strip() == group]
-        ref_combos = [
-            self.ref1_combo, self.ref2_combo, self.ref3_combo, self.ref4_combo, self.ref5_combo,
-            self.ref6_combo, self.ref7_combo, self.ref8_combo, self.ref9_combo, self.ref10_combo,
-            self.ref11_combo, self.ref12_combo,
-        ]
-        current_selections = [cb.currentData() for cb in ref_combos]
-        for i, cb in enumerate(ref_combos):
+        current_selections = [cb.currentData() for cb in self.ref_combos]
+        # Combo index per field name (+1 for the blank first item); first occurrence wins
+        self._value_index = {}
+        for j, f in enumerate(fields, 1):
+            self._value_index.setdefault(f["name"], j)
+        for i, cb in enumerate(self.ref_combos):
             cb.blockSignals(True)
             cb.clear()
             cb.addItem("", None)
@@ -326,15 +320,16 @@ class FieldEditDialog(QtWidgets.QDialog):
             name_to_restore = current_selections[i] if i < len(current_selections) else None
             if not name_to_restore and self.field:
                 name_to_restore = self.field.get(f"calc_ref{i + 1}_name")
-            if name_to_restore:
-                for j in range(cb.count()):
-                    if cb.itemData(j) == name_to_restore:
-                        cb.setCurrentIndex(j)
-                        break
+            idx = self._value_index.get(name_to_restore) if name_to_restore else None
+            if idx is not None:
+                cb.setCurrentIndex(idx)
             cb.blockSignals(False)
 
     def _refresh_value_combos(self):
-        """Re-populate value combos when group changes."""
+        """Re-populate value combos when group changes (no-op if the effective group is unchanged)."""
+        self._group_timer.stop()
+        if self._get_value_combo_group() == self._last_group:
+            return
         self._populate_value_combos()
 
     def _on_type_changed(self, data_type: str):
@@ -350,167 +345,112 @@ class FieldEditDialog(QtWidgets.QDialog):
         is_field_header = (dt in ("field_header",))
         is_bool = (dt == "bool")
         show_unit = is_number or is_convert or is_tolerance or is_reference or is_stat
-        if hasattr(self, "unit_edit") and hasattr(self, "unit_label"):
-            self.unit_edit.setVisible(show_unit)
-            self.unit_label.setVisible(show_unit)
-        if hasattr(self, "appear_in_cal_check"):
-            self.appear_in_cal_check.setVisible(is_number or is_convert)
-        if hasattr(self, "sig_figs_spin") and hasattr(self, "sig_figs_label"):
-            show_decimals = is_number or is_convert or is_tolerance or is_reference or is_stat
-            self.sig_figs_spin.setVisible(show_decimals)
-            self.sig_figs_label.setVisible(show_decimals)
-        if hasattr(self, "reference_value_edit") and hasattr(self, "reference_value_label"):
-            self.reference_value_edit.setVisible(is_reference)
-            self.reference_value_label.setVisible(is_reference)
+        self.unit_edit.setVisible(show_unit)
+        self.unit_label.setVisible(show_unit)
+        self.appear_in_cal_check.setVisible(is_number or is_convert)
+        show_decimals = is_number or is_convert or is_tolerance or is_reference or is_stat
+        self.sig_figs_spin.setVisible(show_decimals)
+        self.sig_figs_label.setVisible(show_decimals)
+        self.reference_value_edit.setVisible(is_reference)
+        self.reference_value_label.setVisible(is_reference)
         # When type is bool: show tolerance section with Boolean selected so user can set pass when True/False
-        if is_bool and hasattr(self, "tol_type_combo"):
+        if is_bool:
             idx = self.tol_type_combo.findData("bool")
             if idx >= 0:
                 self.tol_type_combo.setCurrentIndex(idx)
         # Tolerance type: show equation section (read-only display in calibration form)
-        if is_tolerance and hasattr(self, "tol_type_combo"):
+        if is_tolerance:
             self.tol_type_combo.setCurrentIndex(self.tol_type_combo.findData("equation"))
         # Stat type: show equation (e.g. LINEST), no pass/fail required; value dropdowns show all fields
         if is_stat:
             self._refresh_value_combos()
         if is_stat:
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setText("Stat equation")
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setPlaceholderText("e.g. LINEST([val1, val2], [ref1, ref2]) or STDEV([val1, val2, val3])")
-                self.tol_equation_edit.setToolTip(
-                    "Statistical formula. Functions: LINEST(ys,xs) slope, INTERCEPT(ys,xs), RSQ(ys,xs), CORREL(ys,xs), "
-                    "STDEV([vals]), STDEVP([vals]), MEDIAN([vals]). Variables: nominal, reading, val1..val12 (see refs below)."
-                )
+            self.tol_equation_label.setText("Stat equation")
+            self.tol_equation_edit.setPlaceholderText("e.g. LINEST([val1, val2], [ref1, ref2]) or STDEV([val1, val2, val3])")
+            self.tol_equation_edit.setToolTip(
+                "Statistical formula. Functions: LINEST(ys,xs) slope, INTERCEPT(ys,xs), RSQ(ys,xs), CORREL(ys,xs), "
+                "STDEV([vals]), STDEVP([vals]), MEDIAN([vals]). Variables: nominal, reading, val1..val12 (see refs below)."
+            )
         # Plot type: PLOT([x refs], [y refs]). For side-by-side X,Y columns use odd refs for X, even for Y.
         if is_plot:
             self._refresh_value_combos()
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setText("Plot data")
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setPlaceholderText("e.g. PLOT([val1, val3, val5], [val2, val4, val6])")
-                self.tol_equation_edit.setToolTip(
-                    "PLOT([x1, x2, ...], [y1, y2, ...]). Each point is (x1,y1), (x2,y2), etc. "
-                    "If X and Y are side by side (e.g. Certified Weight then Balance Response), set ref1=X1, ref2=Y1, ref3=X2, ref4=Y2, ... "
-                    "and use: PLOT([val1, val3, val5, ...], [val2, val4, val6, ...]). Charts appear in PDF export; ensure refs point to fields that have values for this record."
-                )
-            if hasattr(self, "plot_group"):
-                self.plot_group.setVisible(True)
-        elif hasattr(self, "plot_group"):
+            self.tol_equation_label.setText("Plot data")
+            self.tol_equation_edit.setPlaceholderText("e.g. PLOT([val1, val3, val5], [val2, val4, val6])")
+            self.tol_equation_edit.setToolTip(
+                "PLOT([x1, x2, ...], [y1, y2, ...]). Each point is (x1,y1), (x2,y2), etc. "
+                "If X and Y are side by side (e.g. Certified Weight then Balance Response), set ref1=X1, ref2=Y1, ref3=X2, ref4=Y2, ... "
+                "and use: PLOT([val1, val3, val5, ...], [val2, val4, val6, ...]). Charts appear in PDF export; ensure refs point to fields that have values for this record."
+            )
+            self.plot_group.setVisible(True)
+        else:
             self.plot_group.setVisible(False)
         # Convert type: show conversion equation and val1-val5 (no pass/fail required)
         if is_convert:
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setText("Conversion equation")
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setPlaceholderText("e.g. (val1-32)/1.8")
-                self.tol_equation_edit.setToolTip("Expression using val1..val12 (see refs below). Use val1, val2, … in the equation; each maps to the field chosen above. Result is stored as this field's value.")
-            if hasattr(self, "tol_type_combo"):
-                self.tol_type_combo.setCurrentIndex(0)
+            self.tol_equation_label.setText("Conversion equation")
+            self.tol_equation_edit.setPlaceholderText("e.g. (val1-32)/1.8")
+            self.tol_equation_edit.setToolTip("Expression using val1..val12 (see refs below). Use val1, val2, … in the equation; each maps to the field chosen above. Result is stored as this field's value.")
+            self.tol_type_combo.setCurrentIndex(0)
         elif not is_stat:
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setText("Tolerance equation")
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setPlaceholderText("e.g. reading <= 0.02 * nominal or val1 < val2 + 0.5")
-                self.tol_equation_edit.setToolTip(
-                    "Must contain a pass/fail condition (<, >, <=, >=, or ==). "
-                    "Variables: nominal, reading, val1..val12 (see Help)."
-                )
-        if hasattr(self, "tol_type_combo"):
-            self._on_tolerance_type_changed(self.tol_type_combo.currentIndex())
-        if hasattr(self, "tol_type_combo"):
-            self.tol_type_combo.setVisible(not is_convert and not is_stat and not is_plot and not is_field_header and not is_reference_cal_date)
-        if is_tolerance and hasattr(self, "test_group"):
-            self.test_group.setVisible(False)
-        if is_convert and hasattr(self, "test_group"):
-            self.test_group.setVisible(False)
-        if is_stat and hasattr(self, "test_group"):
-            self.test_group.setVisible(False)
-        if is_plot and hasattr(self, "test_group"):
-            self.test_group.setVisible(False)
-        if is_reference_cal_date and hasattr(self, "test_group"):
-            self.test_group.setVisible(False)
+            self.tol_equation_label.setText("Tolerance equation")
+            self.tol_equation_edit.setPlaceholderText("e.g. reading <= 0.02 * nominal or val1 < val2 + 0.5")
+            self.tol_equation_edit.setToolTip(
+                "Must contain a pass/fail condition (<, >, <=, >=, or ==). "
+                "Variables: nominal, reading, val1..val12 (see Help)."
+            )
+        self._on_tolerance_type_changed(self.tol_type_combo.currentIndex())
+        self.tol_type_combo.setVisible(not is_convert and not is_stat and not is_plot and not is_field_header and not is_reference_cal_date)
+        if self._ui_ready and (is_tolerance or is_convert or is_stat or is_plot or is_reference_cal_date):
+            self._set_test_group_visible(False)
         # Reference cal date: label is displayed; Instrument reference points to field containing instrument ID
         if is_reference_cal_date:
             self._refresh_value_combos()
-            if hasattr(self, "val1_label"):
-                self.val1_label.setText("Instrument reference")
-                self.val1_label.setToolTip("Field that contains the instrument ID or tag number. Use when the label does not contain the ID.")
-                self.val1_label.setVisible(True)
-            if hasattr(self, "ref1_combo"):
-                self.ref1_combo.setVisible(True)
-                self.ref1_combo.setToolTip("Select the field that holds the reference instrument's ID or tag number.")
-            for i in range(2, 13):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(False)
-                if cb:
-                    cb.setVisible(False)
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setVisible(False)
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setVisible(False)
-            if hasattr(self, "tol_validation_label"):
+            self.val_labels[0].setText("Instrument reference")
+            self.val_labels[0].setToolTip("Field that contains the instrument ID or tag number. Use when the label does not contain the ID.")
+            self.val_labels[0].setVisible(True)
+            self.ref_combos[0].setVisible(True)
+            self.ref_combos[0].setToolTip("Select the field that holds the reference instrument's ID or tag number.")
+            for lbl, cb in zip(self.val_labels[1:], self.ref_combos[1:], strict=True):
+                lbl.setVisible(False)
+                cb.setVisible(False)
+            self.tol_equation_edit.setVisible(False)
+            self.tol_equation_label.setVisible(False)
+            if self._ui_ready:
                 self.tol_validation_label.setVisible(False)
-            if hasattr(self, "var_btn_widget"):
                 self.var_btn_widget.setVisible(False)
-            if hasattr(self, "tol_bool_pass_combo"):
-                self.tol_bool_pass_combo.setVisible(False)
-            if hasattr(self, "tol_bool_pass_label"):
-                self.tol_bool_pass_label.setVisible(False)
+            self.tol_bool_pass_combo.setVisible(False)
+            self.tol_bool_pass_label.setVisible(False)
         # Tolerance-type, convert, stat, and plot fields: show equation + refs (val1-val5 always; val6-val12 only when used)
         elif is_convert or is_stat or is_plot:
-            if hasattr(self, "val1_label"):
-                self.val1_label.setText("val1 field")
-                self.val1_label.setToolTip("")
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setVisible(True)
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setVisible(True)
-            for i in range(1, 6):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(True)
-                if cb:
-                    cb.setVisible(True)
+            self.val_labels[0].setText("val1 field")
+            self.val_labels[0].setToolTip("")
+            self.tol_equation_edit.setVisible(True)
+            self.tol_equation_label.setVisible(True)
+            for lbl, cb in zip(self.val_labels[:5], self.ref_combos[:5], strict=True):
+                lbl.setVisible(True)
+                cb.setVisible(True)
             self._update_val_ref_visibility()
-            if hasattr(self, "var_btn_widget"):
+            if self._ui_ready:
                 self.var_btn_widget.setVisible(True)
-            if hasattr(self, "tol_validation_label"):
                 self.tol_validation_label.setVisible(True)
                 self._on_equation_changed()
-            if hasattr(self, "tol_bool_pass_combo"):
-                self.tol_bool_pass_combo.setVisible(False)
-            if hasattr(self, "tol_bool_pass_label"):
-                self.tol_bool_pass_label.setVisible(False)
+            self.tol_bool_pass_combo.setVisible(False)
+            self.tol_bool_pass_label.setVisible(False)
         # Field Header: label only, appears as header for the group. Hide equation, refs, unit, required.
         if is_field_header:
-            if hasattr(self, "tol_equation_edit"):
-                self.tol_equation_edit.setVisible(False)
-            if hasattr(self, "tol_equation_label"):
-                self.tol_equation_label.setVisible(False)
-            if hasattr(self, "tol_type_combo"):
-                self.tol_type_combo.setVisible(False)
-            for i in range(1, 13):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(False)
-                if cb:
-                    cb.setVisible(False)
-            if hasattr(self, "var_btn_widget"):
+            self.tol_equation_edit.setVisible(False)
+            self.tol_equation_label.setVisible(False)
+            self.tol_type_combo.setVisible(False)
+            for lbl, cb in zip(self.val_labels, self.ref_combos, strict=True):
+                lbl.setVisible(False)
+                cb.setVisible(False)
+            if self._ui_ready:
                 self.var_btn_widget.setVisible(False)
-            if hasattr(self, "test_group"):
-                self.test_group.setVisible(False)
-            if hasattr(self, "plot_group"):
-                self.plot_group.setVisible(False)
-            if hasattr(self, "required_check"):
-                self.required_check.setVisible(False)
-                self.required_check.setChecked(False)
+                self._set_test_group_visible(False)
+            self.plot_group.setVisible(False)
+            self.required_check.setVisible(False)
+            self.required_check.setChecked(False)
         # Tolerance-type, convert, stat, and plot fields are display-only; hide Required.
-        if hasattr(self, "required_check") and not is_field_header:
+        if not is_field_header:
             self.required_check.setVisible(not is_tolerance and not is_convert and not is_stat and not is_plot and not is_reference_cal_date)
             if is_tolerance or is_convert or is_stat or is_plot or is_reference_cal_date:
                 self.required_check.setChecked(False)
@@ -522,133 +462,102 @@ class FieldEditDialog(QtWidgets.QDialog):
         is_stat = (data_type == "stat")
         is_plot = (data_type == "plot")
         is_reference_cal_date = (data_type == "reference_cal_date")
-        tol_type = self.tol_type_combo.currentData() if hasattr(self, "tol_type_combo") else None
+        tol_type = self.tol_type_combo.currentData()
         is_equation = (tol_type == "equation") or is_convert or is_stat or is_plot
         is_bool = (tol_type == "bool") and not is_convert
-        if hasattr(self, "tol_equation_edit"):
-            self.tol_equation_edit.setVisible(is_equation)
-            self.tol_equation_label.setVisible(is_equation)
-        if hasattr(self, "tol_bool_pass_combo"):
-            self.tol_bool_pass_combo.setVisible(is_bool)
-            self.tol_bool_pass_label.setVisible(is_bool)
+        self.tol_equation_edit.setVisible(is_equation)
+        self.tol_equation_label.setVisible(is_equation)
+        self.tol_bool_pass_combo.setVisible(is_bool)
+        self.tol_bool_pass_label.setVisible(is_bool)
         # reference_cal_date: show only val1/ref1 (Instrument reference)
         if is_reference_cal_date:
-            if hasattr(self, "val1_label"):
-                self.val1_label.setVisible(True)
-            if hasattr(self, "ref1_combo"):
-                self.ref1_combo.setVisible(True)
-            for i in range(2, 13):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(False)
-                if cb:
-                    cb.setVisible(False)
+            self.val_labels[0].setVisible(True)
+            self.ref_combos[0].setVisible(True)
+            for lbl, cb in zip(self.val_labels[1:], self.ref_combos[1:], strict=True):
+                lbl.setVisible(False)
+                cb.setVisible(False)
         else:
-            for i in range(1, 6):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(is_equation)
-                if cb:
-                    cb.setVisible(is_equation)
+            for lbl, cb in zip(self.val_labels[:5], self.ref_combos[:5], strict=True):
+                lbl.setVisible(is_equation)
+                cb.setVisible(is_equation)
         if is_equation:
             self._update_val_ref_visibility()
         else:
-            for i in range(6, 13):
-                lbl = getattr(self, f"val{i}_label", None)
-                cb = getattr(self, f"ref{i}_combo", None)
-                if lbl:
-                    lbl.setVisible(False)
-                if cb:
-                    cb.setVisible(False)
-            if hasattr(self, "btn_add_value"):
-                self.btn_add_value.setVisible(False)
-        if hasattr(self, "var_btn_widget"):
+            for lbl, cb in zip(self.val_labels[5:], self.ref_combos[5:], strict=True):
+                lbl.setVisible(False)
+                cb.setVisible(False)
+            self.btn_add_value.setVisible(False)
+        if self._ui_ready:
             self.var_btn_widget.setVisible(is_equation)
-        if hasattr(self, "tol_validation_label"):
             self.tol_validation_label.setVisible(is_equation)
             self._on_equation_changed()
-        if hasattr(self, "test_group"):
-            self.test_group.setVisible(is_equation)
+            self._set_test_group_visible(is_equation)
             self._update_test_result()
 
     def _on_add_value_clicked(self):
         """Reveal the next val6-val12 row (user explicitly added it)."""
-        added = getattr(self, "_added_val_indices", set())
+        added = self._added_val_indices
         for i in range(6, 13):
             if i not in added:
                 added.add(i)
-                if hasattr(self, "_update_val_ref_visibility"):
-                    self._update_val_ref_visibility()
+                self._update_val_ref_visibility()
                 return
         self._update_val_ref_visibility()
 
     def _update_val_ref_visibility(self):
         """Show val6-val12 rows when added via button, or when equation uses them or ref has a selection."""
-        data_type = self.type_combo.currentText() if hasattr(self, "type_combo") else ""
-        tol_type = self.tol_type_combo.currentData() if hasattr(self, "tol_type_combo") else None
+        data_type = self.type_combo.currentText()
+        tol_type = self.tol_type_combo.currentData()
         is_equation = (data_type in ("tolerance", "convert", "stat", "plot") or tol_type == "equation")
-        added = getattr(self, "_added_val_indices", set())
-        if hasattr(self, "btn_add_value"):
-            self.btn_add_value.setVisible(is_equation)
-            self.btn_add_value.setEnabled(len(added) < 7)
+        added = self._added_val_indices
+        self.btn_add_value.setVisible(is_equation)
+        self.btn_add_value.setEnabled(len(added) < 7)
         if not is_equation:
             return
-        eq = self.tol_equation_edit.text().strip() if hasattr(self, "tol_equation_edit") else ""
+        eq = self.tol_equation_edit.text().strip()
         used = set()
         if eq:
             try:
-                from tolerance_service import list_variables
                 used = set(list_variables(eq))
             except Exception:
                 pass
         num_shown = 0
-        for i in range(6, 13):
-            lbl = getattr(self, f"val{i}_label", None)
-            cb = getattr(self, f"ref{i}_combo", None)
+        for i, lbl, cb in zip(range(6, 13), self.val_labels[5:], self.ref_combos[5:], strict=True):
             show = (i in added) or (f"val{i}" in used or f"ref{i}" in used)
-            if cb and cb.currentData() is not None:
+            if cb.currentData() is not None:
                 show = True
-            if lbl:
-                lbl.setVisible(show)
-            if cb:
-                cb.setVisible(show)
+            lbl.setVisible(show)
+            cb.setVisible(show)
             if show:
                 num_shown += 1
-        if hasattr(self, "btn_add_value"):
-            self.btn_add_value.setEnabled(num_shown < 7)
+        self.btn_add_value.setEnabled(num_shown < 7)
+
+    def _on_var_button(self):
+        self._insert_variable(self.sender().text())
 
     def _insert_variable(self, var_name: str):
         """M2: Insert variable at cursor in equation edit."""
-        if not hasattr(self, 'tol_equation_edit'):
-            return
         self.tol_equation_edit.insert(var_name)
         self.tol_equation_edit.setFocus()
 
     def _on_equation_changed(self):
         """Inline validation (syntax, undefined vars; pass/fail required only for tolerance equation)."""
-        if not hasattr(self, "tol_validation_label") or not self.tol_equation_edit.isVisible():
+        self._eq_validate_timer.stop()
+        if not self._ui_ready or not self.tol_equation_edit.isVisible():
             return
         eq = self.tol_equation_edit.text().strip()
         if not eq:
             self.tol_validation_label.setText("")
             return
-        is_convert = getattr(self, "type_combo", None) and self.type_combo.currentText() == "convert"
-        is_stat = getattr(self, "type_combo", None) and self.type_combo.currentText() == "stat"
-        is_plot = getattr(self, "type_combo", None) and self.type_combo.currentText() == "plot"
+        is_convert = self.type_combo.currentText() == "convert"
+        is_stat = self.type_combo.currentText() == "stat"
+        is_plot = self.type_combo.currentText() == "plot"
         try:
             if is_plot:
-                from tolerance_service import parse_plot_equation
                 parse_plot_equation(eq)
                 self.tol_validation_label.setText("✓ Valid")
                 self.tol_validation_label.setStyleSheet("color: #080; font-size: 0.9em;")
             else:
-                from tolerance_service import (
-                    parse_equation,
-                    validate_equation_variables,
-                    equation_has_pass_fail_condition,
-                )
                 parse_equation(eq)
                 ok, unknown = validate_equation_variables(eq)
                 if not ok:
@@ -670,15 +579,32 @@ class FieldEditDialog(QtWidgets.QDialog):
         except (ValueError, SyntaxError) as e:
             self.tol_validation_label.setText(str(e))
             self.tol_validation_label.setStyleSheet("color: #c00; font-size: 0.9em;")
-        if hasattr(self, "_update_val_ref_visibility"):
-            self._update_val_ref_visibility()
+        self._update_val_ref_visibility()
         self._update_test_result()
 
+    def _set_test_group_visible(self, visible: bool):
+        """Show or hide the test panel, connecting its spin boxes only while it is shown."""
+        self.test_group.setVisible(visible)
+        if visible == self._test_signals_connected:
+            return
+        for w in (self.test_nominal_spin, self.test_reading_spin):
+            if visible:
+                w.valueChanged.connect(self._queue_test_result)
+            else:
+                w.valueChanged.disconnect(self._queue_test_result)
+        self._test_signals_connected = visible
+
+    def _queue_test_result(self, _value):
+        self._test_result_timer.start()
+
     def _update_test_result(self):
         """M3: Live tolerance and pass/fail for sample nominal/reading."""
-        if not hasattr(self, 'test_group') or not self.test_group.isVisible():
+        if not self._ui_ready:
             return
-        eq = self.tol_equation_edit.text().strip() if hasattr(self, 'tol_equation_edit') else ""
+        self._test_result_timer.stop()
+        if not self.test_group.isVisible():
+            return
+        eq = self.tol_equation_edit.text().strip()
         nominal = self.test_nominal_spin.value()
         reading = self.test_reading_spin.value()
         if not eq:
@@ -686,11 +612,10 @@ class FieldEditDialog(QtWidgets.QDialog):
             self.test_passfail_label.setText("—")
             return
         try:
-            from tolerance_service import evaluate_tolerance_equation, evaluate_pass_fail
-            v = {"nominal": nominal, "reading": reading}
-            tol_val = evaluate_tolerance_equation(eq, v)
+            # Compiled once per equation string; evaluated once here and reused for pass/fail
+            tol_val = compile_equation(eq).evaluate({"nominal": nominal, "reading": reading})
             self.test_tolerance_label.setText(f"{tol_val:.6g}")
-            pass_, _, expl = evaluate_pass_fail("equation", None, eq, nominal, reading, v)
+            pass_, _, expl = equation_pass_fail(tol_val, nominal, reading)
             # L4: Icon + text (not color-only) for accessibility
             self.test_passfail_label.setText(("\u2713 PASS" if pass_ else "\u2717 FAIL"))
             self.test_passfail_label.setStyleSheet("color: #080;" if pass_ else "color: #c00; font-weight: bold;")
@@ -700,13 +625,11 @@ class FieldEditDialog(QtWidgets.QDialog):
             self.test_passfail_label.setStyleSheet("color: #c00;")
 
     def _show_help(self):
-        title, content = get_help_content("FieldEditDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "FieldEditDialog")
 
     def get_data(self):
+        if self._group_timer.isActive():
+            self._refresh_value_combos()
         name = self.name_edit.text().strip()
         label = self.label_edit.text().strip()
         if not name or not label:
@@ -723,9 +646,7 @@ class FieldEditDialog(QtWidgets.QDialog):
 
         tol_type = self.tol_type_combo.currentData()
         tolerance_equation = None
-        ref1_name = ref2_name = ref3_name = ref4_name = ref5_name = None
-        ref6_name = ref7_name = ref8_name = ref9_name = ref10_name = None
-        ref11_name = ref12_name = None
+        ref_names = [None] * 12
 
         # Stat type: equation (e.g. LINEST) + refs, no pass/fail required
         if data_type == "stat":
@@ -737,7 +658,6 @@ class FieldEditDialog(QtWidgets.QDialog):
                 )
                 return None
             try:
-                from tolerance_service import parse_equation, validate_equation_variables
                 parse_equation(tolerance_equation)
                 ok, unknown = validate_equation_variables(tolerance_equation)
                 if not ok:
@@ -750,18 +670,7 @@ class FieldEditDialog(QtWidgets.QDialog):
                 QtWidgets.QMessageBox.warning(self, "Validation", f"Invalid equation: {e}")
                 return None
             tol_type = "equation"
-            ref1_name = self.ref1_combo.currentData()
-            ref2_name = self.ref2_combo.currentData()
-            ref3_name = self.ref3_combo.currentData()
-            ref4_name = self.ref4_combo.currentData()
-            ref5_name = self.ref5_combo.currentData()
-            ref6_name = self.ref6_combo.currentData()
-            ref7_name = self.ref7_combo.currentData()
-            ref8_name = self.ref8_combo.currentData()
-            ref9_name = self.ref9_combo.currentData()
-            ref10_name = self.ref10_combo.currentData()
-            ref11_name = self.ref11_combo.currentData()
-            ref12_name = self.ref12_combo.currentData()
+            ref_names = [cb.currentData() for cb in self.ref_combos]
         # Plot type: PLOT([x refs], [y refs]) + refs; up to 12 total
         elif data_type == "plot":
             tolerance_equation = self.tol_equation_edit.text().strip() or None
@@ -772,27 +681,15 @@ class FieldEditDialog(QtWidgets.QDialog):
                 )
                 return None
             try:
-                from tolerance_service import parse_plot_equation
                 parse_plot_equation(tolerance_equation)
             except ValueError as e:
                 QtWidgets.QMessageBox.warning(self, "Validation", f"Invalid plot: {e}")
                 return None
-            ref1_name = self.ref1_combo.currentData()
-            ref2_name = self.ref2_combo.currentData()
-            ref3_name = self.ref3_combo.currentData()
-            ref4_name = self.ref4_combo.currentData()
-            ref5_name = self.ref5_combo.currentData()
-            ref6_name = self.ref6_combo.currentData()
-            ref7_name = self.ref7_combo.currentData()
-            ref8_name = self.ref8_combo.currentData()
-            ref9_name = self.ref9_combo.currentData()
-            ref10_name = self.ref10_combo.currentData()
-            ref11_name = self.ref11_combo.currentData()
-            ref12_name = self.ref12_combo.currentData()
+            ref_names = [cb.currentData() for cb in self.ref_combos]
         # Reference cal date: ref1 = field containing instrument ID (tag or numeric)
         elif data_type == "reference_cal_date":
-            ref1_name = self.ref1_combo.currentData()
-            if not ref1_name:
+            ref_names[0] = self.ref_combos[0].currentData()
+            if not ref_names[0]:
                 QtWidgets.QMessageBox.warning(
                     self, "Validation",
                     "Instrument reference is required. Select the field that contains the reference instrument's ID or tag number.",
@@ -808,7 +705,6 @@ class FieldEditDialog(QtWidgets.QDialog):
                 )
                 return None
             try:
-                from tolerance_service import parse_equation, validate_equation_variables
                 parse_equation(tolerance_equation)
                 ok, unknown = validate_equation_variables(tolerance_equation)
                 if not ok:
@@ -820,18 +716,7 @@ class FieldEditDialog(QtWidgets.QDialog):
             except ValueError as e:
                 QtWidgets.QMessageBox.warning(self, "Validation", f"Invalid equation: {e}")
                 return None
-            ref1_name = self.ref1_combo.currentData()
-            ref2_name = self.ref2_combo.currentData()
-            ref3_name = self.ref3_combo.currentData()
-            ref4_name = self.ref4_combo.currentData()
-            ref5_name = self.ref5_combo.currentData()
-            ref6_name = self.ref6_combo.currentData()
-            ref7_name = self.ref7_combo.currentData()
-            ref8_name = self.ref8_combo.currentData()
-            ref9_name = self.ref9_combo.currentData()
-            ref10_name = self.ref10_combo.currentData()
-            ref11_name = self.ref11_combo.currentData()
-            ref12_name = self.ref12_combo.currentData()
+            ref_names = [cb.currentData() for cb in self.ref_combos]
         # Tolerance type (read-only display field) requires equation like equation tolerance
         elif data_type == "tolerance":
             tol_type = "equation"
@@ -844,11 +729,6 @@ class FieldEditDialog(QtWidgets.QDialog):
                 )
                 return None
             try:
-                from tolerance_service import (
-                    parse_equation,
-                    validate_equation_variables,
-                    equation_has_pass_fail_condition,
-                )
                 parse_equation(tolerance_equation)
                 ok, unknown = validate_equation_variables(tolerance_equation)
                 if not ok:
@@ -866,18 +746,7 @@ class FieldEditDialog(QtWidgets.QDialog):
             except ValueError as e:
                 QtWidgets.QMessageBox.warning(self, "Validation", f"Invalid equation: {e}")
                 return None
-            ref1_name = self.ref1_combo.currentData()
-            ref2_name = self.ref2_combo.currentData()
-            ref3_name = self.ref3_combo.currentData()
-            ref4_name = self.ref4_combo.currentData()
-            ref5_name = self.ref5_combo.currentData()
-            ref6_name = self.ref6_combo.currentData()
-            ref7_name = self.ref7_combo.currentData()
-            ref8_name = self.ref8_combo.currentData()
-            ref9_name = self.ref9_combo.currentData()
-            ref10_name = self.ref10_combo.currentData()
-            ref11_name = self.ref11_combo.currentData()
-            ref12_name = self.ref12_combo.currentData()
+            ref_names = [cb.currentData() for cb in self.ref_combos]
         elif tol_type == "bool":
             tolerance_equation = self.tol_bool_pass_combo.currentData() or "true"
 
@@ -890,18 +759,7 @@ class FieldEditDialog(QtWidgets.QDialog):
             "sort_order": self.sort_spin.value(),
             "group_name": self.group_edit.text().strip() or None,
             "calc_type": None,
-            "calc_ref1_name": ref1_name,
-            "calc_ref2_name": ref2_name,
-            "calc_ref3_name": ref3_name,
-            "calc_ref4_name": ref4_name,
-            "calc_ref5_name": ref5_name,
-            "calc_ref6_name": ref6_name,
-            "calc_ref7_name": ref7_name,
-            "calc_ref8_name": ref8_name,
-            "calc_ref9_name": ref9_name,
-            "calc_ref10_name": ref10_name,
-            "calc_ref11_name": ref11_name,
-            "calc_ref12_name": ref12_name,
+            **{f"calc_ref{i}_name": ref_name for i, ref_name in enumerate(ref_names, 1)},
             "tolerance": None,
             "tolerance_type": tol_type,
             "tolerance_equation": tolerance_equation,
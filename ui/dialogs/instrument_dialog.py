@@ -1,11 +1,15 @@
 # ui/dialogs/instrument_dialog.py - Instrument add/edit dialog
 
-from datetime import datetime
-
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 from database import CalibrationRepository
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
+
+# Combo entries (calibration type matches the DB CHECK constraint) and their indices
+_CALIBRATION_TYPES = ("SEND_OUT", "PULL_IN")
+_STATUSES = ("ACTIVE", "RETIRED", "OUT_FOR_CAL")
+_CALIBRATION_TYPE_INDEX = {t: i for i, t in enumerate(_CALIBRATION_TYPES)}
+_STATUS_INDEX = {s: i for i, s in enumerate(_STATUSES)}
 
 
 class InstrumentDialog(QtWidgets.QDialog):
@@ -27,17 +31,21 @@ class InstrumentDialog(QtWidgets.QDialog):
         # Instrument type
         self.instrument_type_combo = QtWidgets.QComboBox()
         self.instrument_type_combo.addItem("", None)
+        self._type_index_by_id = {}  # instrument type id -> combo index
         for t in self.repo.list_instrument_types():
+            self._type_index_by_id.setdefault(t["id"], self.instrument_type_combo.count())
             self.instrument_type_combo.addItem(t["name"], t["id"])
 
         # Calibration type (match DB CHECK constraint: 'SEND_OUT' / 'PULL_IN')
         self.type_combo = QtWidgets.QComboBox()
-        self.type_combo.addItems(["SEND_OUT", "PULL_IN"])
+        self.type_combo.addItems(_CALIBRATION_TYPES)
 
         # Destination
         self.dest_combo = QtWidgets.QComboBox()
         self.dest_combo.addItem("", None)
+        self._dest_index_by_id = {}  # destination id -> combo index
         for d in self.repo.list_destinations():
+            self._dest_index_by_id.setdefault(d["id"], self.dest_combo.count())
             self.dest_combo.addItem(d["name"], d["id"])
 
         # Last and next due dates
@@ -54,7 +62,7 @@ class InstrumentDialog(QtWidgets.QDialog):
         self._update_next_due_from_last()
 
         self.status_combo = QtWidgets.QComboBox()
-        self.status_combo.addItems(["ACTIVE", "RETIRED", "OUT_FOR_CAL"])
+        self.status_combo.addItems(_STATUSES)
 
         self.notes_edit = QtWidgets.QPlainTextEdit()
         self.notes_edit.setPlaceholderText("Optional notes about this instrument")
@@ -92,7 +100,13 @@ class InstrumentDialog(QtWidgets.QDialog):
         btn_box.helpRequested.connect(lambda: self._show_help())
         form.addRow(btn_box)
 
-        self.id_edit.textChanged.connect(self._validate_id_field)
+        # Validate once typing pauses (each keystroke restarts the timer); tab-out validates right away
+        self._last_valid = None  # validity last applied to the ID field's style
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self._validate_id_field)
+        self.id_edit.textChanged.connect(lambda _text: self._validate_timer.start())
         self.id_edit.editingFinished.connect(self._validate_id_field)
 
         if instrument:
@@ -101,15 +115,15 @@ class InstrumentDialog(QtWidgets.QDialog):
             self.id_edit.setFocus()
 
     def _show_help(self):
-        title, content = get_help_content("InstrumentDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "InstrumentDialog")
 
     def _validate_id_field(self):
+        self._validate_timer.stop()
         text = self.id_edit.text().strip()
         is_valid = bool(text)
+        if is_valid == self._last_valid:
+            return is_valid
+        self._last_valid = is_valid
         if is_valid:
             self.id_edit.setStyleSheet("")
             self._id_error_label.hide()
@@ -134,39 +148,30 @@ class InstrumentDialog(QtWidgets.QDialog):
         self.id_edit.setText(inst.get("tag_number", ""))
         self.location_edit.setText(inst.get("location", ""))
 
-        inst_type_id = inst.get("instrument_type_id")
-        if inst_type_id is not None:
-            for i in range(self.instrument_type_combo.count()):
-                if self.instrument_type_combo.itemData(i) == inst_type_id:
-                    self.instrument_type_combo.setCurrentIndex(i)
-                    break
+        idx = self._type_index_by_id.get(inst.get("instrument_type_id"))
+        if idx is not None:
+            self.instrument_type_combo.setCurrentIndex(idx)
 
-        t = inst.get("calibration_type") or "SEND_OUT"
-        idx = self.type_combo.findText(t)
-        if idx >= 0:
+        idx = _CALIBRATION_TYPE_INDEX.get(inst.get("calibration_type") or "SEND_OUT")
+        if idx is not None:
             self.type_combo.setCurrentIndex(idx)
 
-        dest_id = inst.get("destination_id")
-        if dest_id is not None:
-            for i in range(self.dest_combo.count()):
-                if self.dest_combo.itemData(i) == dest_id:
-                    self.dest_combo.setCurrentIndex(i)
-                    break
+        idx = self._dest_index_by_id.get(inst.get("destination_id"))
+        if idx is not None:
+            self.dest_combo.setCurrentIndex(idx)
 
         def set_date(widget, value):
-            if value:
-                try:
-                    d = datetime.strptime(value, "%Y-%m-%d").date()
-                    widget.setDate(QtCore.QDate(d.year, d.month, d.day))
-                except Exception:
-                    pass
+            if not value:
+                return
+            qd = QtCore.QDate.fromString(value, "yyyy-MM-dd")
+            if qd.isValid():
+                widget.setDate(qd)
 
         set_date(self.last_cal_date, inst.get("last_cal_date"))
         set_date(self.next_due_date, inst.get("next_due_date"))
 
-        st = inst.get("status", "ACTIVE")
-        idx = self.status_combo.findText(st)
-        if idx >= 0:
+        idx = _STATUS_INDEX.get(inst.get("status", "ACTIVE"))
+        if idx is not None:
             self.status_combo.setCurrentIndex(idx)
 
         self.notes_edit.setPlainText(inst.get("notes", ""))
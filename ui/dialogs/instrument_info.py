@@ -2,10 +2,10 @@
 
 from datetime import datetime, date
 
-from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5 import QtWidgets, QtGui
 
 from database import CalibrationRepository
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 from ui.dialogs.audit_log import AuditLogDialog
 
 
@@ -119,11 +119,7 @@ class InstrumentInfoDialog(QtWidgets.QDialog):
         layout.addWidget(btn_box)
 
     def _show_help(self):
-        title, content = get_help_content("InstrumentInfoDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "InstrumentInfoDialog")
 
     def on_history(self):
         dlg = AuditLogDialog(self.repo, self.instrument_id, parent=self)
@@ -1,10 +1,30 @@
 # ui/dialogs/personnel_dialog.py - Manage personnel list
 
-from PyQt5 import QtWidgets, QtCore
+import bisect
+
+from PyQt5 import QtWidgets
 
 from database import CalibrationRepository
 from services import personnel_service
 from ui.dialogs.personnel_edit_dialog import PersonnelEditDialog
+from ui.table_models import RecordTableModel
+
+
+def _person_row(person_id, data):
+    """Table row for a person as saved from PersonnelEditDialog data (same shape as list_personnel)."""
+    name = (data.get("name") or "").strip()
+    role = (data.get("role") or "").strip()
+    qualifications = (data.get("qualifications") or "").strip()
+    return {
+        "id": person_id,
+        "name": name,
+        "role": role,
+        "qualifications": qualifications,
+        "review_expiry": data.get("review_expiry"),
+        "active": 1 if data.get("active", True) else 0,
+        "display_name": f"{name} ({role})" if role else name,
+        "_qualifications": qualifications[:80],
+    }
 
 
 class PersonnelDialog(QtWidgets.QDialog):
@@ -15,9 +35,14 @@ class PersonnelDialog(QtWidgets.QDialog):
         self.repo = repo
         self.setWindowTitle("Personnel")
         layout = QtWidgets.QVBoxLayout(self)
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Name", "Role", "Qualifications", "Review expiry"])
+        self.model = RecordTableModel([
+            ("Name", "name"),
+            ("Role", "role"),
+            ("Qualifications", "_qualifications"),
+            ("Review expiry", "review_expiry"),
+        ], parent=self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         layout.addWidget(self.table)
@@ -40,34 +65,34 @@ class PersonnelDialog(QtWidgets.QDialog):
 
     def _load(self):
         people = self.repo.list_personnel(active_only=False)
-        self.table.setRowCount(len(people))
-        for row, p in enumerate(people):
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(p.get("name", "")))
-            self.table.item(row, 0).setData(QtCore.Qt.UserRole, p["id"])
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(p.get("role", "") or ""))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem((p.get("qualifications") or "")[:80]))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(p.get("review_expiry") or ""))
+        for p in people:
+            p["_qualifications"] = (p.get("qualifications") or "")[:80]
+        self.model.set_rows(people)
 
     def _selected_id(self):
-        row = self.table.currentRow()
-        if row < 0:
-            return None
-        item = self.table.item(row, 0)
-        return item.data(QtCore.Qt.UserRole) if item else None
+        person = self.model.row_at(self.table.currentIndex().row())
+        return person["id"] if person else None
+
+    def _insert_sorted(self, person):
+        """Insert person where list_personnel (ORDER BY name) would put it and select it."""
+        pos = bisect.bisect_right(self.model.rows, person["name"], key=lambda p: p["name"])
+        self.model.insert_row(pos, person)
+        self.table.selectRow(pos)
 
     def on_add(self):
         dlg = PersonnelEditDialog(self.repo, parent=self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
             data = dlg.get_data()
             if data:
-                personnel_service.add_personnel(
+                pid = personnel_service.add_personnel(
                     self.repo,
                     data["name"], data["role"], data["qualifications"],
                     data.get("review_expiry"), data.get("active", True),
                 )
-                self._load()
+                self._insert_sorted(_person_row(pid, data))
 
     def on_edit(self):
+        row = self.table.currentIndex().row()
         pid = self._selected_id()
         if not pid:
             return
@@ -83,9 +108,15 @@ class PersonnelDialog(QtWidgets.QDialog):
                     pid, data["name"], data["role"], data["qualifications"],
                     data.get("review_expiry"), data.get("active", True),
                 )
-                self._load()
+                person = _person_row(pid, data)
+                if person["name"] == self.model.rows[row]["name"]:
+                    self.model.replace_row(row, person)
+                else:
+                    self.model.remove_row(row)
+                    self._insert_sorted(person)
 
     def on_delete(self):
+        row = self.table.currentIndex().row()
         pid = self._selected_id()
         if not pid:
             return
@@ -97,6 +128,6 @@ class PersonnelDialog(QtWidgets.QDialog):
             return
         try:
             personnel_service.delete_personnel(self.repo, pid)
-            self._load()
+            self.model.remove_row(row)
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
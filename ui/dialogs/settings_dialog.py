@@ -7,7 +7,7 @@ from PyQt5 import QtWidgets, QtCore
 
 from database import CalibrationRepository
 from services import settings_service
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 
 
 class SettingsDialog(QtWidgets.QDialog):
@@ -53,18 +53,10 @@ class SettingsDialog(QtWidgets.QDialog):
         self.quiet_end_edit.setDisplayFormat("HH:mm")
         _qstart = self.repo.get_setting("quiet_start", "")
         _qend = self.repo.get_setting("quiet_end", "")
-        if _qstart and len(_qstart) >= 5:
-            try:
-                h, m = int(_qstart[:2]), int(_qstart[3:5])
-                self.quiet_start_edit.setTime(QtCore.QTime(h, m))
-            except Exception:
-                pass
-        if _qend and len(_qend) >= 5:
-            try:
-                h, m = int(_qend[:2]), int(_qend[3:5])
-                self.quiet_end_edit.setTime(QtCore.QTime(h, m))
-            except Exception:
-                pass
+        for edit, value in ((self.quiet_start_edit, _qstart), (self.quiet_end_edit, _qend)):
+            qt = QtCore.QTime.fromString((value or "")[:5], "HH:mm")
+            if qt.isValid():
+                edit.setTime(qt)
         quiet_layout.addWidget(self.quiet_start_edit)
         quiet_layout.addWidget(QtWidgets.QLabel("to"))
         quiet_layout.addWidget(self.quiet_end_edit)
@@ -122,11 +114,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.btn_box.helpRequested.connect(lambda: self._show_help())
 
     def _show_help(self):
-        title, content = get_help_content("SettingsDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "SettingsDialog")
 
     def _browse_export_directory(self):
         start = self.export_dir_edit.text().strip()
@@ -156,19 +144,15 @@ class SettingsDialog(QtWidgets.QDialog):
         if ok_btn:
             ok_btn.setEnabled(False)
         try:
-            settings_service.set_setting(
-                self.repo, "reminder_days", str(self.reminder_days_spin.value())
-            )
-            settings_service.set_setting(
-                self.repo, "operator_name", self.operator_edit.text().strip()
-            )
             qstart = self.quiet_start_edit.time().toString("HH:mm")
             qend = self.quiet_end_edit.time().toString("HH:mm")
-            settings_service.set_setting(self.repo, "quiet_start", qstart)
-            settings_service.set_setting(self.repo, "quiet_end", qend)
-            settings_service.set_setting(
-                self.repo, "export_directory", self.export_dir_edit.text().strip()
-            )
+            settings_service.set_settings(self.repo, {
+                "reminder_days": str(self.reminder_days_spin.value()),
+                "operator_name": self.operator_edit.text().strip(),
+                "quiet_start": qstart,
+                "quiet_end": qend,
+                "export_directory": self.export_dir_edit.text().strip(),
+            })
             try:
                 from file_utils import atomic_write_text
                 base = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
@@ -5,11 +5,17 @@ from datetime import date
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 from database import CalibrationRepository
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 
 
 class TemplateEditDialog(QtWidgets.QDialog):
-    def __init__(self, repo: CalibrationRepository, template=None, parent=None):
+    # Notes editor wraps only at word boundaries; setDefaultTextOption copies it, so one instance serves every dialog
+    _WRAP_OPTION = QtGui.QTextOption()
+    _WRAP_OPTION.setWrapMode(QtGui.QTextOption.WordWrap)
+
+    def __init__(self, repo: CalibrationRepository, template=None, parent=None, authorized_ids=None):
+        """authorized_ids: the template's authorized person IDs if the caller already loaded them
+        (e.g. via get_template_authorized_person_ids_bulk); otherwise they are queried here."""
         super().__init__(parent)
         self.repo = repo
         # Store template - ensure it's a dict
@@ -38,10 +44,7 @@ class TemplateEditDialog(QtWidgets.QDialog):
 
         # Create notes editor and set word wrap, then set text
         self.notes_edit = QtWidgets.QPlainTextEdit()
-        # Set word wrap to only break at word boundaries
-        option = QtGui.QTextOption()
-        option.setWrapMode(QtGui.QTextOption.WordWrap)
-        self.notes_edit.document().setDefaultTextOption(option)
+        self.notes_edit.document().setDefaultTextOption(self._WRAP_OPTION)
         # Set the text after configuring the document
         if template_notes:
             self.notes_edit.setPlainText(template_notes)
@@ -66,33 +69,41 @@ class TemplateEditDialog(QtWidgets.QDialog):
         form.addRow("Effective date", self.effective_date_edit)
         self._update_template_lock_state()
 
-        # Authorized performers (M7): who can perform calibrations with this template
-        form.addRow(QtWidgets.QLabel("<b>Authorized performers</b>"))
-        select_active_btn = QtWidgets.QPushButton("Select all active")
-        select_active_btn.setToolTip("Select only active personnel (reduces form filling for new templates)")
-        form.addRow("", select_active_btn)
-        self.authorized_list = QtWidgets.QListWidget()
+        # Authorized performers (M7): who can perform calibrations with this template.
+        # The list is only built when the group is first expanded; until then the stored IDs are kept as-is.
         try:
-            all_people = self.repo.list_personnel(active_only=False)
+            active_ids = self.repo.get_active_personnel_ids()
         except Exception:
-            all_people = []
-        self._personnel = all_people
-        active_ids = {p["id"] for p in all_people if p.get("active", True)}
-        try:
-            auth_ids = self.repo.get_template_authorized_person_ids(self.template["id"]) if self.template.get("id") else []
-        except Exception:
-            auth_ids = []
+            active_ids = frozenset()
+        if authorized_ids is not None:
+            auth_ids = list(authorized_ids)
+        else:
+            try:
+                auth_ids = self.repo.get_template_authorized_person_ids(self.template["id"]) if self.template.get("id") else []
+            except Exception:
+                auth_ids = []
         # New template: default to all active personnel so user doesn't have to fill form
         if not self.template.get("id") and not auth_ids and active_ids:
             auth_ids = list(active_ids)
-        for p in all_people:
-            item = QtWidgets.QListWidgetItem(p.get("name", "") + (f" ({p.get('role', '')})" if p.get("role") else ""))
-            item.setData(QtCore.Qt.UserRole, p["id"])
-            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
-            item.setCheckState(QtCore.Qt.Checked if p["id"] in auth_ids else QtCore.Qt.Unchecked)
-            self.authorized_list.addItem(item)
+        self._auth_ids = auth_ids
+        self._auth_built = False
+        self._auth_group = QtWidgets.QGroupBox("Authorized performers")
+        self._auth_group.setCheckable(True)
+        self._auth_group.setChecked(False)
+        self._auth_group.setToolTip("Check to show and edit who may perform this procedure")
+        self._auth_body = QtWidgets.QWidget()
+        auth_form = QtWidgets.QFormLayout(self._auth_body)
+        auth_form.setContentsMargins(0, 0, 0, 0)
+        select_active_btn = QtWidgets.QPushButton("Select all active")
+        select_active_btn.setToolTip("Select only active personnel (reduces form filling for new templates)")
         select_active_btn.clicked.connect(lambda: self._authorized_select_active(active_ids))
-        form.addRow("Personnel who may perform this procedure:", self.authorized_list)
+        auth_form.addRow("", select_active_btn)
+        self.authorized_list = QtWidgets.QListWidget()
+        auth_form.addRow("Personnel who may perform this procedure:", self.authorized_list)
+        QtWidgets.QVBoxLayout(self._auth_group).addWidget(self._auth_body)
+        self._auth_body.setVisible(False)
+        self._auth_group.toggled.connect(self._populate_authorized_once)
+        form.addRow(self._auth_group)
         self.status_combo.currentIndexChanged.connect(self._update_template_lock_state)
 
         btn_box = QtWidgets.QDialogButtonBox(
@@ -107,72 +118,45 @@ class TemplateEditDialog(QtWidgets.QDialog):
         self.setMinimumSize(400, 380)
         self.resize(500, 480)
 
-        # Explicitly ensure values are set (in case of any initialization issues)
-        if self.template:
-            self._load_template_data()
-
-    def _load_template_data(self):
-        """Explicitly load template data into widgets."""
-        if not self.template:
-            return
-
-        # Set name - try multiple possible key names
-        name = self.template.get("name") or self.template.get("Name") or ""
-        if name:
-            self.name_edit.setText(str(name))
-            self.name_edit.repaint()
-
-        # Set version - handle both int and string
-        version = self.template.get("version") or self.template.get("Version") or 1
-        try:
-            if isinstance(version, str):
-                version = int(version)
-            else:
-                version = int(version)
-            self.version_spin.setValue(version)
-            self.version_spin.repaint()
-        except (ValueError, TypeError):
-            self.version_spin.setValue(1)
-
-        # Set active status - handle both int and bool
-        is_active = self.template.get("is_active") or self.template.get("IsActive")
-        if is_active is None:
-            is_active = 1  # Default to active
-        is_active = bool(int(is_active)) if isinstance(is_active, (int, str)) else bool(is_active)
-        self.active_check.setChecked(is_active)
-        self.active_check.repaint()
-
-        # Set notes
-        notes = self.template.get("notes") or self.template.get("Notes") or ""
-        if notes:
-            self.notes_edit.setPlainText(str(notes))
-            self.notes_edit.repaint()
-
     def showEvent(self, event):
         """Override showEvent to ensure dialog is properly displayed."""
         super().showEvent(event)
-        # Force layout update and ensure widgets are visible
+        # Force layout update
         self.adjustSize()
         self.updateGeometry()
-        # Ensure all widgets are shown
-        for widget in self.findChildren(QtWidgets.QWidget):
-            widget.show()
-        # Reload template data after dialog is shown to ensure values are displayed
-        if self.template:
-            QtCore.QTimer.singleShot(0, self._load_template_data)
 
     def _show_help(self):
-        title, content = get_help_content("TemplateEditDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "TemplateEditDialog")
 
     def _on_ok_clicked(self):
         """Validate and accept only if all required fields are filled."""
         if self.get_data() is not None:
             self.accept()
 
+    def _populate_authorized_once(self, checked):
+        """Expand/collapse the authorized performers list, filling it on first expand."""
+        self._auth_body.setVisible(checked)
+        if not checked or self._auth_built:
+            return
+        self._auth_built = True
+        try:
+            all_people = self.repo.list_personnel(active_only=False)
+        except Exception:
+            all_people = []
+        # Fill with updates and signals held off so the list lays out once
+        self.authorized_list.setUpdatesEnabled(False)
+        was_blocked = self.authorized_list.blockSignals(True)
+        try:
+            for p in all_people:
+                item = QtWidgets.QListWidgetItem(p["display_name"])
+                item.setData(QtCore.Qt.UserRole, p["id"])
+                item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+                item.setCheckState(QtCore.Qt.Checked if p["id"] in self._auth_ids else QtCore.Qt.Unchecked)
+                self.authorized_list.addItem(item)
+        finally:
+            self.authorized_list.blockSignals(was_blocked)
+            self.authorized_list.setUpdatesEnabled(True)
+
     def _authorized_select_active(self, active_ids):
         for i in range(self.authorized_list.count()):
             item = self.authorized_list.item(i)
@@ -220,6 +204,8 @@ class TemplateEditDialog(QtWidgets.QDialog):
 
     def get_authorized_person_ids(self):
         """Return list of checked personnel IDs (authorized to perform this template)."""
+        if not self._auth_built:
+            return list(self._auth_ids)
         ids = []
         for i in range(self.authorized_list.count()):
             item = self.authorized_list.item(i)
@@ -6,7 +6,7 @@ from PyQt5 import QtWidgets, QtCore
 
 from database import CalibrationRepository
 from services import template_service
-from ui.help_content import get_help_content, HelpDialog
+from ui.help_content import show_help_dialog
 from ui.dialogs.field_edit_dialog import FieldEditDialog
 from ui.dialogs.explain_tolerance_dialog import ExplainToleranceDialog
 
@@ -15,6 +15,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.repo = repo
         self.template_id = template_id
+        # id -> field, refilled by every _fields() call
+        self._fields_by_id = {}
 
         tpl = self.repo.get_template(template_id)
         self.setWindowTitle(f"Fields - {tpl['name']} (v{tpl['version']})")
@@ -105,11 +107,7 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
         QtWidgets.QApplication.processEvents()
     
     def _show_help(self):
-        title, content = get_help_content("TemplateFieldsDialog")
-        dlg = HelpDialog(title, content, self)
-        dlg.open()
-        dlg.raise_()
-        dlg.activateWindow()
+        show_help_dialog(self, "TemplateFieldsDialog")
 
     def _db_error(self, e):
         QtWidgets.QMessageBox.critical(
@@ -197,6 +195,16 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             self.table.viewport().update()
             QtWidgets.QApplication.processEvents()
 
+    def _fields(self):
+        """
+        Current template fields, also indexed into self._fields_by_id. Read fresh on every call so a
+        handler never writes back another user's stale copy; the repository's lookup cache keeps this
+        cheap until the database actually changes.
+        """
+        fields = self.repo.list_template_fields(self.template_id)
+        self._fields_by_id = {f["id"]: f for f in fields}
+        return fields
+
     def _selected_field_ids(self):
         """Return list of field IDs for selected rows (M5 multi-select)."""
         ids = []
@@ -232,7 +240,7 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
 
     def on_add(self):
         try:
-            fields = self.repo.list_template_fields(self.template_id)
+            fields = self._fields()
         except sqlite3.OperationalError as e:
             self._db_error(e)
             return
@@ -294,8 +302,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
         field_id = self._selected_field_id()
         if not field_id:
             return
-        fields = self.repo.list_template_fields(self.template_id)
-        field = next((f for f in fields if f["id"] == field_id), None)
+        fields = self._fields()
+        field = self._fields_by_id.get(field_id)
         if not field:
             return
         dlg = FieldEditDialog(field=field, existing_fields=fields, parent=self)
@@ -343,11 +351,11 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             )
             return
         try:
-            fields = self.repo.list_template_fields(self.template_id)
+            self._fields()
         except sqlite3.OperationalError as e:
             self._db_error(e)
             return
-        field = next((f for f in fields if f["id"] == field_id), None)
+        field = self._fields_by_id.get(field_id)
         if not field:
             return
         dlg = ExplainToleranceDialog(field, parent=self)
@@ -381,8 +389,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             return
         tol_eq = tol_eq.strip()
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             applied = 0
             for fid in ids:
                 f = field_by_id.get(fid)
@@ -429,8 +437,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             return
         unit = unit.strip() or None
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             applied = 0
             for fid in ids:
                 f = field_by_id.get(fid)
@@ -467,8 +475,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
         if not ok:
             return
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             supported = ("number", "convert", "tolerance", "reference", "stat")
             applied = 0
             for fid in ids:
@@ -508,8 +516,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             return
         group_name = group_name.strip() or None
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             applied = 0
             for fid in ids:
                 f = field_by_id.get(fid)
@@ -560,8 +568,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
         idx = display_names.index(chosen)
         new_type = type_options[idx]
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             applied = 0
             for fid in ids:
                 f = field_by_id.get(fid)
@@ -590,8 +598,8 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
             )
             return
         try:
-            fields = self.repo.list_template_fields(self.template_id)
-            field_by_id = {f["id"]: f for f in fields}
+            self._fields()
+            field_by_id = self._fields_by_id
             applied = 0
             for fid in ids:
                 f = field_by_id.get(fid)
@@ -614,7 +622,7 @@ class TemplateFieldsDialog(QtWidgets.QDialog):
 
     def on_dup_group(self):
         try:
-            fields = self.repo.list_template_fields(self.template_id)
+            fields = self._fields()
         except sqlite3.OperationalError as e:
             self._db_error(e)
             return
@@ -142,49 +142,9 @@ class TemplatesDialog(QtWidgets.QDialog):
                 status="Draft",
             )
             fields = self.repo.list_template_fields(tpl_id)
-            for i, f in enumerate(fields):
-                template_service.add_template_field(
-                    self.repo,
-                    template_id=new_id,
-                    name=f.get("name", ""),
-                    label=f.get("label", ""),
-                    data_type=f.get("data_type", "number"),
-                    unit=f.get("unit"),
-                    required=bool(f.get("required")),
-                    sort_order=i,
-                    group_name=f.get("group_name"),
-                    calc_type=f.get("calc_type"),
-                    calc_ref1_name=f.get("calc_ref1_name"),
-                    calc_ref2_name=f.get("calc_ref2_name"),
-                    calc_ref3_name=f.get("calc_ref3_name"),
-                    calc_ref4_name=f.get("calc_ref4_name"),
-                    calc_ref5_name=f.get("calc_ref5_name"),
-                    calc_ref6_name=f.get("calc_ref6_name"),
-                    calc_ref7_name=f.get("calc_ref7_name"),
-                    calc_ref8_name=f.get("calc_ref8_name"),
-                    calc_ref9_name=f.get("calc_ref9_name"),
-                    calc_ref10_name=f.get("calc_ref10_name"),
-                    calc_ref11_name=f.get("calc_ref11_name"),
-                    calc_ref12_name=f.get("calc_ref12_name"),
-                    tolerance=f.get("tolerance"),
-                    autofill_from_first_group=bool(f.get("autofill_from_first_group", 0)),
-                    default_value=f.get("default_value"),
-                    tolerance_type=f.get("tolerance_type"),
-                    tolerance_equation=f.get("tolerance_equation"),
-                    nominal_value=f.get("nominal_value"),
-                    tolerance_lookup_json=f.get("tolerance_lookup_json"),
-                    sig_figs=f.get("sig_figs", 3),
-                    stat_value_group=f.get("stat_value_group"),
-                    plot_x_axis_name=f.get("plot_x_axis_name"),
-                    plot_y_axis_name=f.get("plot_y_axis_name"),
-                    plot_title=f.get("plot_title"),
-                    plot_x_min=f.get("plot_x_min"),
-                    plot_x_max=f.get("plot_x_max"),
-                    plot_y_min=f.get("plot_y_min"),
-                    plot_y_max=f.get("plot_y_max"),
-                    plot_best_fit=bool(f.get("plot_best_fit", 0)),
-                    appear_in_calibrations_table=bool(f.get("appear_in_calibrations_table", 0)),
-                )
+            # Renumber sort_order so the copy has contiguous ordering
+            copies = [dict(f, sort_order=i) for i, f in enumerate(fields)]
+            template_service.bulk_add_template_fields(self.repo, new_id, copies)
             self._load_templates()
             QtWidgets.QMessageBox.information(
                 self, "Cloned", f"Created '{new_name}' with {len(fields)} field(s). Open Fields... to edit."
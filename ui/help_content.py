@@ -1,9 +1,11 @@
 # ui/help_content.py - Help dialog content and dialog
 
+from functools import lru_cache
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 
+@lru_cache(maxsize=None)
 def get_help_content(dialog_type: str) -> tuple[str, str]:
     """
     Returns (title, html_content) for help dialogs.
@@ -483,3 +485,19 @@ class HelpDialog(QtWidgets.QDialog):
         btn_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close)
         btn_box.rejected.connect(self.accept)
         layout.addWidget(btn_box)
+
+
+def show_help_dialog(parent, dialog_type: str) -> None:
+    """
+    Open the help dialog for dialog_type over parent. The HelpDialog is created once per parent
+    and reused (it is a child of parent, so it goes away with it).
+    """
+    name = f"help_{dialog_type}"
+    dlg = parent.findChild(HelpDialog, name, QtCore.Qt.FindDirectChildrenOnly)
+    if dlg is None:
+        title, content = get_help_content(dialog_type)
+        dlg = HelpDialog(title, content, parent)
+        dlg.setObjectName(name)
+    dlg.open()
+    dlg.raise_()
+    dlg.activateWindow()
@@ -1,4 +1,4 @@
-# ui/table_models.py - Table models and delegates for the instrument list
+# ui/table_models.py - Table models and delegates for the instrument list and dialog tables
 
 from datetime import datetime, date, timedelta
 
@@ -382,3 +382,67 @@ class InstrumentFilterProxyModel(QtCore.QSortFilterProxyModel):
                     return False
 
         return True
+
+
+class RecordTableModel(QtCore.QAbstractTableModel):
+    """
+    Read-only model over a list of row dicts (as returned by the repository). columns is a
+    sequence of (header, key) pairs; cells show row[key] or "" and are only read when painted.
+    UserRole on any cell gives the row's "id".
+    """
+
+    def __init__(self, columns, rows=None, parent=None):
+        super().__init__(parent)
+        self._headers = [h for h, _ in columns]
+        self._keys = [k for _, k in columns]
+        self.rows = rows or []
+
+    def rowCount(self, parent=None):
+        return len(self.rows)
+
+    def columnCount(self, parent=None):
+        return len(self._keys)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self.rows[index.row()].get(self._keys[index.column()]) or ""
+        if role == QtCore.Qt.UserRole:
+            return self.rows[index.row()].get("id")
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def row_at(self, row):
+        """Return the row dict at row, or None if out of range."""
+        if 0 <= row < len(self.rows):
+            return self.rows[row]
+        return None
+
+    def insert_row(self, position, row):
+        """Insert one row dict at position without resetting the model."""
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self.rows.insert(position, row)
+        self.endInsertRows()
+
+    def replace_row(self, position, row):
+        """Replace the row dict at position and repaint just that row."""
+        self.rows[position] = row
+        self.dataChanged.emit(self.index(position, 0), self.index(position, len(self._keys) - 1))
+
+    def remove_row(self, position):
+        """Remove the row at position without resetting the model."""
+        self.beginRemoveRows(QtCore.QModelIndex(), position, position)
+        del self.rows[position]
+        self.endRemoveRows()